@@ -24,6 +24,7 @@ import numpy as np
 from numpy.typing import NDArray
 from scipy.spatial import ConvexHull
 
+from weevil_profiling import count, instrument
 from regolith_contact_model import RegolithType, RegolithProperties, FootGeometry, RegolithContactModel
 
 
@@ -63,6 +64,7 @@ class Joint:
 class Leg:
     joints: List[Joint]
     links: List[NDArray[np.float64]]
+    @instrument()
     def forward_kinematics(self, q: NDArray[np.float64]) -> NDArray[np.float64]:
         T = np.eye(4, dtype=float)
         for joint, link, qi in zip(self.joints, self.links, q):
@@ -70,11 +72,15 @@ class Leg:
             T = T @ T_from_R_p(np.eye(3), link)
         return T[:3, 3].copy()
 
+@instrument()
 def workspace_cloud(leg: Leg, n_samples: int, rng: np.random.Generator) -> NDArray[np.float64]:
+    count("samples", n_samples)
     Q = np.column_stack([j.sample(n_samples, rng) for j in leg.joints])
     return np.array([leg.forward_kinematics(q) for q in Q], dtype=float)
 
+@instrument()
 def hull_volume(points: NDArray[np.float64]) -> float:
+    count("points", points.shape[0])
     if points.shape[0] < 10:
         return 0.0
     try:
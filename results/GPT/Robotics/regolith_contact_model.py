@@ -16,6 +16,11 @@ import math
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+from numpy.typing import NDArray
+
+from weevil_profiling import count, instrument
+
 
 class RegolithType(Enum):
     MARE = "mare"
@@ -103,6 +108,20 @@ class ContactForces:
     anchored: bool = False
 
 
+@dataclass(frozen=True)
+class ContactForcesBatch:
+    """Array-valued ContactForces: one entry per load case."""
+    max_shear_force: NDArray[np.float64]
+    normal_reaction: NDArray[np.float64]
+    penetration_depth: NDArray[np.float64]
+    friction_cone_angle: NDArray[np.float64]
+    max_shear_forward: NDArray[np.float64]
+    max_shear_lateral: NDArray[np.float64]
+    friction_cone_forward_angle: NDArray[np.float64]
+    friction_cone_lateral_angle: NDArray[np.float64]
+    anchored: NDArray[np.bool_]
+
+
 class RegolithContactModel:
     def __init__(self, regolith: RegolithProperties, foot: FootGeometry, gravity: float = 1.62):
         self.regolith = regolith
@@ -120,12 +139,14 @@ class RegolithContactModel:
         p_pa = self.bearing_capacity(depth) * 1000.0
         return float(p_pa * self.foot.area)
 
+    @instrument()
     def depth_from_normal_load(self, F_normal: float, max_iter: int = 30, tol: float = 1e-8) -> float:
         if F_normal <= 0.0:
             return 0.0
         # initial guess (k_phi dominated)
         z = (F_normal / (max(self.regolith.k_phi, 1e-12) * 1000.0 * max(self.foot.area, 1e-12))) ** (1.0 / max(self.regolith.n, 1e-6))
         z = max(0.0, z)
+        steps = 0
         for _ in range(max_iter):
             F_calc = self.normal_load_from_depth(z)
             resid = F_calc - F_normal
@@ -136,6 +157,8 @@ class RegolithContactModel:
             if abs(dF) < 1e-12:
                 break
             z = max(0.0, z - resid / dF)
+            steps += 1
+        count("newton_iterations", steps)
         return float(z)
 
     def mohr_coulomb_shear(self, normal_load: float, depth: float) -> float:
@@ -143,6 +166,7 @@ class RegolithContactModel:
         phi = math.radians(self.regolith.phi)
         return float(c_pa * self.foot.area + normal_load * math.tan(phi))
 
+    @instrument()
     def friction_cone_angle(self, normal_load: float) -> float:
         depth = self.depth_from_normal_load(normal_load)
         shear = self.mohr_coulomb_shear(normal_load, depth)
@@ -150,6 +174,7 @@ class RegolithContactModel:
             return 0.0
         return float(math.degrees(math.atan(shear / normal_load)))
 
+    @instrument()
     def compute_contact_forces(self, normal_load: float) -> ContactForces:
         depth = self.depth_from_normal_load(normal_load)
         shear = self.mohr_coulomb_shear(normal_load, depth)
@@ -166,6 +191,7 @@ class RegolithContactModel:
             anchored=False,
         )
 
+    @instrument()
     def compute_contact_forces_with_preload(
         self,
         body_normal_load: float,
@@ -213,3 +239,64 @@ class RegolithContactModel:
             friction_cone_lateral_angle=float(cone_lat),
             anchored=anchored,
         )
+
+    @instrument()
+    def depth_from_normal_load_batch(self, F_normal: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Vectorized sinkage: closed-form inverse of the Bekker relation.
+
+        Same root the Newton loop in ``depth_from_normal_load`` converges to.
+        """
+        F = np.maximum(np.asarray(F_normal, dtype=float), 0.0)
+        b = max(self.foot.radius, 1e-9)
+        k = (self.regolith.k_c / b + self.regolith.k_phi) * 1000.0 * max(self.foot.area, 1e-12)
+        return (F / k) ** (1.0 / max(self.regolith.n, 1e-6))
+
+    @instrument()
+    def compute_contact_forces_with_preload_batch(
+        self,
+        body_normal_load: NDArray[np.float64],
+        preload_normal: NDArray[np.float64] | float = 0.0,
+        twist_settle_gain: float = 1.0,
+        use_directional_cleats: bool = True,
+    ) -> ContactForcesBatch:
+        """Vectorized ``compute_contact_forces_with_preload`` over arrays of load cases.
+
+        Args:
+            body_normal_load: Per-case body normal load at the foot (N).
+            preload_normal: Per-case (or scalar) commanded normal preload (N).
+            twist_settle_gain: Multiplicative gain from twist-settle engagement.
+            use_directional_cleats: Whether to apply directional forward/lateral gains.
+        """
+        body = np.asarray(body_normal_load, dtype=float)
+        count("cases", body.size)
+        preload = np.maximum(np.broadcast_to(np.asarray(preload_normal, dtype=float), body.shape), 0.0)
+        normal = np.maximum(body + preload, 0.0)
+
+        depth = self.depth_from_normal_load_batch(normal)
+        c_pa = self.regolith.cohesion * 1000.0
+        shear = c_pa * self.foot.area + normal * math.tan(math.radians(self.regolith.phi))
+
+        anchored = preload >= max(0.0, float(self.foot.cleat_engage_threshold_preload))
+        settle_gain = np.where(anchored, max(0.1, float(twist_settle_gain)), 1.0)
+        if use_directional_cleats:
+            forward_gain = max(0.1, float(self.foot.cleat_gain_forward)) * settle_gain
+            lateral_gain = max(0.1, float(self.foot.cleat_gain_lateral)) * settle_gain
+        else:
+            forward_gain = lateral_gain = settle_gain
+
+        shear_fwd = shear * forward_gain
+        shear_lat = shear * lateral_gain
+        shear_iso = np.minimum(shear_fwd, shear_lat)
+        safe_normal = np.maximum(normal, 1e-12)
+
+        return ContactForcesBatch(
+            max_shear_force=shear_iso,
+            normal_reaction=normal,
+            penetration_depth=depth,
+            friction_cone_angle=np.degrees(np.arctan(shear_iso / safe_normal)),
+            max_shear_forward=shear_fwd,
+            max_shear_lateral=shear_lat,
+            friction_cone_forward_angle=np.degrees(np.arctan(shear_fwd / safe_normal)),
+            friction_cone_lateral_angle=np.degrees(np.arctan(shear_lat / safe_normal)),
+            anchored=anchored,
+        )
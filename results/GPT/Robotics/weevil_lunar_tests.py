@@ -10,6 +10,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Dict, List
 
+from weevil_profiling import count, instrument
 from regolith_contact_model import RegolithType, RegolithProperties, FootGeometry, RegolithContactModel
 
 
@@ -47,6 +48,7 @@ def test_sinkage_limit(model: RegolithContactModel, body_load: float, preload: f
     )
 
 
+@instrument()
 def test_directional_slope_margin(
     model: RegolithContactModel,
     body_load: float,
@@ -106,6 +108,7 @@ def test_directional_slope_margin(
     )
 
 
+@instrument()
 def slope_rescue_sweep(
     regolith: RegolithProperties,
     body_load: float,
@@ -117,6 +120,7 @@ def slope_rescue_sweep(
     preload_grid = [20, 35, 50, 70, 90, 120]
     gf_grid = [1.10, 1.20, 1.30, 1.40, 1.50, 1.60, 1.80, 2.00]
     gl_grid = [1.00, 1.10, 1.20, 1.30, 1.40, 1.60, 1.80, 2.00]
+    count("combos", len(radii) * len(preload_grid) * len(gf_grid) * len(gl_grid))
 
     best = None
     top_rows = []
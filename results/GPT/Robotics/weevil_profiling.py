@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+weevil_profiling.py — Opt-in hot-path instrumentation for the POC models
+
+Functions decorated with `@instrument()` record call count, cumulative and
+self time; `count(name, n)` records iteration counters (e.g. Newton steps in
+`depth_from_normal_load`) against the innermost active span.
+
+Instrumentation is armed at runtime with `enable()` (or `WEEVIL_PROFILE=1` in
+the environment), so it can be switched on after argument parsing and after the
+models are imported. Outside a session each instrumented call costs one wrapper
+frame and a flag check.
+
+Usage:
+    import weevil_profiling
+    weevil_profiling.enable()
+    with weevil_profiling.session() as prof:
+        slope_rescue_sweep(...)
+    prof.write_chrome_trace("trace.json")   # chrome://tracing or ui.perfetto.dev
+    print(prof.format_table())
+"""
+
+from __future__ import annotations
+
+import csv
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+ARMED = os.environ.get("WEEVIL_PROFILE", "") not in ("", "0")  # default for enable()
+
+_enabled = False
+_active: Optional["Profiler"] = None
+_lock = threading.Lock()
+
+
+@dataclass
+class SpanStats:
+    calls: int = 0
+    total_ns: int = 0
+    self_ns: int = 0
+    max_ns: int = 0
+
+
+@dataclass
+class Profiler:
+    max_events: int = 200_000  # trace events kept; aggregates are always complete
+    spans: Dict[str, SpanStats] = field(default_factory=dict)
+    counters: Dict[str, int] = field(default_factory=dict)
+    events: List[dict] = field(default_factory=list)
+    dropped_events: int = 0
+    t0_ns: int = field(default_factory=time.perf_counter_ns)
+    _stack: threading.local = field(default_factory=threading.local)
+
+    def _frames(self) -> list:
+        frames = getattr(self._stack, "frames", None)
+        if frames is None:
+            frames = self._stack.frames = []
+        return frames
+
+    def enter(self, name: str) -> None:
+        # frame = [name, start_ns, child_ns]
+        self._frames().append([name, time.perf_counter_ns(), 0])
+
+    def exit(self) -> None:
+        end = time.perf_counter_ns()
+        frames = self._frames()
+        name, start, child = frames.pop()
+        dur = end - start
+        if frames:
+            frames[-1][2] += dur
+        with _lock:
+            st = self.spans.get(name)
+            if st is None:
+                st = self.spans[name] = SpanStats()
+            st.calls += 1
+            st.total_ns += dur
+            st.self_ns += dur - child
+            st.max_ns = max(st.max_ns, dur)
+            if len(self.events) < self.max_events:
+                self.events.append(
+                    {
+                        "name": name,
+                        "cat": name.split(".", 1)[0],
+                        "ph": "X",
+                        "ts": (start - self.t0_ns) / 1000.0,
+                        "dur": dur / 1000.0,
+                        "pid": os.getpid(),
+                        "tid": threading.get_ident(),
+                    }
+                )
+            else:
+                self.dropped_events += 1
+
+    def count(self, name: str, n: int = 1) -> None:
+        frames = self._frames()
+        key = f"{frames[-1][0]}:{name}" if frames else name
+        with _lock:
+            self.counters[key] = self.counters.get(key, 0) + int(n)
+
+    # -- export ---------------------------------------------------------------
+
+    def summary_rows(self) -> List[dict]:
+        """Flat table sorted by self time: one row per span, counters as per-call means."""
+        rows = []
+        for name, st in sorted(self.spans.items(), key=lambda kv: kv[1].self_ns, reverse=True):
+            rows.append(
+                {
+                    "name": name,
+                    "calls": st.calls,
+                    "total_ms": round(st.total_ns / 1e6, 3),
+                    "self_ms": round(st.self_ns / 1e6, 3),
+                    "mean_us": round(st.total_ns / st.calls / 1e3, 3),
+                    "max_us": round(st.max_ns / 1e3, 3),
+                    "counters": "; ".join(
+                        f"{key.split(':', 1)[1]}={total} ({total / st.calls:.2f}/call)"
+                        for key, total in sorted(self.counters.items())
+                        if key.split(":", 1)[0] == name
+                    ),
+                }
+            )
+        return rows
+
+    def format_table(self) -> str:
+        rows = self.summary_rows()
+        lines = [f"{'span':<58} {'calls':>9} {'total ms':>11} {'self ms':>11} {'mean us':>10}  counters"]
+        for r in rows:
+            lines.append(
+                f"{r['name']:<58} {r['calls']:>9} {r['total_ms']:>11.3f} {r['self_ms']:>11.3f} "
+                f"{r['mean_us']:>10.3f}  {r['counters']}"
+            )
+        if self.dropped_events:
+            lines.append(f"({self.dropped_events} trace events dropped beyond max_events={self.max_events})")
+        return "\n".join(lines)
+
+    def write_summary_csv(self, path: str | Path) -> Path:
+        path = Path(path)
+        rows = self.summary_rows()
+        with path.open("w", newline="", encoding="utf-8") as f:
+            w = csv.DictWriter(f, fieldnames=["name", "calls", "total_ms", "self_ms", "mean_us", "max_us", "counters"])
+            w.writeheader()
+            w.writerows(rows)
+        return path
+
+    def write_chrome_trace(self, path: str | Path) -> Path:
+        """Chrome trace-event JSON (loads in chrome://tracing and ui.perfetto.dev)."""
+        path = Path(path)
+        payload = {
+            "traceEvents": self.events,
+            "displayTimeUnit": "ms",
+            "otherData": {"counters": self.counters, "dropped_events": self.dropped_events},
+        }
+        path.write_text(json.dumps(payload), encoding="utf-8")
+        return path
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def enable() -> None:
+    """Arm profiling; `start()`/`session()` raise until this is called (or WEEVIL_PROFILE=1)."""
+    global ARMED
+    ARMED = True
+
+
+def start(max_events: int = 200_000) -> Profiler:
+    global _enabled, _active
+    if not ARMED:
+        raise RuntimeError("profiling is not armed: call weevil_profiling.enable() or set WEEVIL_PROFILE=1")
+    _active = Profiler(max_events=max_events)
+    _enabled = True
+    return _active
+
+
+def stop() -> Optional[Profiler]:
+    global _enabled, _active
+    prof, _active, _enabled = _active, None, False
+    return prof
+
+
+@contextmanager
+def session(max_events: int = 200_000) -> Iterator[Profiler]:
+    prof = start(max_events=max_events)
+    try:
+        yield prof
+    finally:
+        stop()
+
+
+def count(name: str, n: int = 1) -> None:
+    """Add ``n`` to counter ``name`` on the innermost span (no-op when disabled)."""
+    if _enabled:
+        _active.count(name, n)  # type: ignore[union-attr]
+
+
+def instrument(name: Optional[str] = None) -> Callable[[F], F]:
+    """Decorator recording a span per call while profiling is enabled."""
+    def deco(fn: F) -> F:
+        label = name or f"{fn.__module__}.{fn.__qualname__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _enabled:
+                return fn(*args, **kwargs)
+            prof = _active
+            prof.enter(label)  # type: ignore[union-attr]
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                prof.exit()  # type: ignore[union-attr]
+
+        return wrapper  # type: ignore[return-value]
+    return deco
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Shared sha256 hashing for CAD export artifacts.
+
+Used by `generate_export_receipt.py` and `verification/check_export_receipt.py`.
+Files are read in CHUNK_BYTES pieces (never whole into memory) and cache
+misses are hashed concurrently in worker threads (hashlib releases the GIL
+on large updates). Digests persist in CACHE_PATH keyed on
+(path, size, mtime_ns, inode), so unchanged artifacts are not re-read. A file
+modified within RACY_WINDOW_NS of being hashed is not cached, since a
+same-size rewrite inside one mtime tick would otherwise go unnoticed.
+
+    python cad/scripts/artifact_hash.py cad/export/*.step
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable
+
+ROOT = Path(__file__).resolve().parents[2]
+CACHE_PATH = ROOT / "cad" / ".hash_cache.json"
+CHUNK_BYTES = 1 << 20
+RACY_WINDOW_NS = 2_000_000_000
+CACHE_VERSION = 1
+
+
+def sha256_file(path: Path, chunk_bytes: int = CHUNK_BYTES) -> str:
+    h = hashlib.sha256()
+    buf = bytearray(chunk_bytes)
+    view = memoryview(buf)
+    with path.open("rb", buffering=0) as f:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            h.update(view[:n])
+    return h.hexdigest()
+
+
+def _stat_key(st: os.stat_result) -> list[int]:
+    return [st.st_size, st.st_mtime_ns, st.st_ino]
+
+
+class HashCache:
+    """Persistent digest cache; entries are valid while (size, mtime_ns, inode) match."""
+
+    def __init__(self, path: Path | None = CACHE_PATH) -> None:
+        self.path = path
+        self.entries: dict[str, dict] = {}
+        self.dirty = False
+        if path is not None and path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = {}
+            if data.get("version") == CACHE_VERSION:
+                self.entries = data.get("entries", {})
+
+    def get(self, key: str, st: os.stat_result) -> str | None:
+        e = self.entries.get(key)
+        return e["sha256"] if e is not None and e["stat"] == _stat_key(st) else None
+
+    def put(self, key: str, st: os.stat_result, digest: str, hashed_at_ns: int) -> None:
+        if hashed_at_ns - st.st_mtime_ns < RACY_WINDOW_NS:
+            self.entries.pop(key, None)
+            return
+        self.entries[key] = {"stat": _stat_key(st), "sha256": digest}
+        self.dirty = True
+
+    def save(self) -> None:
+        if self.path is None or not self.dirty:
+            return
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"version": CACHE_VERSION, "entries": self.entries}, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, self.path)
+        self.dirty = False
+
+
+def hash_files(
+    paths: Iterable[Path],
+    cache: HashCache | None = None,
+    workers: int | None = None,
+) -> dict[Path, str]:
+    """sha256 per path (insertion order kept); misses are hashed in parallel."""
+    cache = cache if cache is not None else HashCache()
+    out: dict[Path, str | None] = {}
+    misses: list[tuple[Path, str, os.stat_result]] = []
+    for p in paths:
+        p = Path(p)
+        key = str(p.resolve())
+        st = p.stat()
+        digest = cache.get(key, st)
+        out[p] = digest
+        if digest is None:
+            misses.append((p, key, st))
+    if misses:
+        workers = workers or min(len(misses), os.cpu_count() or 1, 8)
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            digests = list(ex.map(lambda m: sha256_file(m[0]), misses))
+        now = time.time_ns()
+        for (p, key, st), digest in zip(misses, digests):
+            out[p] = digest
+            cache.put(key, st, digest, now)
+        cache.save()
+    return out  # type: ignore[return-value]
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="sha256 of files through the shared stat-keyed cache")
+    ap.add_argument("paths", nargs="+")
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--no-cache", action="store_true")
+    args = ap.parse_args()
+
+    cache = HashCache(None) if args.no_cache else HashCache()
+    for p, digest in hash_files([Path(p) for p in args.paths], cache, args.workers).items():
+        print(f"{digest}  {p}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
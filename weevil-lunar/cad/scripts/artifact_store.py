@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""Content-addressed local store for CAD export artifacts and receipts.
+
+Layout under STORE_DIR (untracked):
+- objects/<2 hex>/<62 hex>: one read-only blob per sha256 (STEP, URDF, FCStd,
+  receipts ...), written once via temp file + rename
+- refs/<interface_version>: sha256 of that version's export receipt
+
+A receipt references its artifacts by (path, sha256), so `snapshot()` stores
+the receipt and every declared artifact and points the version's ref at it.
+Retrieval hard-links blobs into place (copy when linking is not possible), so
+checkouts of several versions share one copy of unchanged artifacts. Files in
+the git working tree are copied instead (`link=False`); an in-place edit of a
+hard-linked file would rewrite the blob.
+`diff()` compares two versions from their receipts alone; `gc()` drops blobs no
+ref reaches.
+
+    python cad/scripts/artifact_store.py snapshot cad/exports/latest/export_receipt_v0.4.json
+    python cad/scripts/artifact_store.py ls
+    python cad/scripts/artifact_store.py diff v0.3 v0.4
+    python cad/scripts/artifact_store.py checkout v0.4 --dest /tmp/weevil_v0.4
+    python cad/scripts/artifact_store.py gc --dry-run
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import stat
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from artifact_hash import hash_files, sha256_file
+
+ROOT = Path(__file__).resolve().parents[2]
+STORE_DIR = ROOT / "cad" / ".artifact_store"
+RECEIPT_FIELDS = ("git_commit_hash", "yaml_version", "params_hash_sha256", "freecad_version")
+
+
+@dataclass
+class ReceiptDiff:
+    old: str
+    new: str
+    added: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    fields: dict[str, tuple[str, str]] = field(default_factory=dict)
+
+    def lines(self) -> list[str]:
+        out = [f"{self.old} -> {self.new}"]
+        out += [f"  {k}: {a} -> {b}" for k, (a, b) in self.fields.items()]
+        out += [f"  + {p}" for p in self.added]
+        out += [f"  - {p}" for p in self.removed]
+        out += [f"  ~ {p}" for p in self.changed]
+        out.append(f"  ({len(self.unchanged)} unchanged)")
+        return out
+
+
+class ArtifactStore:
+    def __init__(self, root: Path = STORE_DIR) -> None:
+        self.root = root
+        self.objects = root / "objects"
+        self.refs = root / "refs"
+
+    def object_path(self, digest: str) -> Path:
+        return self.objects / digest[:2] / digest[2:]
+
+    def has(self, digest: str) -> bool:
+        return self.object_path(digest).exists()
+
+    def put(self, path: Path, digest: str | None = None) -> str:
+        """Store ``path`` once; return its sha256."""
+        digest = digest or hash_files([path])[path]
+        dest = self.object_path(digest)
+        if dest.exists():
+            return digest
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=dest.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as out, path.open("rb") as src:
+                shutil.copyfileobj(src, out, 1 << 20)
+            if sha256_file(Path(tmp)) != digest:
+                raise ValueError(f"{path} changed while being stored")
+            os.chmod(tmp, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            os.replace(tmp, dest)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return digest
+
+    def materialize(self, digest: str, dest: Path, link: bool = True) -> None:
+        """Place blob ``digest`` at ``dest`` (hard link, else copy)."""
+        src = self.object_path(digest)
+        if not src.exists():
+            raise KeyError(f"blob {digest} not in store")
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dest.with_name(f".{dest.name}.tmp")
+        tmp.unlink(missing_ok=True)
+        try:
+            if not link:
+                raise OSError
+            os.link(src, tmp)
+        except OSError:
+            shutil.copyfile(src, tmp)
+        os.replace(tmp, dest)
+
+    def set_ref(self, name: str, digest: str) -> None:
+        self.refs.mkdir(parents=True, exist_ok=True)
+        (self.refs / name).write_text(digest + "\n", encoding="ascii")
+
+    def ref(self, name: str) -> str:
+        path = self.refs / name
+        if not path.exists():
+            raise KeyError(f"no stored receipt for {name!r} (have: {', '.join(self.ref_names()) or 'none'})")
+        return path.read_text(encoding="ascii").strip()
+
+    def ref_names(self) -> list[str]:
+        return sorted(p.name for p in self.refs.glob("*")) if self.refs.exists() else []
+
+    def receipt(self, name: str) -> dict:
+        return json.loads(self.object_path(self.ref(name)).read_text(encoding="utf-8"))
+
+    def snapshot(self, receipt_path: Path, base: Path = ROOT) -> str:
+        """Store a receipt and its declared artifacts; ref its interface_version. Returns the receipt digest."""
+        data = json.loads(receipt_path.read_text(encoding="utf-8"))
+        artifacts = [(base / a["path"], a["sha256"]) for a in data["exported_files"]]
+        current = hash_files([p for p, _ in artifacts])
+        stale = [p.relative_to(base).as_posix() for p, digest in artifacts if current[p] != digest]
+        if stale:
+            raise ValueError(f"artifacts differ from {receipt_path.name}: {stale}")
+        for p, digest in artifacts:
+            self.put(p, digest)
+        digest = self.put(receipt_path)
+        self.set_ref(data["interface_version"], digest)
+        return digest
+
+    def checkout(self, name: str, dest: Path, link: bool = True) -> int:
+        """Materialize a version's artifacts under ``dest`` at their receipt paths."""
+        data = self.receipt(name)
+        for a in data["exported_files"]:
+            self.materialize(a["sha256"], dest / a["path"], link)
+        return len(data["exported_files"])
+
+    def diff(self, old: str, new: str) -> ReceiptDiff:
+        a, b = self.receipt(old), self.receipt(new)
+        fa = {x["path"]: x["sha256"] for x in a["exported_files"]}
+        fb = {x["path"]: x["sha256"] for x in b["exported_files"]}
+        d = ReceiptDiff(old, new)
+        d.added = sorted(fb.keys() - fa.keys())
+        d.removed = sorted(fa.keys() - fb.keys())
+        for p in sorted(fa.keys() & fb.keys()):
+            (d.changed if fa[p] != fb[p] else d.unchanged).append(p)
+        d.fields = {k: (str(a.get(k)), str(b.get(k))) for k in RECEIPT_FIELDS if a.get(k) != b.get(k)}
+        return d
+
+    def reachable(self) -> set[str]:
+        keep = set()
+        for name in self.ref_names():
+            digest = self.ref(name)
+            keep.add(digest)
+            keep.update(a["sha256"] for a in self.receipt(name)["exported_files"])
+        return keep
+
+    def gc(self, dry_run: bool = False) -> tuple[int, int]:
+        """Delete unreachable blobs and stale temp files; returns (files, bytes)."""
+        keep = self.reachable()
+        count = size = 0
+        for p in sorted(self.objects.glob("*/*")):
+            if p.name.startswith(".tmp-") or p.parent.name + p.name not in keep:
+                count += 1
+                size += p.stat().st_size
+                if not dry_run:
+                    p.unlink()
+        return count, size
+
+    def verify(self) -> list[str]:
+        """Blobs whose content no longer matches their name."""
+        return [
+            p.parent.name + p.name
+            for p in sorted(self.objects.glob("*/*"))
+            if not p.name.startswith(".tmp-") and sha256_file(p) != p.parent.name + p.name
+        ]
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Content-addressed CAD artifact store")
+    ap.add_argument("--store", default=str(STORE_DIR))
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("snapshot", help="store a receipt and its artifacts")
+    p.add_argument("receipt")
+    p = sub.add_parser("put", help="store files, print their digests")
+    p.add_argument("paths", nargs="+")
+    p = sub.add_parser("get", help="materialize one blob")
+    p.add_argument("digest")
+    p.add_argument("dest")
+    p.add_argument("--copy", action="store_true")
+    p = sub.add_parser("checkout", help="materialize a version's artifacts")
+    p.add_argument("version")
+    p.add_argument("--dest", required=True)
+    p.add_argument("--copy", action="store_true")
+    p = sub.add_parser("diff", help="compare two stored receipt versions")
+    p.add_argument("old")
+    p.add_argument("new")
+    sub.add_parser("ls", help="list stored versions")
+    p = sub.add_parser("gc", help="delete blobs no stored version references")
+    p.add_argument("--dry-run", action="store_true")
+    sub.add_parser("verify", help="re-hash every blob")
+    args = ap.parse_args()
+
+    store = ArtifactStore(Path(args.store))
+    if args.cmd == "snapshot":
+        data = json.loads(Path(args.receipt).read_text(encoding="utf-8"))
+        print(f"{data['interface_version']} -> {store.snapshot(Path(args.receipt))}")
+    elif args.cmd == "put":
+        for path in args.paths:
+            print(f"{store.put(Path(path))}  {path}")
+    elif args.cmd == "get":
+        store.materialize(args.digest, Path(args.dest), link=not args.copy)
+    elif args.cmd == "checkout":
+        n = store.checkout(args.version, Path(args.dest), link=not args.copy)
+        print(f"Checked out {n} artifacts of {args.version} under {args.dest}")
+    elif args.cmd == "diff":
+        print("\n".join(store.diff(args.old, args.new).lines()))
+    elif args.cmd == "ls":
+        for name in store.ref_names():
+            r = store.receipt(name)
+            print(f"{name}: {len(r['exported_files'])} artifacts, {r.get('total_artifact_size_bytes', '?')} bytes, "
+                  f"{r['timestamp_utc']}, commit {r['git_commit_hash'][:10]}")
+    elif args.cmd == "gc":
+        count, size = store.gc(args.dry_run)
+        print(f"{'Would remove' if args.dry_run else 'Removed'} {count} blobs ({size} bytes)")
+    elif args.cmd == "verify":
+        bad = store.verify()
+        for digest in bad:
+            print(f"corrupt blob {digest}")
+        return 1 if bad else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,17 +1,23 @@
 #!/usr/bin/env python3
-"""Generate deterministic CAD export receipt for interface freeze handoff."""
+"""Generate deterministic CAD export receipt for interface freeze handoff.
+
+The receipt and every artifact it declares are snapshotted into the
+content-addressed store (`artifact_store.py`); `export_receipt_latest.json`
+is materialized from the stored receipt blob rather than copied.
+"""
 
 from __future__ import annotations
 
 import argparse
 import datetime as dt
-import hashlib
 import json
 import re
-import shutil
 import subprocess
 from pathlib import Path
 
+from artifact_hash import hash_files
+from artifact_store import ArtifactStore
+
 ROOT = Path(__file__).resolve().parents[2]
 PARAMS_PATH = ROOT / "cad" / "weevil_leg_params.yaml"
 EXPORT_SOURCE_DIR = ROOT / "cad" / "export"
@@ -26,14 +32,6 @@ FORMAT_MAP = {
 }
 
 
-def sha256(path: Path) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(65536), b""):
-            h.update(chunk)
-    return h.hexdigest()
-
-
 def git_commit_hash() -> str:
     val = subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=ROOT).decode().strip()
     if not re.fullmatch(r"[0-9a-f]{40}", val):
@@ -51,19 +49,16 @@ def parse_yaml_version() -> str:
 
 
 def collect_artifacts() -> list[dict[str, str]]:
-    artifacts: list[dict[str, str]] = []
-    for p in sorted(EXPORT_SOURCE_DIR.glob("**/*")):
-        if not p.is_file():
-            continue
-        if p.suffix.lower() not in FORMAT_MAP:
-            continue
-        rel = p.relative_to(ROOT).as_posix()
-        artifacts.append({
-            "path": rel,
+    paths = [p for p in sorted(EXPORT_SOURCE_DIR.glob("**/*")) if p.is_file() and p.suffix.lower() in FORMAT_MAP]
+    digests = hash_files(paths)
+    return [
+        {
+            "path": p.relative_to(ROOT).as_posix(),
             "format": FORMAT_MAP[p.suffix.lower()],
-            "sha256": sha256(p),
-        })
-    return artifacts
+            "sha256": digests[p],
+        }
+        for p in paths
+    ]
 
 
 def main() -> int:
@@ -85,7 +80,7 @@ def main() -> int:
         "yaml_version": parse_yaml_version(),
         "interface_version": args.interface_version,
         "param_source": "cad/weevil_leg_params.yaml",
-        "params_hash_sha256": sha256(PARAMS_PATH),
+        "params_hash_sha256": hash_files([PARAMS_PATH])[PARAMS_PATH],
         "exporter_tool": "cad/scripts/generate_export_receipt.py + Phase2_Export.FCMacro",
         "freecad_version": args.freecad_version,
         "exported_files": artifacts,
@@ -99,10 +94,13 @@ def main() -> int:
     latest = EXPORT_RECEIPT_DIR / "export_receipt_latest.json"
 
     versioned.write_text(json.dumps(receipt, indent=2) + "\n", encoding="utf-8")
-    shutil.copy2(versioned, latest)
+    store = ArtifactStore()
+    # Copy, never hard-link: an in-place edit of the tracked file would rewrite the stored blob.
+    store.materialize(store.snapshot(versioned), latest, link=False)
 
     print(f"Wrote {versioned}")
     print(f"Updated {latest}")
+    print(f"Stored {len(artifacts)} artifacts + receipt under {store.root} (ref {args.interface_version})")
     return 0
 
 
@@ -1,59 +1,496 @@
-"""Very small YAML subset parser for project parameter files.
-Supports:
-- nested mappings by indentation (2 spaces)
-- scalars: str, int, float, bool
-- inline lists: [a, b]
-- comments with '#'
+"""Small YAML subset parser for project parameter files.
+
+Supports, in one pass over the lines:
+- nested block mappings and block sequences by indentation (`- item`,
+  `- key: value` compact mappings, `key:` followed by a sequence at the same
+  indent)
+- flow lists `[a, b]` and flow mappings `{ key: value, other: [a, b] }`
+- scalars: str (plain, "double" with escapes, 'single'), int, float,
+  true/false, null/~
+- `#` comments (full-line, or after whitespace outside quotes)
+- multiple documents separated by `---` / ended by `...`
+
+Not supported (rejected with a location): anchors/aliases, tags, block
+scalars (`|`, `>`), multi-line flow collections, directives. Duplicate keys
+are an error. Plain scalars resolve like the YAML 1.2 core schema
+(``1e3`` is a float).
+
+Errors are `YamlError` (a ValueError) carrying source, line and column.
+Parsed trees are cached by content digest (`load_yaml_text`,
+`load_yaml_file`); callers get a private copy. `python simple_yaml.py --bench`
+compares against PyYAML's pure-Python and C loaders when PyYAML is installed.
 """
 
 from __future__ import annotations
 
-import ast
+import hashlib
+import json
+import re
+from collections import OrderedDict
+from pathlib import Path
 from typing import Any
 
+CACHE_SIZE = 256
 
-def _parse_scalar(text: str) -> Any:
-    t = text.strip()
-    if t in {"true", "True"}:
-        return True
-    if t in {"false", "False"}:
-        return False
-    if t.startswith("[") and t.endswith("]"):
-        inner = t[1:-1].strip()
-        if not inner:
-            return []
-        return [_parse_scalar(p.strip()) for p in inner.split(",")]
-    if (t.startswith('"') and t.endswith('"')) or (t.startswith("'") and t.endswith("'")):
-        return t[1:-1]
-    try:
-        return ast.literal_eval(t)
-    except Exception:
-        return t
+_BOOL_NULL = {
+    "true": True, "True": True, "TRUE": True,
+    "false": False, "False": False, "FALSE": False,
+    "null": None, "Null": None, "NULL": None, "~": None,
+}
+_INT = re.compile(r"[-+]?[0-9][0-9_]*\Z")  # YAML 1.2 core: leading zeros stay decimal
+_INT_PREFIXED = re.compile(r"0x[0-9a-fA-F]+\Z|0o[0-7]+\Z")
+_FLOAT = re.compile(r"[-+]?(?:\.[0-9]+|[0-9][0-9_]*(?:\.[0-9_]*)?)(?:[eE][-+]?[0-9]+)?\Z")
+_SPECIAL_FLOAT = {
+    ".inf": float("inf"), ".Inf": float("inf"), ".INF": float("inf"),
+    "+.inf": float("inf"), "-.inf": float("-inf"), "-.Inf": float("-inf"), "-.INF": float("-inf"),
+    ".nan": float("nan"), ".NaN": float("nan"), ".NAN": float("nan"),
+}
+_SCALAR_START = " \t[{,:-"
+_NUMBER_START = frozenset("0123456789+-.")
+_NON_PLAIN_START = frozenset("[{\"'&*!|>")
+_MAPPING_COLON = re.compile(r":(?:[ \t]|\Z)")
+_PLAIN_KEY = re.compile(r"([^\s\"'\[\]{}#&*!|>%@`,-][^:]*?|-[^\s:][^:]*?)[ \t]*:(?:[ \t]+|\Z)")
+
+
+class YamlError(ValueError):
+    def __init__(self, message: str, line: int, column: int, source: str = "<string>") -> None:
+        super().__init__(f"{source}:{line}:{column}: {message}")
+        self.message = message
+        self.line = line
+        self.column = column
+        self.source = source
+
+
+def _plain(text: str) -> Any:
+    if text in _BOOL_NULL:
+        return _BOOL_NULL[text]
+    if text[0] in _NUMBER_START:
+        if _INT.match(text):
+            return int(text.replace("_", ""))
+        if _FLOAT.match(text):
+            return float(text.replace("_", ""))
+        if text in _SPECIAL_FLOAT:
+            return _SPECIAL_FLOAT[text]
+        if _INT_PREFIXED.match(text):
+            return int(text, 0)
+    return text
+
+
+class _Line:
+    __slots__ = ("no", "indent", "text")
+
+    def __init__(self, no: int, indent: int, text: str) -> None:
+        self.no = no
+        self.indent = indent
+        self.text = text
+
+
+class _Parser:
+    def __init__(self, text: str, source: str) -> None:
+        self.text = text
+        self.source = source
 
+    def error(self, message: str, line: int, column: int) -> YamlError:
+        return YamlError(message, line, column, self.source)
 
-def load_yaml_text(text: str) -> dict[str, Any]:
-    root: dict[str, Any] = {}
-    stack: list[tuple[int, dict[str, Any]]] = [(-1, root)]
+    # -- line scanning ---------------------------------------------------
 
-    for raw in text.splitlines():
-        line = raw.split("#", 1)[0].rstrip()
-        if not line.strip():
-            continue
+    def _strip_comment(self, raw: str, no: int) -> str:
+        """Drop a trailing comment; quotes only open where a scalar can start."""
+        if "#" not in raw:
+            return raw.rstrip()
+        quote = ""
+        prev = " "
+        i = 0
+        n = len(raw)
+        while i < n:
+            ch = raw[i]
+            if quote:
+                if ch == "\\" and quote == '"':
+                    i += 2
+                    continue
+                if ch == quote:
+                    if quote == "'" and i + 1 < n and raw[i + 1] == "'":
+                        i += 2
+                        continue
+                    quote = ""
+            elif ch in "\"'" and prev in _SCALAR_START:
+                quote = ch
+            elif ch == "#" and prev in " \t":
+                return raw[:i].rstrip()
+            prev = ch
+            i += 1
+        if quote:
+            raise self.error(f"unterminated {quote}-quoted scalar", no, n)
+        return raw.rstrip()
 
-        indent = len(line) - len(line.lstrip(" "))
-        key, sep, val = line.strip().partition(":")
-        if sep != ":":
-            continue
+    def documents(self) -> list[list[_Line]]:
+        docs: list[list[_Line]] = []
+        ended = True  # content after '...' (or at the top) opens a new document
+        for no, raw in enumerate(self.text.splitlines(), 1):
+            c = raw[:1]
+            if c == "-" and raw.startswith("---") and (len(raw) == 3 or raw[3] in " \t#"):
+                if self._strip_comment(raw[3:], no).strip():
+                    raise self.error("content after '---' is not supported", no, 5)
+                docs.append([])
+                ended = False
+                continue
+            if c == "." and raw.startswith("...") and not self._strip_comment(raw[3:], no).strip():
+                ended = True
+                continue
+            if c == "%":
+                raise self.error("directives are not supported", no, 1)
+            line = self._strip_comment(raw, no)
+            body = line.lstrip(" ")
+            if not body:
+                continue
+            if body[0] == "\t":
+                raise self.error("tab in indentation", no, len(line) - len(body) + 1)
+            if ended:
+                docs.append([])
+                ended = False
+            docs[-1].append(_Line(no, len(line) - len(body), body))
+        return docs or [[]]
 
-        while stack and indent <= stack[-1][0]:
-            stack.pop()
-        parent = stack[-1][1]
+    # -- scalars ---------------------------------------------------------
 
-        if val.strip() == "":
-            child: dict[str, Any] = {}
-            parent[key] = child
-            stack.append((indent, child))
+    def scalar(self, text: str, no: int, col: int) -> Any:
+        """Value text (already stripped of comments) starting at 0-based ``col``."""
+        c = text[0]
+        if c not in _NON_PLAIN_START:
+            if ":" in text:
+                m = _MAPPING_COLON.search(text)
+                if m:
+                    raise self.error("mapping values are not allowed in a plain scalar", no, col + m.start() + 1)
+            return _plain(text)
+        if c == "[" or c == "{":
+            value, end = self._flow(text, 0, no, col)
+            if text[end:].strip():
+                raise self.error("unexpected content after flow collection", no, col + end + 1)
+            return value
+        if c == '"' or c == "'":
+            value, end = self._quoted(text, 0, no, col)
+            if text[end:].strip():
+                raise self.error("unexpected content after quoted scalar", no, col + end + 1)
+            return value
+        if c in "&*!":
+            raise self.error("anchors, aliases and tags are not supported", no, col + 1)
+        raise self.error("block scalars are not supported", no, col + 1)
+
+    def _quoted(self, text: str, i: int, no: int, col: int) -> tuple[str, int]:
+        q = text[i]
+        if q == '"':
+            j = text.find('"', i + 1)
+            if j > 0 and text.find("\\", i + 1, j) < 0:
+                return text[i + 1: j], j + 1
+        j = i + 1
+        n = len(text)
+        while j < n:
+            ch = text[j]
+            if q == '"' and ch == "\\":
+                j += 2
+                continue
+            if ch == q:
+                if q == "'" and j + 1 < n and text[j + 1] == "'":
+                    j += 2
+                    continue
+                body = text[i + 1: j]
+                if q == "'":
+                    return body.replace("''", "'"), j + 1
+                try:
+                    return json.loads('"' + body.replace("\t", "\\t") + '"'), j + 1
+                except ValueError as exc:
+                    raise self.error(f"bad escape in double-quoted scalar ({exc.msg})", no, col + i + 1) from None
+            j += 1
+        raise self.error(f"unterminated {q}-quoted scalar", no, col + i + 1)
+
+    def _flow(self, text: str, i: int, no: int, col: int) -> tuple[Any, int]:
+        """Parse the flow collection opening at text[i]; return (value, index past it)."""
+        close = "]" if text[i] == "[" else "}"
+        is_map = close == "}"
+        out: Any = {} if is_map else []
+        j = i + 1
+        n = len(text)
+        while True:
+            while j < n and text[j] in " \t":
+                j += 1
+            if j >= n:
+                raise self.error(f"unterminated flow collection (missing '{close}')", no, col + i + 1)
+            if text[j] == close:
+                return out, j + 1
+            if is_map:
+                key, j = self._flow_item(text, j, no, col, stop=":,}")
+                if j >= n or text[j] != ":":
+                    raise self.error("flow mapping entry without ':'", no, col + j + 1)
+                if not isinstance(key, str):
+                    key = str(key)
+                if key in out:
+                    raise self.error(f"duplicate key {key!r}", no, col + j)
+                j += 1
+                while j < n and text[j] in " \t":
+                    j += 1
+                value: Any = None
+                if j < n and text[j] not in ",}":
+                    value, j = self._flow_item(text, j, no, col, stop=",}")
+                out[key] = value
+            else:
+                value, j = self._flow_item(text, j, no, col, stop=",]")
+                out.append(value)
+            while j < n and text[j] in " \t":
+                j += 1
+            if j < n and text[j] == ",":
+                j += 1
+            elif j < n and text[j] != close:
+                raise self.error(f"expected ',' or '{close}'", no, col + j + 1)
+
+    def _flow_item(self, text: str, j: int, no: int, col: int, stop: str) -> tuple[Any, int]:
+        c = text[j]
+        if c in "[{":
+            return self._flow(text, j, no, col)
+        if c in "\"'":
+            value, end = self._quoted(text, j, no, col)
+            while end < len(text) and text[end] in " \t":
+                end += 1
+            return value, end
+        k = j
+        n = len(text)
+        while k < n and text[k] not in stop:
+            if text[k] == ":" and ":" in stop and k + 1 < n and text[k + 1] not in " \t,}":
+                k += 1  # ':' inside a plain key (e.g. a URL) does not end it
+                continue
+            k += 1
+        token = text[j:k].strip()
+        if not token:
+            raise self.error("empty flow entry", no, col + j + 1)
+        if token[0] in "&*!|>":
+            raise self.error("anchors, aliases, tags and block scalars are not supported", no, col + j + 1)
+        if ":" not in stop and ":" in token:
+            m = _MAPPING_COLON.search(token)
+            if m:
+                raise self.error("mapping values are not allowed in a plain scalar", no, col + j + m.start() + 1)
+        return _plain(token), k
+
+    # -- block structure -------------------------------------------------
+
+    def _split_key(self, text: str, no: int, col: int) -> tuple[str, str, int] | None:
+        """(key, value text, value column) for ``key: value`` / ``key:``; None if no mapping colon."""
+        if text[0] in "\"'":
+            key, end = self._quoted(text, 0, no, col)
+            rest = text[end:].lstrip(" ")
+            if not rest.startswith(":"):
+                return None
+            after = text[end:].index(":") + end + 1
+        else:
+            m = _PLAIN_KEY.match(text)
+            if m is not None:
+                return m.group(1), text[m.end():], col + m.end()
+            k = text.find(":")
+            while k >= 0 and k + 1 < len(text) and text[k + 1] not in " \t":
+                k = text.find(":", k + 1)
+            if k < 0:
+                return None
+            if text[0] in "[{":
+                return None
+            key = text[:k].rstrip()
+            after = k + 1
+        value = text[after:].lstrip(" \t")
+        return key, value, col + len(text) - len(value)
+
+    def parse(self, lines: list[_Line]) -> Any:
+        if not lines:
+            return None
+        first = lines[0]
+        if first.text.startswith("- ") or first.text == "-":
+            root: Any = []
+        elif self._split_key(first.text, first.no, first.indent) is None:
+            if len(lines) > 1:
+                raise self.error("expected a mapping or sequence", lines[1].no, lines[1].indent + 1)
+            return self.scalar(first.text, first.no, first.indent)
         else:
-            parent[key] = _parse_scalar(val.strip())
+            root = {}
+        # stack entries: [indent, container]; pending: (container, key or index, indent, line no)
+        stack: list[tuple[int, Any]] = [(first.indent, root)]
+        pending: tuple[Any, Any, int, int] | None = None
+
+        for ln in lines:
+            indent, text, no = ln.indent, ln.text, ln.no
+            is_item = text[0] == "-" and (len(text) == 1 or text[1] == " ")
+            if pending is not None:
+                container, slot, p_indent, _ = pending
+                pending = None
+                if indent > p_indent or (is_item and indent == p_indent and isinstance(container, dict)):
+                    child: Any = [] if is_item else {}
+                    container[slot] = child
+                    stack.append((indent, child))
+                # else: the value stays None
+            while True:
+                top_indent, top = stack[-1]
+                if indent < top_indent or (indent == top_indent and isinstance(top, list) and not is_item and len(stack) > 1):
+                    stack.pop()
+                    if not stack:
+                        raise self.error("unindent below the document's first line", no, indent + 1)
+                    continue
+                if indent > top_indent:
+                    raise self.error("unexpected indentation", no, indent + 1)
+                break
+            if is_item or top.__class__ is not dict:
+                pending = self._entry(stack, indent, text, no)
+            else:
+                pending = self._pair(top, indent, text, no)
+        return root
+
+    def _entry(self, stack: list[tuple[int, Any]], col: int, text: str, no: int) -> tuple[Any, Any, int, int] | None:
+        """Add one line (or compact fragment) at ``col`` to the container on top of ``stack``."""
+        top = stack[-1][1]
+        if isinstance(top, list):
+            if not (text.startswith("- ") or text == "-"):
+                raise self.error("expected '- ' sequence item", no, col + 1)
+            rest = text[1:].lstrip(" ")
+            if not rest:
+                top.append(None)
+                return (top, len(top) - 1, col, no)
+            sub = col + len(text) - len(rest)
+            if rest.startswith("- ") or rest == "-":
+                child: Any = []
+            elif self._split_key(rest, no, sub) is not None:
+                child = {}
+            else:
+                top.append(self.scalar(rest, no, sub))
+                return None
+            top.append(child)
+            stack.append((sub, child))
+            return self._entry(stack, sub, rest, no)
+
+        if text.startswith("- ") or text == "-":
+            raise self.error("sequence item where a mapping key was expected", no, col + 1)
+        return self._pair(top, col, text, no)
+
+    def _pair(self, top: dict[str, Any], col: int, text: str, no: int) -> tuple[Any, Any, int, int] | None:
+        split = self._split_key(text, no, col)
+        if split is None:
+            raise self.error("expected 'key: value'", no, col + 1)
+        key, value, vcol = split
+        if not key:
+            raise self.error("empty mapping key", no, col + 1)
+        if key in top:
+            raise self.error(f"duplicate key {key!r}", no, col + 1)
+        if not value:
+            top[key] = None
+            return (top, key, col, no)
+        top[key] = self.scalar(value, no, vcol)
+        return None
+
+
+def _copy(tree: Any) -> Any:
+    if isinstance(tree, dict):
+        return {k: _copy(v) for k, v in tree.items()}
+    if isinstance(tree, list):
+        return [_copy(v) for v in tree]
+    return tree
+
+
+_cache: OrderedDict[bytes, list[Any]] = OrderedDict()
+
+
+def _cached_documents(digest: bytes, text: str, source: str) -> list[Any]:
+    docs = _cache.get(digest)
+    if docs is None:
+        p = _Parser(text, source)
+        docs = [p.parse(lines) for lines in p.documents()]
+        _cache[digest] = docs
+        if len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    else:
+        _cache.move_to_end(digest)
+    return docs
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def load_all_yaml_text(text: str, source: str = "<string>") -> list[Any]:
+    return _copy(_cached_documents(_digest(text.encode("utf-8")), text, source))
+
+
+def load_yaml_text(text: str, source: str = "<string>") -> dict[str, Any]:
+    """The single document in ``text`` ({} when empty)."""
+    docs = _cached_documents(_digest(text.encode("utf-8")), text, source)
+    if len(docs) > 1:
+        raise YamlError(f"expected one document, found {len(docs)} (use load_all_yaml_text)", 1, 1, source)
+    return {} if docs[0] is None else _copy(docs[0])
+
+
+def load_yaml_file(path: Path | str) -> dict[str, Any]:
+    """`load_yaml_text` of a file, cache keyed on the file's content hash."""
+    path = Path(path)
+    data = path.read_bytes()
+    docs = _cached_documents(_digest(data), data.decode("utf-8"), str(path))
+    if len(docs) > 1:
+        raise YamlError(f"expected one document, found {len(docs)}", 1, 1, str(path))
+    return {} if docs[0] is None else _copy(docs[0])
+
+
+def clear_cache() -> None:
+    _cache.clear()
+
+
+def _bench(paths: list[Path], min_time: float = 0.2) -> int:
+    import time
+
+    try:
+        import yaml  # type: ignore
+    except Exception:  # pragma: no cover
+        yaml = None
+
+    def timed(fn) -> float:
+        fn()
+        loops, elapsed = 1, 0.0
+        while True:
+            t0 = time.perf_counter()
+            for _ in range(loops):
+                fn()
+            elapsed = time.perf_counter() - t0
+            if elapsed >= min_time:
+                return elapsed / loops
+            loops *= 2
+
+    for path in paths:
+        text = path.read_text(encoding="utf-8")
+
+        def parse_uncached() -> Any:
+            p = _Parser(text, str(path))
+            return [p.parse(lines) for lines in p.documents()]
+
+        loaders = {
+            "simple_yaml (parse)": parse_uncached,
+            "simple_yaml (cached)": lambda: load_yaml_text(text),
+        }
+        if yaml is not None:
+            loaders["PyYAML SafeLoader"] = lambda: yaml.load(text, Loader=yaml.SafeLoader)
+            if getattr(yaml, "CSafeLoader", None) is not None:
+                loaders["PyYAML CSafeLoader"] = lambda: yaml.load(text, Loader=yaml.CSafeLoader)
+        print(f"{path} ({len(text)} bytes)")
+        for name, fn in loaders.items():
+            print(f"  {name:22s} {timed(fn) * 1e6:10.1f} us")
+        if yaml is not None:
+            same = load_yaml_text(text) == (yaml.safe_load(text) or {})
+            print(f"  matches PyYAML: {same}")
+    return 0
+
+
+if __name__ == "__main__":
+    import argparse
 
-    return root
+    ap = argparse.ArgumentParser(description="Parse YAML-subset files; --bench compares against PyYAML")
+    ap.add_argument("paths", nargs="*")
+    ap.add_argument("--bench", action="store_true")
+    args = ap.parse_args()
+    root = Path(__file__).resolve().parents[2]
+    files = [Path(p) for p in args.paths] or sorted(
+        p for p in root.rglob("*.yaml") if ".cache" not in p.parts and "results" not in p.parts
+    )
+    if args.bench:
+        raise SystemExit(_bench(files))
+    for f in files:
+        print(f"{f}: {json.dumps(load_yaml_file(f), sort_keys=True)[:200]}")
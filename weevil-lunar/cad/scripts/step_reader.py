@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""Streaming ISO-10303-21 (STEP AP203/AP214/AP242) reader for headless export checks.
+
+One pass over the file in CHUNK_CHARS pieces, without building an entity
+graph. Collected:
+- header: schema, originating system, timestamp
+- entity counts per type (complex entities as their `+`-joined part names)
+- length units (SI prefix + unit, or conversion-based names such as INCH)
+- products, and the assembly tree from NEXT_ASSEMBLY_USAGE_OCCURRENCE
+- 3D cartesian-point bounding boxes per product and overall, plus solid counts
+
+Each chunk is cut after the last `;` that is outside a string (an even number
+of quotes precedes it), then string literals are swapped for indices into a
+side table so that entity headers and point lists can be matched with whole-
+region regexes instead of per-statement Python. Memory is bounded by one
+chunk plus the number of products and assembly links, not by the geometry.
+
+Points and solids are attributed to the most recently declared PRODUCT, which
+matches writers that emit each part's product header ahead of its
+representation (Open CASCADE / FreeCAD, which produce this repo's exports).
+Boxes are in each part's own frame; placement transforms are not applied.
+2D points (pcurve parameter space) are not boxed.
+
+    python cad/scripts/step_reader.py cad/export/weevil_leg_module_ap242.step
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator
+
+ROOT = Path(__file__).resolve().parents[2]
+STEP_PATH = ROOT / "cad" / "export" / "weevil_leg_module_ap242.step"
+CHUNK_CHARS = 1 << 22
+SOLID_TYPES = ("MANIFOLD_SOLID_BREP", "BREP_WITH_VOIDS", "FACETED_BREP")
+SI_PREFIX = {"": "", "MILLI": "m", "CENTI": "c", "DECI": "d", "KILO": "k", "MICRO": "u"}
+SI_SYMBOL = {"METRE": "m"}
+
+_STRING = re.compile(r"'((?:[^']|'')*)'")
+_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_SECTION = re.compile(r";\s*(HEADER|DATA|ENDSEC)\s*(?=;)")
+_HEAD = re.compile(r";\s*#\d+\s*=\s*([A-Za-z]\w*)?\s*\(")  # name is empty for complex entities
+_PART_NAME = re.compile(r"(?:\A\(|\))\s*([A-Za-z]\w*)\s*\(")  # after "(" opening the entity or ")" closing a part
+# Entities handled one by one: product structure, solids, and complex entities (no name).
+_MARK = re.compile(
+    r";\s*#(\d+)\s*=\s*(?:(PRODUCT|PRODUCT_DEFINITION_FORMATION\w*|PRODUCT_DEFINITION"
+    r"|NEXT_ASSEMBLY_USAGE_OCCURRENCE|" + "|".join(SOLID_TYPES) + r")\s*)?\("
+)
+_POINT3 = re.compile(r"CARTESIAN_POINT\s*\(\s*'\d+'\s*,\s*\(([^,()]+),([^,()]+),([^,()]+)\)")
+_REF = re.compile(r"#(\d+)")
+_INDEX = re.compile(r"'(\d+)'")
+
+
+class StepError(ValueError):
+    pass
+
+
+@dataclass
+class Box:
+    lo: list[float] = field(default_factory=lambda: [math.inf] * 3)
+    hi: list[float] = field(default_factory=lambda: [-math.inf] * 3)
+
+    @property
+    def empty(self) -> bool:
+        return self.lo[0] > self.hi[0]
+
+    @property
+    def extents(self) -> tuple[float, float, float]:
+        if self.empty:
+            return (0.0, 0.0, 0.0)
+        return (self.hi[0] - self.lo[0], self.hi[1] - self.lo[1], self.hi[2] - self.lo[2])
+
+    def add_range(self, axis: int, lo: float, hi: float) -> None:
+        self.lo[axis] = min(self.lo[axis], lo)
+        self.hi[axis] = max(self.hi[axis], hi)
+
+    def merge(self, other: "Box") -> None:
+        for k in range(3):
+            self.add_range(k, other.lo[k], other.hi[k])
+
+    def as_dict(self) -> dict[str, list[float]] | None:
+        return None if self.empty else {"min": list(self.lo), "max": list(self.hi)}
+
+
+@dataclass
+class Product:
+    entity: int
+    id: str
+    name: str
+    points: int = 0
+    solids: int = 0
+    box: Box = field(default_factory=Box)
+
+
+@dataclass
+class StepSummary:
+    path: str
+    schema: list[str] = field(default_factory=list)
+    originating_system: str = ""
+    timestamp: str = ""
+    entities: int = 0
+    counts: Counter = field(default_factory=Counter)
+    length_units: list[str] = field(default_factory=list)
+    products: list[Product] = field(default_factory=list)
+    assembly: list[tuple[str, str]] = field(default_factory=list)  # (parent, child) product names
+    roots: list[str] = field(default_factory=list)
+    box: Box = field(default_factory=Box)
+    points: int = 0
+    chars: int = 0
+    elapsed_s: float = 0.0
+
+    def product(self, name: str) -> Product | None:
+        return next((p for p in self.products if p.name == name), None)
+
+    @property
+    def solids(self) -> list[Product]:
+        return [p for p in self.products if p.solids]
+
+    def as_dict(self) -> dict:
+        return {
+            "path": self.path,
+            "schema": self.schema,
+            "originating_system": self.originating_system,
+            "timestamp": self.timestamp,
+            "entities": self.entities,
+            "length_units": self.length_units,
+            "points": self.points,
+            "bbox": self.box.as_dict(),
+            "products": [
+                {"name": p.name, "points": p.points, "solids": p.solids, "bbox": p.box.as_dict()}
+                for p in self.products
+            ],
+            "roots": self.roots,
+            "assembly": [list(edge) for edge in self.assembly],
+            "counts": dict(self.counts.most_common()),
+            "elapsed_s": round(self.elapsed_s, 4),
+        }
+
+
+def _safe_cut(buf: str) -> int:
+    """Index just past the last `;` not inside a string literal (0 if none)."""
+    k = buf.rfind(";")
+    while k >= 0 and buf.count("'", 0, k) % 2:
+        k = buf.rfind(";", 0, k)
+    return k + 1
+
+
+def iter_regions(path: Path, chunk_chars: int = CHUNK_CHARS) -> Iterator[str]:
+    """Runs of whole statements, roughly ``chunk_chars`` long."""
+    buf = ""
+    with path.open("r", encoding="latin-1", newline="") as f:
+        while True:
+            chunk = f.read(chunk_chars)
+            if not chunk:
+                break
+            buf += chunk
+            cut = _safe_cut(buf)
+            if cut:
+                yield buf[:cut]
+                buf = buf[cut:]
+    if buf.strip():
+        raise StepError(f"{path}: file ends inside an unterminated statement")
+
+
+def _top_level_args(body: str) -> list[str]:
+    """Top-level arguments of the first parenthesised group (strings already masked)."""
+    out: list[str] = []
+    depth = 0
+    start = 0
+    for i, ch in enumerate(body):
+        if ch == "(":
+            depth += 1
+            if depth == 1:
+                start = i + 1
+        elif ch == ")":
+            depth -= 1
+            if depth == 0:
+                out.append(body[start:i].strip())
+                return out
+        elif ch == "," and depth == 1:
+            out.append(body[start:i].strip())
+            start = i + 1
+    raise StepError(f"unbalanced parentheses in {body[:60]!r}")
+
+
+def _complex_parts(body: str) -> list[tuple[str, str]]:
+    """(NAME, text) for each part of a complex entity ``( A(...) B(...) )``."""
+    parts = []
+    depth = 0
+    start = -1
+    for i, ch in enumerate(body):
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+            if depth == 1 and start >= 0:
+                text = body[start:i + 1]
+                parts.append((text[: text.find("(")].strip().upper(), text))
+                start = -1
+        elif depth == 1 and start < 0 and ch.isalpha():
+            start = i
+    return parts
+
+
+_PLACEHOLDER_CACHE: list[str] = []
+
+
+def _placeholders(n: int) -> list[str]:
+    """["'0'", "'1'", ...]: stand-ins for the string literals of a region."""
+    while len(_PLACEHOLDER_CACHE) < n:
+        _PLACEHOLDER_CACHE.extend(f"'{i}'" for i in range(len(_PLACEHOLDER_CACHE), max(n, 2 * len(_PLACEHOLDER_CACHE), 1024)))
+    return _PLACEHOLDER_CACHE[:n]
+
+
+def _ref(arg: str) -> int | None:
+    m = _REF.fullmatch(arg)
+    return int(m.group(1)) if m else None
+
+
+class _Reader:
+    def __init__(self, path: Path) -> None:
+        self.s = StepSummary(str(path))
+        self.section = ""
+        self.strings: list[str] = []
+        self.current: Product | None = None
+        self.formation_product: dict[int, int] = {}  # PRODUCT_DEFINITION_FORMATION -> PRODUCT
+        self.definition_formation: dict[int, int] = {}  # PRODUCT_DEFINITION -> formation
+        self.products: dict[int, Product] = {}
+        self.links: list[tuple[int, int]] = []  # NAUO (relating, related) PRODUCT_DEFINITIONs
+
+    def string(self, arg: str) -> str:
+        m = _INDEX.fullmatch(arg)
+        return self.strings[int(m.group(1))].replace("''", "'") if m else ""
+
+    def region(self, text: str) -> None:
+        self.s.chars += len(text)
+        if "/*" in text:
+            text = _COMMENT.sub("", text)
+        parts = _STRING.split(text)
+        self.strings = parts[1::2]
+        parts[1::2] = _placeholders(len(self.strings))
+        masked = ";" + "".join(parts)  # regions start after a ';', so keywords always follow one
+        pos = 0
+        for m in _SECTION.finditer(masked):
+            self.body(masked, pos, m.start() + 1)
+            self.section = "" if m.group(1) == "ENDSEC" else m.group(1)
+            pos = m.end()
+        self.body(masked, pos, len(masked))
+
+    def body(self, text: str, a: int, b: int) -> None:
+        if self.section == "DATA":
+            self.data(text, a, b)
+        elif self.section == "HEADER":
+            for stmt in text[a:b].split(";"):
+                self.header(stmt.strip())
+
+    def header(self, stmt: str) -> None:
+        name = stmt[: stmt.find("(")].strip().upper()
+        if name == "FILE_SCHEMA":
+            self.s.schema = [self.strings[int(i)] for i in _INDEX.findall(stmt)]
+        elif name == "FILE_NAME":
+            args = _top_level_args(stmt)
+            self.s.timestamp = self.string(args[1]) if len(args) > 1 else ""
+            self.s.originating_system = self.string(args[5]) if len(args) > 5 else ""
+
+    def data(self, text: str, a: int, b: int) -> None:
+        s = self.s
+        kinds = Counter(_HEAD.findall(text, a, b))
+        s.entities += sum(kinds.values())
+        kinds.pop("", None)  # complex entities are counted by their parts below
+        s.counts.update(kinds)
+
+        pos = a
+        for m in _MARK.finditer(text, a, b):
+            self.points(text, pos, m.start())
+            pos = m.start()
+            eid, kind = int(m.group(1)), m.group(2)
+            if kind is None:
+                self.complex(text[m.end() - 1: text.find(";", m.end())])
+                continue
+            if kind in SOLID_TYPES:
+                if self.current is not None:
+                    self.current.solids += 1
+                continue
+            args = _top_level_args(text[m.end() - 1: text.find(";", m.end())])
+            if kind == "PRODUCT":
+                p = Product(eid, self.string(args[0]), self.string(args[1]) or self.string(args[0]))
+                self.products[eid] = p
+                s.products.append(p)
+                self.current = p
+            elif kind == "PRODUCT_DEFINITION":
+                ref = _ref(args[2])
+                if ref is not None:
+                    self.definition_formation[eid] = ref
+            elif kind == "NEXT_ASSEMBLY_USAGE_OCCURRENCE":
+                parent, child = _ref(args[3]), _ref(args[4])
+                if parent is not None and child is not None:
+                    self.links.append((parent, child))
+            else:  # PRODUCT_DEFINITION_FORMATION[_WITH_SPECIFIED_SOURCE]
+                ref = _ref(args[2])
+                if ref is not None:
+                    self.formation_product[eid] = ref
+        self.points(text, pos, b)
+
+    def points(self, text: str, a: int, b: int) -> None:
+        pts = _POINT3.findall(text, a, b)
+        if not pts:
+            return
+        self.s.points += len(pts)
+        current = self.current
+        for axis, column in enumerate(zip(*pts)):
+            values = list(map(float, column))
+            lo, hi = min(values), max(values)
+            self.s.box.add_range(axis, lo, hi)
+            if current is not None:
+                current.box.add_range(axis, lo, hi)
+        if current is not None:
+            current.points += len(pts)
+
+    def complex(self, body: str) -> None:
+        names = [n.upper() for n in _PART_NAME.findall(body)]
+        self.s.counts["+".join(names)] += 1
+        if "LENGTH_UNIT" not in names:
+            return
+        unit = ""
+        for name, part in _complex_parts(body):
+            if name == "SI_UNIT":
+                prefix, base = (a.strip(".").upper() for a in _top_level_args(part))
+                prefix = "" if prefix == "$" else prefix
+                unit = SI_PREFIX.get(prefix, prefix.lower()) + SI_SYMBOL.get(base, base.lower())
+            elif name == "CONVERSION_BASED_UNIT":
+                unit = self.string(_top_level_args(part)[0]).lower()
+        if unit and unit not in self.s.length_units:
+            self.s.length_units.append(unit)
+
+    def finish(self) -> StepSummary:
+        def name_of(definition: int) -> str:
+            product = self.products.get(self.formation_product.get(self.definition_formation.get(definition, -1), -1))
+            return product.name if product is not None else f"#{definition}"
+
+        children = {b for _, b in self.links}
+        self.s.roots = [name_of(d) for d in dict.fromkeys(a for a, _ in self.links) if d not in children]
+        self.s.assembly = [(name_of(a), name_of(b)) for a, b in self.links]
+        return self.s
+
+
+def read_step(path: Path | str = STEP_PATH, chunk_chars: int = CHUNK_CHARS) -> StepSummary:
+    path = Path(path)
+    t0 = time.perf_counter()
+    reader = _Reader(path)
+    for text in iter_regions(path, chunk_chars):
+        reader.region(text)
+    summary = reader.finish()
+    summary.elapsed_s = time.perf_counter() - t0
+    return summary
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="One-pass STEP (ISO-10303-21) summary without FreeCAD")
+    ap.add_argument("path", nargs="?", default=str(STEP_PATH))
+    ap.add_argument("--json", action="store_true", help="print the full summary as JSON")
+    args = ap.parse_args()
+
+    s = read_step(args.path)
+    if args.json:
+        print(json.dumps(s.as_dict(), indent=2))
+        return 0
+    print(f"{s.path}: {s.entities} entities, {s.points} 3D points in {s.elapsed_s * 1e3:.1f} ms "
+          f"({s.chars / max(s.elapsed_s, 1e-9) / 1e6:.1f} MB/s)")
+    print(f"schema {', '.join(s.schema)}; from {s.originating_system or '?'} at {s.timestamp or '?'}; "
+          f"length units {', '.join(s.length_units) or '?'}")
+    print(f"assembly roots: {', '.join(s.roots) or '-'}; {len(s.assembly)} occurrences")
+    for p in s.solids:
+        ex = ", ".join(f"{v:.3f}" for v in p.box.extents)
+        print(f"  {p.name}: {p.solids} solid(s), {p.points} points, extents [{ex}]")
+    ex = ", ".join(f"{v:.3f}" for v in s.box.extents)
+    print(f"overall extents [{ex}]")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
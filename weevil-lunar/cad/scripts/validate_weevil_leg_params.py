@@ -1,35 +1,66 @@
 #!/usr/bin/env python3
-"""Lightweight validator for cad/weevil_leg_params.yaml."""
+"""Lightweight validator for cad/weevil_leg_params.yaml.
+
+Checks are declared once in RULES and compiled into per-field closures
+(dotted paths pre-split, bounds bound), so `check()` reports every violation
+of a variant in one pass without raising. `validate()` keeps the original
+fail-fast behaviour. Bulk DOE variants are checked with `check_batch()`
+(in-memory dicts) or `check_paths()` (files/directories, parsed in worker
+processes):
+
+    python cad/scripts/validate_weevil_leg_params.py
+    python cad/scripts/validate_weevil_leg_params.py sweeps/ --all-errors --json reports/variants.json
+"""
 
 from __future__ import annotations
 
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable
 
 try:
     import yaml  # type: ignore
 except Exception:  # pragma: no cover
     yaml = None
 
-from simple_yaml import load_yaml_text
+from simple_yaml import load_yaml_file, load_yaml_text
 
 ROOT = Path(__file__).resolve().parents[2]
 YAML_PATH = ROOT / "cad" / "weevil_leg_params.yaml"
+PARALLEL_MIN_FILES = 32
 
+# (kind, dotted path, *args); kinds: require, equals, range, ascending_pair
+RULES: tuple[tuple, ...] = (
+    ("require", "meta"), ("require", "body"), ("require", "coxa"), ("require", "femur"),
+    ("require", "tibia_screw"), ("require", "foot"), ("require", "proximal_gimbal"),
+    ("require", "meta.version"), ("require", "meta.units"),
+    ("equals", "meta.units", "mm"),
+    ("range", "body.stance_height_mm", 100.0, 300.0),
+    ("range", "body.mass_total_kg", 5.0, 80.0),
+    ("ascending_pair", "coxa.yaw_range_deg"),
+    ("range", "coxa.shaft_diameter_mm", 5.0, 30.0),
+    ("ascending_pair", "femur.pitch_range_deg"),
+    ("range", "femur.link_length_mm", 20.0, 120.0),
+    ("range", "tibia_screw.pitch_mm_per_rev", 12.0, 15.0),
+    ("range", "tibia_screw.stroke_mm", 25.0, 45.0),
+    ("range", "tibia_screw.rotation_range_deg", 90.0, 150.0),
+    ("range", "foot.radius_mm", 70.0, 90.0),
+    ("range", "foot.pad_thickness_mm", 5.0, 8.0),
+    ("range", "foot.cleat_engage_threshold_N", 10.0, 200.0),
+    ("range", "proximal_gimbal.axis_orthogonality_target_deg", 70.0, 110.0),
+    ("range", "proximal_gimbal.axis_orthogonality_tolerance_deg", 0.1, 30.0),
+)
 
-class ValidationError(Exception):
-    pass
-
-
-def require(d: dict[str, Any], keys: list[str], ctx: str) -> None:
-    for key in keys:
-        if key not in d:
-            raise ValidationError(f"Missing required key '{ctx}.{key}'")
+_MISSING = object()
+_LOAD_ERRORS = (OSError, ValueError) + ((yaml.YAMLError,) if yaml is not None else ())
 
 
-def in_range(name: str, v: float, lo: float, hi: float) -> None:
-    if not (lo <= v <= hi):
-        raise ValidationError(f"{name}={v} out of bounds [{lo}, {hi}]")
+class ValidationError(Exception):
+    pass
 
 
 def check_range_pair(name: str, pair: Any) -> None:
@@ -39,46 +70,205 @@ def check_range_pair(name: str, pair: Any) -> None:
         raise ValidationError(f"{name} must be strictly ascending")
 
 
+def _getter(keys: tuple[str, ...]) -> Callable[[Any], Any]:
+    """Accessor for a pre-split path; returns _MISSING where any level is absent."""
+    if len(keys) == 1:
+        (a,) = keys
+        return lambda data: data.get(a, _MISSING)
+    if len(keys) == 2:
+        a, b = keys
+
+        def get2(data: Any) -> Any:
+            section = data.get(a)
+            return section.get(b, _MISSING) if isinstance(section, dict) else _MISSING
+        return get2
+
+    def get(data: Any) -> Any:
+        for key in keys:
+            if not isinstance(data, dict) or key not in data:
+                return _MISSING
+            data = data[key]
+        return data
+    return get
+
+
+def _missing(keys: tuple[str, ...]) -> str:
+    ctx = ".".join(("root",) + keys[:-1]) if len(keys) == 1 else ".".join(keys[:-1])
+    return f"Missing required key '{ctx}.{keys[-1]}'"
+
+
+def _compile_rule(kind: str, path: str, *args: Any) -> Callable[[Any], str | None]:
+    keys = tuple(path.split("."))
+    get = _getter(keys)
+    parent = _getter(keys[:-1]) if len(keys) > 1 else (lambda data: data)
+
+    if kind == "require":
+        def rule(data: Any) -> str | None:
+            return _missing(keys) if get(data) is _MISSING else None
+    elif kind == "equals":
+        (expected,) = args
+
+        def rule(data: Any) -> str | None:
+            v = get(data)
+            return None if v is _MISSING or v == expected else f"{path} must be {expected!r}"
+    elif kind == "range":
+        lo, hi = args
+
+        def rule(data: Any) -> str | None:
+            v = get(data)
+            if v is _MISSING:
+                # A missing section is already reported by its require rule.
+                return _missing(keys) if parent(data) is not _MISSING else None
+            try:
+                v = float(v)
+            except (TypeError, ValueError):
+                return f"{path}={v!r} is not a number"
+            return None if lo <= v <= hi else f"{path}={v} out of bounds [{lo}, {hi}]"
+    elif kind == "ascending_pair":
+        def rule(data: Any) -> str | None:
+            pair = get(data)
+            if pair is _MISSING:
+                return _missing(keys) if parent(data) is not _MISSING else None
+            try:
+                check_range_pair(path, pair)
+            except ValidationError as exc:
+                return str(exc)
+            except TypeError:
+                return f"{path} values must be numbers"
+            return None
+    else:
+        raise ValueError(f"unknown rule kind {kind!r} for {path}")
+    return rule
+
+
+def compile_rules(rules: Iterable[tuple] = RULES) -> tuple[Callable[[Any], str | None], ...]:
+    return tuple(_compile_rule(*r) for r in rules)
+
+
+COMPILED = compile_rules()
+
+
+def check(data: Any, compiled: tuple[Callable[[Any], str | None], ...] = COMPILED) -> list[str]:
+    """Every rule violation of one variant, in RULES order (empty when valid)."""
+    if not isinstance(data, dict):
+        return ["root must be a mapping"]
+    return [msg for msg in (rule(data) for rule in compiled) if msg is not None]
+
+
 def validate(data: dict[str, Any]) -> None:
-    require(data, ["meta", "body", "coxa", "femur", "tibia_screw", "foot", "proximal_gimbal"], "root")
-    meta = data["meta"]
-    require(meta, ["version", "units"], "meta")
-    if meta["units"] != "mm":
-        raise ValidationError("meta.units must be 'mm'")
+    errors = check(data)
+    if errors:
+        raise ValidationError(errors[0])
+
+
+def _check_chunk(variants: list[Any]) -> list[list[str]]:
+    return [check(v) for v in variants]
+
+
+def _load(path: Path) -> Any:
+    if yaml is not None:
+        return yaml.load(path.read_text(encoding="utf-8"), Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+    return load_yaml_file(path)
+
 
-    body = data["body"]
-    in_range("body.stance_height_mm", float(body["stance_height_mm"]), 100.0, 300.0)
-    in_range("body.mass_total_kg", float(body["mass_total_kg"]), 5.0, 80.0)
+def _check_file(path: str) -> dict[str, Any]:
+    try:
+        errors = check(_load(Path(path)))
+    except _LOAD_ERRORS as exc:
+        errors = [f"unreadable: {' '.join(str(exc).split())}"]
+    return {"source": path, "ok": not errors, "errors": errors}
 
-    coxa = data["coxa"]
-    check_range_pair("coxa.yaw_range_deg", coxa["yaw_range_deg"])
-    in_range("coxa.shaft_diameter_mm", float(coxa["shaft_diameter_mm"]), 5.0, 30.0)
 
-    femur = data["femur"]
-    check_range_pair("femur.pitch_range_deg", femur["pitch_range_deg"])
-    in_range("femur.link_length_mm", float(femur["link_length_mm"]), 20.0, 120.0)
+def _workers(n_items: int, workers: int | None) -> int:
+    if workers is None:
+        workers = 1 if n_items < PARALLEL_MIN_FILES else min(os.cpu_count() or 1, 8)
+    return max(1, min(workers, n_items))
 
-    tibia = data["tibia_screw"]
-    in_range("tibia_screw.pitch_mm_per_rev", float(tibia["pitch_mm_per_rev"]), 12.0, 15.0)
-    in_range("tibia_screw.stroke_mm", float(tibia["stroke_mm"]), 25.0, 45.0)
-    in_range("tibia_screw.rotation_range_deg", float(tibia["rotation_range_deg"]), 90.0, 150.0)
 
-    foot = data["foot"]
-    in_range("foot.radius_mm", float(foot["radius_mm"]), 70.0, 90.0)
-    in_range("foot.pad_thickness_mm", float(foot["pad_thickness_mm"]), 5.0, 8.0)
-    in_range("foot.cleat_engage_threshold_N", float(foot["cleat_engage_threshold_N"]), 10.0, 200.0)
+def check_batch(variants: list[Any], workers: int = 1) -> list[list[str]]:
+    """Violations per in-memory variant (input order).
 
-    gimbal = data["proximal_gimbal"]
-    in_range("proximal_gimbal.axis_orthogonality_target_deg", float(gimbal["axis_orthogonality_target_deg"]), 70.0, 110.0)
-    in_range("proximal_gimbal.axis_orthogonality_tolerance_deg", float(gimbal["axis_orthogonality_tolerance_deg"]), 0.1, 30.0)
+    Checking costs a few microseconds per variant, less than pickling it to a
+    worker, so batches stay in-process unless ``workers`` is raised.
+    """
+    n = _workers(len(variants), workers)
+    if n == 1:
+        return _check_chunk(variants)
+    size = -(-len(variants) // (n * 4))
+    chunks = [variants[i: i + size] for i in range(0, len(variants), size)]
+    with ProcessPoolExecutor(max_workers=n) as ex:
+        return [errs for part in ex.map(_check_chunk, chunks) for errs in part]
+
+
+def expand_paths(paths: Iterable[Path | str]) -> list[Path]:
+    out: list[Path] = []
+    for p in map(Path, paths):
+        if p.is_dir():
+            out += sorted(q for q in p.rglob("*") if q.suffix in (".yaml", ".yml"))
+        else:
+            out.append(p)
+    return out
+
+
+def check_paths(paths: Iterable[Path | str], workers: int | None = None) -> list[dict[str, Any]]:
+    """One {source, ok, errors} record per YAML file; directories are searched recursively.
+
+    Parsing dominates here, so from PARALLEL_MIN_FILES files on the default is
+    one worker process per CPU (up to 8).
+    """
+    files = [str(p) for p in expand_paths(paths)]
+    n = _workers(len(files), workers)
+    if n <= 1:
+        return [_check_file(f) for f in files]
+    with ProcessPoolExecutor(max_workers=n) as ex:
+        return list(ex.map(_check_file, files, chunksize=max(1, len(files) // (n * 4))))
+
+
+def summary(records: list[dict[str, Any]]) -> dict[str, Any]:
+    invalid = sum(not r["ok"] for r in records)
+    return {
+        "checked": len(records),
+        "valid": len(records) - invalid,
+        "invalid": invalid,
+        "rules": len(COMPILED),
+        "variants": records,
+    }
 
 
 def main() -> int:
-    text = YAML_PATH.read_text(encoding="utf-8")
-    data = yaml.safe_load(text) if yaml is not None else load_yaml_text(text)
-    validate(data)
-    print(f"OK: {YAML_PATH}")
-    return 0
+    ap = argparse.ArgumentParser(description="Validate weevil leg parameter files")
+    ap.add_argument("paths", nargs="*", help=f"YAML files or directories (default: {YAML_PATH.relative_to(ROOT)})")
+    ap.add_argument("--all-errors", action="store_true", help="report every violation instead of the first")
+    ap.add_argument("--json", default="", help="write the machine-readable summary here ('-' for stdout)")
+    ap.add_argument("--workers", type=int, default=None)
+    args = ap.parse_args()
+
+    if not args.paths and not args.all_errors and not args.json:
+        text = YAML_PATH.read_text(encoding="utf-8")
+        data = yaml.safe_load(text) if yaml is not None else load_yaml_text(text)
+        validate(data)
+        print(f"OK: {YAML_PATH}")
+        return 0
+
+    records = check_paths(args.paths or [YAML_PATH], args.workers)
+    if not records:
+        print("No parameter files found", file=sys.stderr)
+        return 1
+    result = summary(records)
+    if args.json == "-":
+        print(json.dumps(result, indent=2))
+    else:
+        if args.json:
+            out = Path(args.json)
+            out.parent.mkdir(parents=True, exist_ok=True)
+            out.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+        for r in records:
+            errors = r["errors"] if args.all_errors else r["errors"][:1]
+            print(f"{'OK' if r['ok'] else 'FAIL'}: {r['source']}")
+            for msg in errors:
+                print(f"  {msg}")
+        print(f"{result['valid']}/{result['checked']} variants valid")
+    return 1 if result["invalid"] else 0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""Monte Carlo sensitivity of slope recovery to proximal gimbal axis error.
+
+Each trial perturbs the coxa/femur axes of the leg chain, derives the
+push-off direction from the perturbed kinematics and checks the resulting
+slope demand against the regolith contact model (same cone-margin rule as
+`test_directional_slope_margin` in results/GPT/Robotics/weevil_lunar_tests.py).
+
+Focus:
+- batched (array) kinematics + contact, no per-trial Python loop
+- reproducible seeding independent of worker count (SeedSequence per chunk)
+- Wilson score confidence interval per axis error
+"""
+
+from __future__ import annotations
+
+import math
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+ROOT = Path(__file__).resolve().parents[1]
+ROBOTICS_DIR = ROOT.parent / "results" / "GPT" / "Robotics"
+sys.path.append(str(ROOT))
+sys.path.append(str(ROBOTICS_DIR))
+
+from models.lunar_integrated_weevil_leg import LUNAR_G, LegParams, helical_displacement_mm, load_params
+from regolith_contact_model import FootGeometry, RegolithContactModel, RegolithProperties, RegolithType  # type: ignore
+
+TERRAINS = (RegolithType.MARE, RegolithType.HIGHLAND, RegolithType.MIXED, RegolithType.COMPACTED)
+CHUNK_TRIALS = 4096
+
+X_AXIS = np.array([1.0, 0.0, 0.0])
+Y_AXIS = np.array([0.0, 1.0, 0.0])
+Z_AXIS = np.array([0.0, 0.0, 1.0])
+
+
+@dataclass(frozen=True)
+class TrialPriors:
+    """Sampling distributions for one slope-recovery trial (POC assumptions)."""
+    slope_deg: tuple[float, float] = (15.0, 42.0)
+    cross_slope_sigma_deg: float = 3.0
+    femur_pitch_deg: tuple[float, float] = (-60.0, -10.0)
+    push_off_factor: tuple[float, float] = (1.0, 1.15)
+    preload_command_ratio: float = 1.25  # commanded preload / cleat engage threshold
+    preload_scatter: float = 0.15        # relative 1-sigma of achieved preload
+    assembly_jitter_deg: float = 1.0     # per-axis misalignment on top of the swept error
+    stance_legs: int = 3                 # tripod support during recovery
+    anchor_required_above_deg: float = 25.0
+    downslope_margin_min: float = 1.05
+    lateral_margin_min: float = 1.20
+
+
+@dataclass(frozen=True)
+class SensitivityPoint:
+    axis_error_deg: float
+    trials: int
+    successes: int
+    success_rate: float
+    ci_low: float
+    ci_high: float
+
+
+def wilson_interval(successes: int, trials: int, z: float = 1.96) -> tuple[float, float]:
+    if trials <= 0:
+        return 0.0, 1.0
+    p = successes / trials
+    denom = 1.0 + z * z / trials
+    centre = (p + z * z / (2.0 * trials)) / denom
+    half = z * math.sqrt(p * (1.0 - p) / trials + z * z / (4.0 * trials * trials)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+def rotate_batch(v: NDArray[np.float64], axis: NDArray[np.float64], angle: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Rodrigues rotation of row vectors ``v`` about unit row vectors ``axis``."""
+    c = np.cos(angle)[:, None]
+    s = np.sin(angle)[:, None]
+    dot = np.sum(axis * v, axis=1, keepdims=True)
+    return v * c + np.cross(axis, v) * s + axis * dot * (1.0 - c)
+
+
+def jitter_axes(rng: np.random.Generator, axes: NDArray[np.float64], sigma_deg: float) -> NDArray[np.float64]:
+    """Rotate each axis by a Gaussian angle about a random direction."""
+    n = axes.shape[0]
+    u = rng.normal(size=(n, 3))
+    u /= np.linalg.norm(u, axis=1, keepdims=True)
+    return rotate_batch(axes, u, rng.normal(0.0, math.radians(sigma_deg), size=n))
+
+
+def lateral_leakage(
+    rng: np.random.Generator,
+    params: LegParams,
+    axis_error_deg: float,
+    femur_pitch_deg: NDArray[np.float64],
+    jitter_deg: float,
+) -> NDArray[np.float64]:
+    """Lateral / sagittal ratio of the push-off direction for perturbed proximal axes.
+
+    The femur axis is tilted toward the coxa (z) axis by the swept orthogonality
+    error with random sign; both axes also carry assembly jitter.
+    """
+    n = femur_pitch_deg.shape[0]
+    coxa_axis = jitter_axes(rng, np.tile(Z_AXIS, (n, 1)), jitter_deg)
+    sign = rng.choice(np.array([-1.0, 1.0]), size=n)
+    femur_axis = rotate_batch(np.tile(Y_AXIS, (n, 1)), np.tile(X_AXIS, (n, 1)), sign * math.radians(axis_error_deg))
+    femur_axis = jitter_axes(rng, femur_axis, jitter_deg)
+
+    tibia_theta = rng.uniform(-params.tibia_range_total_deg / 2.0, params.tibia_range_total_deg / 2.0, size=n)
+    ext = np.clip(
+        helical_displacement_mm(tibia_theta, params.tibia_pitch_mm_per_rev),
+        -params.tibia_stroke_mm / 2.0,
+        params.tibia_stroke_mm / 2.0,
+    )
+    reach = params.femur_link_mm + params.tibia_stroke_mm + ext
+    pitch = np.radians(femur_pitch_deg)
+    r = np.column_stack([reach * np.cos(pitch), np.zeros(n), reach * np.sin(pitch)])
+
+    # Push-off direction = foot velocity about the femur axis, resolved in the
+    # body frame attached to the (jittered) coxa axis.
+    d = np.cross(femur_axis, r)
+    fwd = np.cross(np.tile(Y_AXIS, (n, 1)), coxa_axis)
+    fwd /= np.linalg.norm(fwd, axis=1, keepdims=True)
+    lat = np.cross(coxa_axis, fwd)
+    d_up = np.sum(d * coxa_axis, axis=1)
+    d_fwd = np.sum(d * fwd, axis=1)
+    d_lat = np.sum(d * lat, axis=1)
+    return np.abs(d_lat) / np.maximum(np.hypot(d_fwd, d_up), 1e-12)
+
+
+def simulate_trials(
+    params: LegParams,
+    axis_error_deg: float,
+    n_trials: int,
+    seed: np.random.SeedSequence,
+    priors: TrialPriors = TrialPriors(),
+) -> NDArray[np.bool_]:
+    """Run ``n_trials`` batched slope-recovery trials; True where recovery succeeds."""
+    rng = np.random.default_rng(seed)
+    slope = rng.uniform(*priors.slope_deg, size=n_trials)
+    cross = rng.normal(0.0, priors.cross_slope_sigma_deg, size=n_trials)
+    femur_pitch = rng.uniform(*priors.femur_pitch_deg, size=n_trials)
+    push = rng.uniform(*priors.push_off_factor, size=n_trials)
+    preload = params.preload_n * priors.preload_command_ratio * (
+        1.0 + priors.preload_scatter * rng.standard_normal(n_trials)
+    )
+    terrain_idx = rng.integers(0, len(TERRAINS), size=n_trials)
+    leak = lateral_leakage(rng, params, axis_error_deg, femur_pitch, priors.assembly_jitter_deg)
+
+    body_load = params.body_mass_kg * LUNAR_G / priors.stance_legs
+    normal = body_load * np.cos(np.radians(slope)) * np.cos(np.radians(cross))
+
+    cone_fwd = np.empty(n_trials)
+    cone_lat = np.empty(n_trials)
+    anchored = np.empty(n_trials, dtype=bool)
+    for i, terrain in enumerate(TERRAINS):
+        sel = terrain_idx == i
+        if not np.any(sel):
+            continue
+        foot = FootGeometry.circular(
+            radius=params.foot_radius_mm / 1000.0,
+            cleat_gain_forward=params.cleat_forward_gain,
+            cleat_gain_lateral=params.cleat_lateral_gain,
+            cleat_engage_threshold_preload=params.preload_n,
+        )
+        model = RegolithContactModel(RegolithProperties.from_type(terrain), foot, gravity=LUNAR_G)
+        c = model.compute_contact_forces_with_preload_batch(normal[sel], preload_normal=preload[sel])
+        cone_fwd[sel] = c.friction_cone_forward_angle
+        cone_lat[sel] = c.friction_cone_lateral_angle
+        anchored[sel] = c.anchored
+
+    tan_slope = np.tan(np.radians(slope))
+    demand_fwd = np.degrees(np.arctan(push * tan_slope))
+    demand_lat = np.degrees(np.arctan(tan_slope * (1.0 + push * leak) + np.abs(np.tan(np.radians(cross)))))
+
+    anchor_ok = (slope <= priors.anchor_required_above_deg) | anchored
+    down_ok = cone_fwd >= priors.downslope_margin_min * demand_fwd
+    lat_ok = cone_lat >= priors.lateral_margin_min * demand_lat
+    return anchor_ok & down_ok & lat_ok
+
+
+def _count_chunk(task: tuple[LegParams, float, int, np.random.SeedSequence, TrialPriors]) -> int:
+    params, axis_error_deg, n, seed, priors = task
+    return int(np.count_nonzero(simulate_trials(params, axis_error_deg, n, seed, priors)))
+
+
+def run_sensitivity(
+    axis_errors_deg: Sequence[float],
+    n_trials: int = 20000,
+    seed: int = 20260217,
+    workers: int | None = None,
+    params: LegParams | None = None,
+    priors: TrialPriors = TrialPriors(),
+) -> list[SensitivityPoint]:
+    """Estimate recovery success rate per axis error.
+
+    Trials are split into fixed-size chunks, each with its own spawned seed, so
+    results are identical for any ``workers`` value (``workers=1`` runs inline).
+    """
+    params = params or load_params()
+    root = np.random.SeedSequence(seed)
+    tasks: list[tuple[LegParams, float, int, np.random.SeedSequence, TrialPriors]] = []
+    owners: list[int] = []
+    for k, (err, err_seed) in enumerate(zip(axis_errors_deg, root.spawn(len(axis_errors_deg)))):
+        sizes = [CHUNK_TRIALS] * (n_trials // CHUNK_TRIALS)
+        if n_trials % CHUNK_TRIALS:
+            sizes.append(n_trials % CHUNK_TRIALS)
+        for size, chunk_seed in zip(sizes, err_seed.spawn(len(sizes))):
+            tasks.append((params, float(err), size, chunk_seed, priors))
+            owners.append(k)
+
+    if workers == 1:
+        counts = [_count_chunk(t) for t in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            counts = list(pool.map(_count_chunk, tasks))
+
+    successes = [0] * len(axis_errors_deg)
+    for k, c in zip(owners, counts):
+        successes[k] += c
+
+    out: list[SensitivityPoint] = []
+    for err, s in zip(axis_errors_deg, successes):
+        lo, hi = wilson_interval(s, n_trials)
+        out.append(SensitivityPoint(float(err), n_trials, s, s / n_trials, lo, hi))
+    return out
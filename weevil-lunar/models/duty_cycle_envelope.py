@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""Duty-cycle vs cadence envelope derived from stance-time traction.
+
+For every (terrain, slope, cadence) the admissible stance duty cycle beta is
+the set of grid values meeting all of:
+- gait_phase stance-fraction limits (min/max_stance_fraction)
+- swing time: (1 - beta) / cadence >= swing_time_min_s
+- traction: the stance legs (leg_count * beta on average) share the slope
+  load; the forward friction cone from the regolith contact model must cover
+  the push-off demand with `downslope_margin_min` (cone-margin rule of
+  `axis_sensitivity.simulate_trials`)
+- anchoring: above `anchor_required_above_deg` the foot must anchor (cleat
+  preload + twist-settle), which needs stance time beta / cadence >= settle_time_s;
+  cleat gains only count when anchored
+
+The upper bound duty_max is set by the stance-fraction limit and swing time
+alone. Traction improves with beta (more stance legs share the load), so it
+raises duty_min or makes a cell infeasible but never lowers duty_max; the same
+holds for the settle-time rule.
+
+Traction depends on (slope, beta) only, so the contact model runs once per
+terrain on that grid and broadcasts over cadence. Terrains are independent
+tasks (``workers=1`` runs inline).
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import math
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import NDArray
+
+try:
+    import yaml  # type: ignore
+except Exception:  # pragma: no cover
+    yaml = None
+
+ROOT = Path(__file__).resolve().parents[1]
+ROBOTICS_DIR = ROOT.parent / "results" / "GPT" / "Robotics"
+sys.path.append(str(ROOT))
+sys.path.append(str(ROBOTICS_DIR))
+sys.path.append(str(ROOT / "cad" / "scripts"))
+
+from models.axis_sensitivity import TERRAINS
+from models.lunar_integrated_weevil_leg import LUNAR_G, PARAMS_PATH, LegParams, load_params
+from models.stance_detector import GaitPhaseParams, load_gait_params
+from regolith_contact_model import FootGeometry, RegolithContactModel, RegolithProperties, RegolithType  # type: ignore
+from simple_yaml import load_yaml_text  # type: ignore
+
+CADENCES_HZ = np.round(np.arange(0.05, 1.5 + 1e-9, 0.01), 4)
+SLOPES_DEG = np.arange(0.0, 45.0 + 1e-9, 1.0)
+DUTY_STEP = 0.0025
+
+
+@dataclass(frozen=True)
+class EnvelopePriors:
+    """Gait timing and traction assumptions (POC values)."""
+    swing_time_min_s: float = 0.5        # leg lift / reposition at max joint rate
+    settle_time_s: float = 0.8           # preload + twist-settle before push-off
+    push_off_factor: float = 1.15
+    preload_command_ratio: float = 1.25  # commanded preload / cleat engage threshold
+    anchor_required_above_deg: float = 25.0
+    downslope_margin_min: float = 1.05
+
+
+@dataclass(frozen=True)
+class TerrainEnvelope:
+    terrain: str
+    duty_min: NDArray[np.float64]        # (slopes, cadences), NaN = infeasible
+    duty_max: NDArray[np.float64]
+    anchored: NDArray[np.bool_]          # duty_max point uses anchored stance
+    traction_margin: NDArray[np.float64]  # cone margin at duty_max (the best-traction point)
+
+
+@dataclass(frozen=True)
+class EnvelopeSurface:
+    slopes_deg: NDArray[np.float64]
+    cadences_hz: NDArray[np.float64]
+    duties: NDArray[np.float64]
+    terrains: tuple[TerrainEnvelope, ...]
+
+    def terrain(self, name: str) -> TerrainEnvelope:
+        return next(t for t in self.terrains if t.terrain == name)
+
+    def max_cadence_hz(self, name: str) -> NDArray[np.float64]:
+        """Highest feasible cadence per slope (NaN where no cadence is feasible)."""
+        ok = np.isfinite(self.terrain(name).duty_max)
+        last = ok.shape[1] - 1 - np.argmax(ok[:, ::-1], axis=1)
+        return np.where(ok.any(axis=1), self.cadences_hz[last], np.nan)
+
+
+def load_tilt_limit_deg(path: Path = PARAMS_PATH) -> float:
+    text = path.read_text(encoding="utf-8")
+    raw = yaml.safe_load(text) if yaml is not None else load_yaml_text(text)
+    return float(raw["mobility"]["tilt_hard_limit_deg"])
+
+
+def duty_grid(gait: GaitPhaseParams) -> NDArray[np.float64]:
+    n = int(round((gait.max_stance_fraction - gait.min_stance_fraction) / DUTY_STEP))
+    return np.round(np.linspace(gait.min_stance_fraction, gait.max_stance_fraction, n + 1), 6)
+
+
+def traction_margin(
+    params: LegParams,
+    gait: GaitPhaseParams,
+    terrain: RegolithType,
+    slopes_deg: NDArray[np.float64],
+    duties: NDArray[np.float64],
+    anchored: bool,
+    priors: EnvelopePriors = EnvelopePriors(),
+) -> NDArray[np.float64]:
+    """Forward cone margin over the (slopes, duties) grid for free or anchored stance."""
+    foot = FootGeometry.circular(
+        radius=params.foot_radius_mm / 1000.0,
+        cleat_gain_forward=params.cleat_forward_gain,
+        cleat_gain_lateral=params.cleat_lateral_gain,
+        cleat_engage_threshold_preload=params.preload_n,
+    )
+    model = RegolithContactModel(RegolithProperties.from_type(terrain), foot, gravity=LUNAR_G)
+    slope = np.radians(slopes_deg)[:, None]
+    stance_legs = gait.leg_count * duties[None, :]
+    normal = params.body_mass_kg * LUNAR_G * np.cos(slope) / stance_legs
+    preload = params.preload_n * priors.preload_command_ratio if anchored else 0.0
+    c = model.compute_contact_forces_with_preload_batch(
+        normal.ravel(), preload_normal=preload, use_directional_cleats=anchored
+    )
+    cone = c.friction_cone_forward_angle.reshape(normal.shape)
+    demand = np.degrees(np.arctan(priors.push_off_factor * np.tan(slope)))
+    return np.where(demand > 0.0, cone / np.maximum(demand, 1e-12), np.inf)
+
+
+def terrain_envelope(
+    params: LegParams,
+    gait: GaitPhaseParams,
+    terrain: RegolithType,
+    slopes_deg: NDArray[np.float64],
+    cadences_hz: NDArray[np.float64],
+    priors: EnvelopePriors = EnvelopePriors(),
+) -> TerrainEnvelope:
+    duties = duty_grid(gait)
+    free = traction_margin(params, gait, terrain, slopes_deg, duties, anchored=False, priors=priors)
+    anch = traction_margin(params, gait, terrain, slopes_deg, duties, anchored=True, priors=priors)
+
+    beta = duties[None, None, :]
+    f = cadences_hz[None, :, None]
+    swing_ok = (1.0 - beta) >= f * priors.swing_time_min_s - 1e-12
+    settle_ok = beta >= f * priors.settle_time_s - 1e-12
+    free_ok = ((free >= priors.downslope_margin_min)
+               & (slopes_deg[:, None] <= priors.anchor_required_above_deg))[:, None, :]
+    anch_ok = (anch >= priors.downslope_margin_min)[:, None, :] & settle_ok
+    feasible = swing_ok & (free_ok | anch_ok)  # (slopes, cadences, duties)
+
+    any_ok = feasible.any(axis=2)
+    n = duties.size
+    i_min = np.argmax(feasible, axis=2)
+    i_max = n - 1 - np.argmax(feasible[:, :, ::-1], axis=2)
+    duty_min = np.where(any_ok, duties[i_min], np.nan)
+    duty_max = np.where(any_ok, duties[i_max], np.nan)
+
+    s_idx = np.arange(slopes_deg.size)[:, None]
+    top_free = free_ok[s_idx, 0, i_max]
+    margin = np.where(top_free, free[s_idx, i_max], anch[s_idx, i_max])
+    return TerrainEnvelope(
+        terrain=terrain.value,
+        duty_min=duty_min,
+        duty_max=duty_max,
+        anchored=any_ok & ~top_free,
+        traction_margin=np.where(any_ok, margin, np.nan),
+    )
+
+
+def _terrain_task(task: tuple) -> TerrainEnvelope:
+    return terrain_envelope(*task)
+
+
+def run_envelope(
+    slopes_deg: NDArray[np.float64] = SLOPES_DEG,
+    cadences_hz: NDArray[np.float64] = CADENCES_HZ,
+    workers: int | None = 1,
+    params: LegParams | None = None,
+    gait: GaitPhaseParams | None = None,
+    priors: EnvelopePriors = EnvelopePriors(),
+) -> EnvelopeSurface:
+    """Envelope surface over terrains x slopes x cadences (one task per terrain)."""
+    params = params or load_params()
+    gait = gait or load_gait_params()
+    slopes = np.asarray(slopes_deg, dtype=float)
+    cadences = np.asarray(cadences_hz, dtype=float)
+    tasks = [(params, gait, t, slopes, cadences, priors) for t in TERRAINS]
+    if workers == 1:
+        results = [_terrain_task(t) for t in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_terrain_task, tasks))
+    return EnvelopeSurface(slopes, cadences, duty_grid(gait), tuple(results))
+
+
+def surface_rows(surface: EnvelopeSurface) -> list[dict]:
+    rows = []
+    for env in surface.terrains:
+        for i, slope in enumerate(surface.slopes_deg):
+            for j, cadence in enumerate(surface.cadences_hz):
+                ok = math.isfinite(env.duty_max[i, j])
+                rows.append(
+                    {
+                        "terrain": env.terrain,
+                        "slope_deg": float(slope),
+                        "cadence_hz": float(cadence),
+                        "duty_min": float(env.duty_min[i, j]) if ok else "",
+                        "duty_max": float(env.duty_max[i, j]) if ok else "",
+                        "anchored": bool(env.anchored[i, j]),
+                        "traction_margin": round(float(env.traction_margin[i, j]), 4) if ok else "",
+                    }
+                )
+    return rows
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Derive the duty-cycle vs cadence envelope surface")
+    ap.add_argument("--out", default="", help="write the full surface as CSV")
+    ap.add_argument("--workers", type=int, default=None, help="processes (1 = inline)")
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+    surface = run_envelope(workers=args.workers)
+    elapsed = time.perf_counter() - t0
+    points = len(surface.terrains) * surface.slopes_deg.size * surface.cadences_hz.size * surface.duties.size
+    for env in surface.terrains:
+        fmax = surface.max_cadence_hz(env.terrain)
+        cols = [0, 15, 25, 30, 35, 45]
+        desc = "  ".join(f"{s}deg:{fmax[s]:.2f}Hz" for s in cols if s < fmax.size)
+        print(f"{env.terrain:10s} max cadence  {desc}")
+    print(f"{points / 1e6:.1f} M grid points in {elapsed:.2f} s")
+    if args.out:
+        rows = surface_rows(surface)
+        with open(args.out, "w", newline="", encoding="utf-8") as f:
+            w = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+            w.writeheader()
+            w.writerows(rows)
+        print(f"Wrote {args.out} ({len(rows)} rows)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""Time-stepped energy budget over one lunar day/night cycle.
+
+Driven by the `power` block of `cad/weevil_leg_params.yaml`:
+- `day_energy_available_Wh`: solar generation per 24 h of lunar daylight
+  (before dust derate); the panel output follows sun elevation across the
+  ~354 h day and is scaled so the daylight mean matches the budget
+- `dust_derate_factor`: generation multiplier at dawn; each scenario samples
+  around it and accumulates further dust loss through the day
+- `night_survival_load_Wh`: survival heating + keep-alive over the whole night
+  (hibernation: no other loads)
+- `recovery_reserve_Wh`: battery energy above the depth-of-discharge floor that
+  nominal operation must never touch (recovery-mode retries)
+
+Daytime loads are avionics + thermal (always on), mobility during a daily
+traverse window (anchoring overhead on steep ground, paused whenever the
+battery would dip into the reserve or, near dusk, the night budget) and comms
+windows, deferred through link dropouts (a daily window plus one multi-day
+outage) into a bounded telemetry buffer.
+Below `ops_min_sun_elevation_deg` (dawn, dusk) the vehicle hibernates at the
+survival load.
+
+The state of every ensemble member is an array entry, so the time loop runs
+once for the whole ensemble (`simulate()`); `sample_scenarios()` draws
+traverse schedules, dust levels, steep-ground fractions and dropouts.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import NDArray
+
+try:
+    import yaml  # type: ignore
+except Exception:  # pragma: no cover
+    yaml = None
+
+ROOT = Path(__file__).resolve().parents[1]
+PARAMS_PATH = ROOT / "cad" / "weevil_leg_params.yaml"
+sys.path.append(str(ROOT / "cad" / "scripts"))
+from simple_yaml import load_yaml_text  # type: ignore
+
+LUNAR_DAY_H = 354.4
+LUNAR_NIGHT_H = 354.4
+
+
+@dataclass(frozen=True)
+class PowerParams:
+    day_energy_available_wh: float
+    night_survival_load_wh: float
+    recovery_reserve_wh: float
+    dust_derate_factor: float
+
+
+def load_power_params(path: Path = PARAMS_PATH) -> PowerParams:
+    text = path.read_text(encoding="utf-8")
+    raw = yaml.safe_load(text) if yaml is not None else load_yaml_text(text)
+    p = raw["power"]
+    return PowerParams(
+        day_energy_available_wh=float(p["day_energy_available_Wh"]),
+        night_survival_load_wh=float(p["night_survival_load_Wh"]),
+        recovery_reserve_wh=float(p["recovery_reserve_Wh"]),
+        dust_derate_factor=float(p["dust_derate_factor"]),
+    )
+
+
+@dataclass(frozen=True)
+class EnergyPriors:
+    """Load and battery assumptions (POC values)."""
+    dt_h: float = 0.25
+    battery_capacity_wh: float = 350.0
+    battery_dod_max: float = 0.85
+    charge_efficiency: float = 0.95
+    avionics_w: float = 5.0
+    thermal_day_w: float = 2.0
+    mobility_w: float = 35.0
+    anchoring_overhead: float = 0.30      # extra mobility power fraction on steep ground
+    comms_w: float = 20.0
+    comms_window_h: float = 1.0           # per 24 h, starting at comms_hour
+    comms_hour: float = 18.0
+    telemetry_buffer_h: float = 8.0       # deferred comms the buffer can hold
+    traverse_start_hour: float = 8.0
+    ops_min_sun_elevation_deg: float = 10.0
+    drive_soc_margin_wh: float = 20.0     # above floor + reserve (+ night budget near dusk)
+    night_budget_lookahead_h: float = 72.0  # hours before dusk the night budget is held back
+
+    @property
+    def floor_wh(self) -> float:
+        return self.battery_capacity_wh * (1.0 - self.battery_dod_max)
+
+
+@dataclass(frozen=True)
+class Scenarios:
+    drive_h_per_day: NDArray[np.float64]
+    dust_derate: NDArray[np.float64]
+    dust_loss_per_day: NDArray[np.float64]     # fractional generation loss per lunar day
+    steep_fraction: NDArray[np.float64]
+    dropout_start_hour: NDArray[np.float64]
+    dropout_h_per_day: NDArray[np.float64]
+    outage_start_h: NDArray[np.float64]        # hours after dawn
+    outage_h: NDArray[np.float64]
+
+    def __len__(self) -> int:
+        return self.drive_h_per_day.size
+
+
+@dataclass(frozen=True)
+class ScenarioPriors:
+    drive_h_per_day: tuple[float, float] = (3.0, 5.0)
+    dust_derate_sigma: float = 0.04
+    dust_loss_per_day: tuple[float, float] = (0.0, 0.05)
+    steep_fraction: tuple[float, float] = (0.0, 0.1)
+    dropout_h_per_day: tuple[float, float] = (0.0, 1.0)
+    outage_h: tuple[float, float] = (0.0, 0.0)   # contiguous link outage, once per lunar day
+
+
+def sample_scenarios(n: int, power: PowerParams, priors: ScenarioPriors = ScenarioPriors(), seed: int = 20260301) -> Scenarios:
+    rng = np.random.default_rng(seed)
+    return Scenarios(
+        drive_h_per_day=rng.uniform(*priors.drive_h_per_day, n),
+        dust_derate=np.clip(rng.normal(power.dust_derate_factor, priors.dust_derate_sigma, n), 0.5, 1.0),
+        dust_loss_per_day=rng.uniform(*priors.dust_loss_per_day, n),
+        steep_fraction=rng.uniform(*priors.steep_fraction, n),
+        dropout_start_hour=rng.uniform(0.0, 24.0, n),
+        dropout_h_per_day=rng.uniform(*priors.dropout_h_per_day, n),
+        outage_start_h=rng.uniform(0.0, LUNAR_DAY_H, n),
+        outage_h=rng.uniform(*priors.outage_h, n),
+    )
+
+
+@dataclass(frozen=True)
+class EnsembleResult:
+    min_soc_wh: NDArray[np.float64]        # whole cycle
+    dusk_soc_wh: NDArray[np.float64]
+    dawn_soc_wh: NDArray[np.float64]       # end of night
+    unmet_wh: NDArray[np.float64]          # load the battery could not supply
+    generation_wh: NDArray[np.float64]
+    load_wh: NDArray[np.float64]
+    drive_h: NDArray[np.float64]
+    scheduled_drive_h: NDArray[np.float64]
+    telemetry_loss_pct: NDArray[np.float64]
+    reserve_kept: NDArray[np.bool_]        # SOC never below floor + reserve
+    night_survived: NDArray[np.bool_]      # no unmet survival load
+
+
+def _in_window(hour: float, start: NDArray | float, length: NDArray | float) -> NDArray[np.bool_]:
+    return ((hour - start) % 24.0) < length
+
+
+def simulate(power: PowerParams, scen: Scenarios, priors: EnergyPriors = EnergyPriors()) -> EnsembleResult:
+    """Dawn-to-dawn simulation for every scenario at once, starting from the post-night SOC."""
+    n = len(scen)
+    dt = priors.dt_h
+    day_steps = int(round(LUNAR_DAY_H / dt))
+    night_steps = int(round(LUNAR_NIGHT_H / dt))
+    peak_w = power.day_energy_available_wh / 24.0 * math.pi / 2.0   # daylight mean of sin = 2/pi
+    survival_w = power.night_survival_load_wh / LUNAR_NIGHT_H
+    floor = priors.floor_wh
+    protect = floor + power.recovery_reserve_wh
+    cap = priors.battery_capacity_wh
+    sin_min = math.sin(math.radians(priors.ops_min_sun_elevation_deg))
+    drive_w = priors.mobility_w * (1.0 + priors.anchoring_overhead * scen.steep_fraction)
+    buffer_wh = priors.telemetry_buffer_h * priors.comms_w
+
+    soc = np.full(n, cap - power.night_survival_load_wh)
+    min_soc = soc.copy()
+    unmet = np.zeros(n)
+    gen_total = np.zeros(n)
+    load_total = np.zeros(n)
+    drive_h = np.zeros(n)
+    sched_h = np.zeros(n)
+    backlog = np.zeros(n)
+    comms_due = np.zeros(n)
+    comms_lost = np.zeros(n)
+
+    for k in range(day_steps):
+        t = (k + 0.5) * dt
+        hour = t % 24.0
+        sun = math.sin(math.pi * t / LUNAR_DAY_H)
+        derate = scen.dust_derate * (1.0 - scen.dust_loss_per_day * t / LUNAR_DAY_H)
+        gen = peak_w * sun * derate
+        # Drive only while the sun is up and the battery stays clear of reserve + night budget.
+        night_budget = power.night_survival_load_wh if LUNAR_DAY_H - t < priors.night_budget_lookahead_h else 0.0
+        scheduled = _in_window(hour, priors.traverse_start_hour, scen.drive_h_per_day)
+        base_w = priors.avionics_w + priors.thermal_day_w
+        after = soc + (gen - base_w - drive_w) * dt
+        drive = scheduled & (sun >= sin_min) & (after > protect + night_budget + priors.drive_soc_margin_wh)
+        in_outage = (t >= scen.outage_start_h) & (t < scen.outage_start_h + scen.outage_h)
+        link_up = ~_in_window(hour, scen.dropout_start_hour, scen.dropout_h_per_day) & ~in_outage
+        if _in_window(hour, priors.comms_hour, priors.comms_window_h):
+            comms_due += priors.comms_w * dt
+            backlog += priors.comms_w * dt
+        overflow = np.maximum(backlog - buffer_wh, 0.0)
+        comms_lost += overflow
+        backlog -= overflow
+        # Catch-up after an outage must not spend the night budget either.
+        comms = np.where(link_up & (soc + (gen - base_w - priors.comms_w) * dt > protect + night_budget),
+                         np.minimum(backlog, priors.comms_w * dt), 0.0)
+        backlog -= comms
+
+        if sun >= sin_min:
+            load = (base_w + np.where(drive, drive_w, 0.0)) * dt + comms
+        else:  # low sun: hibernate as at night
+            load = np.full(n, survival_w * dt)
+        net = gen * dt - load
+        soc = soc + np.where(net > 0.0, net * priors.charge_efficiency, net)
+        unmet += np.maximum(floor - soc, 0.0)
+        soc = np.clip(soc, floor, cap)
+        np.minimum(min_soc, soc, out=min_soc)
+        gen_total += gen * dt
+        load_total += load
+        drive_h += drive * dt
+        sched_h += scheduled * dt
+
+    # Night: constant survival draw, so the minimum is at dawn and needs no stepping.
+    dusk = soc.copy()
+    night_wh = survival_w * dt * night_steps
+    unmet_night = np.maximum(floor - (dusk - night_wh), 0.0)
+    soc = np.maximum(dusk - night_wh, floor)
+    np.minimum(min_soc, soc, out=min_soc)
+    load_total += night_wh
+
+    return EnsembleResult(
+        min_soc_wh=min_soc,
+        dusk_soc_wh=dusk,
+        dawn_soc_wh=soc,
+        unmet_wh=unmet + unmet_night,
+        generation_wh=gen_total,
+        load_wh=load_total,
+        drive_h=drive_h,
+        scheduled_drive_h=sched_h,
+        telemetry_loss_pct=100.0 * comms_lost / np.maximum(comms_due, 1e-12),
+        reserve_kept=min_soc >= protect - 1e-9,
+        night_survived=unmet_night <= 1e-9,
+    )
+
+
+def summarize(res: EnsembleResult) -> dict[str, float]:
+    return {
+        "scenarios": int(res.min_soc_wh.size),
+        "p_reserve_kept": float(np.mean(res.reserve_kept)),
+        "p_night_survived": float(np.mean(res.night_survived)),
+        "min_soc_p05_wh": float(np.percentile(res.min_soc_wh, 5)),
+        "dusk_soc_p05_wh": float(np.percentile(res.dusk_soc_wh, 5)),
+        "drive_fraction_median": float(np.median(res.drive_h / np.maximum(res.scheduled_drive_h, 1e-12))),
+        "telemetry_loss_pct_p95": float(np.percentile(res.telemetry_loss_pct, 95)),
+        "energy_margin_p05_wh": float(np.percentile(res.generation_wh - res.load_wh, 5)),
+    }
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Lunar-cycle energy budget ensemble")
+    ap.add_argument("--scenarios", type=int, default=10000)
+    ap.add_argument("--seed", type=int, default=20260301)
+    args = ap.parse_args()
+
+    power = load_power_params()
+    scen = sample_scenarios(args.scenarios, power, seed=args.seed)
+    t0 = time.perf_counter()
+    res = simulate(power, scen)
+    elapsed = time.perf_counter() - t0
+    for k, v in summarize(res).items():
+        print(f"{k:24s} {v:.4g}")
+    print(f"{args.scenarios} scenarios x {int(round((LUNAR_DAY_H + LUNAR_NIGHT_H) / EnergyPriors().dt_h))} steps "
+          f"in {elapsed:.2f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
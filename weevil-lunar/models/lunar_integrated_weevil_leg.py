@@ -19,6 +19,11 @@ try:
 except Exception:  # pragma: no cover
     yaml = None
 
+try:
+    import numpy as np
+except Exception:  # pragma: no cover
+    np = None  # scalar path stays stdlib-only; evaluate_leg_states needs numpy
+
 ROOT = Path(__file__).resolve().parents[1]
 PARAMS_PATH = ROOT / "cad" / "weevil_leg_params.yaml"
 
@@ -27,6 +32,18 @@ import sys
 sys.path.append(str(ROOT / "cad" / "scripts"))
 from simple_yaml import load_yaml_text  # type: ignore
 
+# Opt-in span/counter instrumentation shared with the POC contact model;
+# no-ops when the POC directory is not shipped alongside.
+sys.path.append(str(ROOT.parent / "results" / "GPT" / "Robotics"))
+try:
+    from weevil_profiling import count, instrument  # type: ignore
+except ImportError:  # pragma: no cover
+    def count(name: str, n: int = 1) -> None:
+        return None
+
+    def instrument(name: str | None = None):
+        return lambda fn: fn
+
 EARTH_G = 9.81
 LUNAR_G = 1.62
 
@@ -56,6 +73,10 @@ class LegParams:
     axis_target_deg: float
     axis_tol_deg: float
     cleat_forward_gain: float
+    cleat_lateral_gain: float
+    foot_radius_mm: float
+    body_mass_kg: float
+    leg_count: int
 
 
 @dataclass(frozen=True)
@@ -67,6 +88,7 @@ class EvalResult:
     traction_n: float
 
 
+@instrument()
 def load_params(path: Path = PARAMS_PATH) -> LegParams:
     text = path.read_text(encoding="utf-8")
     raw = yaml.safe_load(text) if yaml is not None else load_yaml_text(text)
@@ -81,6 +103,10 @@ def load_params(path: Path = PARAMS_PATH) -> LegParams:
         axis_target_deg=float(raw["proximal_gimbal"]["axis_orthogonality_target_deg"]),
         axis_tol_deg=float(raw["proximal_gimbal"]["axis_orthogonality_tolerance_deg"]),
         cleat_forward_gain=float(raw["foot"]["cleat_forward_gain"]),
+        cleat_lateral_gain=float(raw["foot"]["cleat_lateral_gain"]),
+        foot_radius_mm=float(raw["foot"]["radius_mm"]),
+        body_mass_kg=float(raw["body"]["mass_total_kg"]),
+        leg_count=int(raw["body"]["leg_count"]),
     )
 
 
@@ -92,6 +118,7 @@ def axis_is_within_tolerance(actual_deg: float, target_deg: float, tol_deg: floa
     return abs(actual_deg - target_deg) <= tol_deg
 
 
+@instrument()
 def evaluate_leg_state(state: LegState, params: LegParams, contact: ContactModel) -> EvalResult:
     reachable = (
         params.coxa_range[0] <= state.coxa_yaw_deg <= params.coxa_range[1]
@@ -122,6 +149,64 @@ def evaluate_leg_state(state: LegState, params: LegParams, contact: ContactModel
     )
 
 
+@dataclass(frozen=True)
+class EvalBatch:
+    """Array counterpart of `EvalResult` (one entry per evaluated state)."""
+    reachable: "np.ndarray"
+    tip_x_mm: "np.ndarray"
+    tip_z_mm: "np.ndarray"
+    normal_n: "np.ndarray"
+    traction_n: "np.ndarray"
+
+
+@instrument()
+def evaluate_leg_states(
+    coxa_yaw_deg: "np.ndarray",
+    femur_pitch_deg: "np.ndarray",
+    tibia_theta_deg: "np.ndarray",
+    params: LegParams,
+    regolith_mu: "np.ndarray | float",
+    internal_mu: "np.ndarray | float",
+) -> EvalBatch:
+    """Vectorized `evaluate_leg_state`; contact coefficients broadcast against the states."""
+    if np is None:
+        raise RuntimeError("evaluate_leg_states requires numpy")
+    count("states", int(np.size(femur_pitch_deg)))
+    coxa = np.asarray(coxa_yaw_deg, dtype=float)
+    femur = np.asarray(femur_pitch_deg, dtype=float)
+    tibia = np.asarray(tibia_theta_deg, dtype=float)
+    coxa, femur, tibia, reg_mu, int_mu = np.broadcast_arrays(
+        coxa, femur, tibia, np.asarray(regolith_mu, dtype=float), np.asarray(internal_mu, dtype=float)
+    )
+
+    reachable = (
+        (params.coxa_range[0] <= coxa) & (coxa <= params.coxa_range[1])
+        & (params.femur_range[0] <= femur) & (femur <= params.femur_range[1])
+        & (np.abs(tibia) <= params.tibia_range_total_deg / 2.0)
+    )
+
+    femur_rad = np.radians(femur)
+    ext_mm = np.clip(
+        helical_displacement_mm(tibia, params.tibia_pitch_mm_per_rev),
+        -params.tibia_stroke_mm / 2.0,
+        params.tibia_stroke_mm / 2.0,
+    )
+    reach_mm = params.femur_link_mm + params.tibia_stroke_mm + ext_mm
+
+    normal_n = np.full(femur.shape, params.preload_n)
+    terrain_term = np.maximum(0.0, reg_mu * normal_n * params.cleat_forward_gain)
+    efficiency = np.maximum(0.0, 1.0 - int_mu)
+    traction_n = terrain_term * efficiency * (LUNAR_G / EARTH_G)
+
+    return EvalBatch(
+        reachable=reachable,
+        tip_x_mm=reach_mm * np.cos(femur_rad),
+        tip_z_mm=reach_mm * np.sin(femur_rad),
+        normal_n=normal_n,
+        traction_n=traction_n,
+    )
+
+
 def sample_states(params: LegParams) -> Iterable[LegState]:
     for c in (params.coxa_range[0], 0.0, params.coxa_range[1]):
         for f in (params.femur_range[0], 0.0, params.femur_range[1]):
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""Autonomy mode classifier over health telemetry streams.
+
+Modes (priority order): recovery > steep_slope > nominal, from
+- torque / thermal margin: recovery latches when either drops below
+  `recovery_enter` and releases once both are back at or above `recovery_exit`
+- friction index: steep_slope latches above `steep_enter` and releases at or
+  below `steep_exit`
+Each latch is a Schmitt trigger; samples with a non-finite channel hold both
+latches. A mode is left only after its minimum dwell; entering recovery
+preempts the dwell when `recovery_preempts` is set. With equal enter/exit
+thresholds and zero dwell this reduces to `decide_mode` in
+`verification/test_autonomy_health_planner.py`.
+
+`ModeEngine.update()` classifies (samples, 3) blocks: latches come from the
+index of the last set/reset event (maximum.accumulate); dwell is applied per
+run of constant candidate mode, so the Python loop runs once per candidate
+change rather than per sample. `ModeEngine.step()` is the online
+single-sample path with the same state and records its own call latency.
+`replay_threshold_sets()` replays a memory-mapped `.npy` log against many
+threshold sets in parallel.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+MODES = ("nominal", "steep_slope", "recovery")
+NOMINAL, STEEP_SLOPE, RECOVERY = range(3)
+TELEMETRY_COLUMNS = ("torque_margin", "thermal_margin", "friction_index")
+BLOCK_SAMPLES = 1 << 20
+LATENCY_WINDOW = 100_000
+_NEVER = 1 << 62
+
+
+@dataclass(frozen=True)
+class ModeThresholds:
+    recovery_enter: float = 0.15
+    recovery_exit: float = 0.20
+    steep_enter: float = 0.75
+    steep_exit: float = 0.70
+    dwell_nominal_s: float = 1.0
+    dwell_steep_s: float = 2.0
+    dwell_recovery_s: float = 5.0
+    recovery_preempts: bool = True
+
+    @classmethod
+    def scalar(cls) -> "ModeThresholds":
+        """No hysteresis, no dwell: same decisions as the v0.1 `decide_mode`."""
+        return cls(recovery_exit=cls.recovery_enter, steep_exit=cls.steep_enter,
+                   dwell_nominal_s=0.0, dwell_steep_s=0.0, dwell_recovery_s=0.0)
+
+    def dwell_samples(self, rate_hz: float) -> tuple[int, int, int]:
+        return tuple(int(math.ceil(d * rate_hz - 1e-9)) for d in
+                     (self.dwell_nominal_s, self.dwell_steep_s, self.dwell_recovery_s))  # type: ignore[return-value]
+
+
+@dataclass(frozen=True)
+class Transition:
+    sample: int
+    from_mode: str
+    to_mode: str
+
+
+def _latch(set_ev: NDArray[np.bool_], reset_ev: NDArray[np.bool_], carry: bool) -> NDArray[np.bool_]:
+    idx = np.arange(1, set_ev.size + 1)
+    last_set = np.maximum.accumulate(np.where(set_ev, idx, 0))
+    last_reset = np.maximum.accumulate(np.where(reset_ev, idx, 0))
+    return np.where((last_set == 0) & (last_reset == 0), carry, last_set > last_reset)
+
+
+@dataclass
+class ModeEngine:
+    thresholds: ModeThresholds = ModeThresholds()
+    rate_hz: float = 10.0
+    # carried state
+    mode: int = field(init=False, default=NOMINAL)
+    age: int = field(init=False, default=_NEVER)  # samples in mode as of the previous sample
+    recovery_latch: bool = field(init=False, default=False)
+    steep_latch: bool = field(init=False, default=False)
+    samples: int = field(init=False, default=0)
+    transitions: list[Transition] = field(init=False, default_factory=list)
+    mode_samples: NDArray[np.int64] = field(init=False)
+    _dwell: tuple[int, int, int] = field(init=False)
+    _latency_ns: NDArray[np.int64] = field(init=False)
+    _latency_n: int = field(init=False, default=0)
+
+    def __post_init__(self) -> None:
+        self.mode_samples = np.zeros(len(MODES), dtype=np.int64)
+        self._dwell = self.thresholds.dwell_samples(self.rate_hz)
+        self._latency_ns = np.zeros(LATENCY_WINDOW, dtype=np.int64)
+
+    def _record(self, sample: int, old: int, new: int) -> None:
+        self.transitions.append(Transition(sample, MODES[old], MODES[new]))
+
+    def update(self, block: NDArray[np.floating]) -> NDArray[np.int8]:
+        """Classify a (samples, 3) block in TELEMETRY_COLUMNS order; returns mode codes."""
+        n = block.shape[0]
+        if n == 0:
+            return np.zeros(0, dtype=np.int8)
+        th = self.thresholds
+        torque, thermal, friction = (np.asarray(block[:, k], dtype=np.float64) for k in range(3))
+        valid = np.isfinite(torque) & np.isfinite(thermal) & np.isfinite(friction)
+        rec = _latch(
+            valid & ((torque < th.recovery_enter) | (thermal < th.recovery_enter)),
+            valid & (torque >= th.recovery_exit) & (thermal >= th.recovery_exit),
+            self.recovery_latch,
+        )
+        steep = _latch(valid & (friction > th.steep_enter), valid & (friction <= th.steep_exit), self.steep_latch)
+        candidate = np.where(rec, RECOVERY, np.where(steep, STEEP_SLOPE, NOMINAL)).astype(np.int8)
+
+        starts = np.concatenate(([0], np.flatnonzero(candidate[1:] != candidate[:-1]) + 1))
+        ends = np.append(starts[1:], n)
+        mode, entered = self.mode, -(min(self.age, _NEVER) + 1)
+        switch_at, switch_to = [0], [mode]
+        for s, e, c in zip(starts.tolist(), ends.tolist(), candidate[starts].tolist()):
+            if c == mode:
+                continue
+            sw = s if (c == RECOVERY and th.recovery_preempts) else max(s, entered + self._dwell[mode])
+            if sw < e:
+                self._record(self.samples + sw, mode, c)
+                mode, entered = c, sw
+                switch_at.append(sw)
+                switch_to.append(c)
+        modes = np.repeat(np.asarray(switch_to, dtype=np.int8), np.diff(np.append(switch_at, n)))
+
+        self.mode, self.age = mode, n - 1 - entered
+        self.recovery_latch, self.steep_latch = bool(rec[-1]), bool(steep[-1])
+        self.mode_samples += np.bincount(modes, minlength=len(MODES))
+        self.samples += n
+        return modes
+
+    def step(self, torque_margin: float, thermal_margin: float, friction_index: float) -> str:
+        """Online path: classify one sample, return the mode name."""
+        t0 = time.perf_counter_ns()
+        th = self.thresholds
+        if math.isfinite(torque_margin) and math.isfinite(thermal_margin) and math.isfinite(friction_index):
+            if torque_margin < th.recovery_enter or thermal_margin < th.recovery_enter:
+                self.recovery_latch = True
+            elif torque_margin >= th.recovery_exit and thermal_margin >= th.recovery_exit:
+                self.recovery_latch = False
+            if friction_index > th.steep_enter:
+                self.steep_latch = True
+            elif friction_index <= th.steep_exit:
+                self.steep_latch = False
+        c = RECOVERY if self.recovery_latch else STEEP_SLOPE if self.steep_latch else NOMINAL
+        age = self.age + 1
+        if c != self.mode and ((c == RECOVERY and th.recovery_preempts) or age >= self._dwell[self.mode]):
+            self._record(self.samples, self.mode, c)
+            self.mode, age = c, 0
+        self.age = age
+        self.mode_samples[self.mode] += 1
+        self.samples += 1
+        self._latency_ns[self._latency_n % LATENCY_WINDOW] = time.perf_counter_ns() - t0
+        self._latency_n += 1
+        return MODES[self.mode]
+
+    def latency_stats(self) -> dict[str, float]:
+        """step() latency over the last LATENCY_WINDOW calls (microseconds)."""
+        lat = self._latency_ns[: min(self._latency_n, LATENCY_WINDOW)] / 1000.0
+        if not lat.size:
+            return {"calls": 0, "p50_us": math.nan, "p99_us": math.nan, "max_us": math.nan}
+        p50, p99 = np.percentile(lat, [50, 99])
+        return {"calls": self._latency_n, "p50_us": float(p50), "p99_us": float(p99), "max_us": float(lat.max())}
+
+    def summary(self) -> dict[str, float]:
+        hours = self.samples / self.rate_hz / 3600.0
+        out: dict[str, float] = {"samples": self.samples, "transitions": len(self.transitions)}
+        out["transitions_per_hour"] = len(self.transitions) / hours if hours else math.nan
+        out["recovery_entries"] = sum(t.to_mode == "recovery" for t in self.transitions)
+        for k, name in enumerate(MODES):
+            out[f"{name}_fraction"] = float(self.mode_samples[k] / self.samples) if self.samples else math.nan
+        return out
+
+
+def iter_health_telemetry(
+    duration_s: float,
+    rate_hz: float = 10.0,
+    block_s: float = 3600.0,
+    seed: int = 11,
+) -> Iterator[NDArray[np.float32]]:
+    """Yield (samples, 3) blocks of simulated health telemetry.
+
+    Torque margin wanders around 0.4 with short load-spike dips, thermal margin
+    follows a slow day/night swing, friction index steps between terrain
+    patches; all carry sensor noise so raw thresholds chatter.
+    """
+    rng = np.random.default_rng(seed)
+    total = int(round(duration_s * rate_hz))
+    block = max(1, int(round(block_s * rate_hz)))
+    patch = 0.3
+    for start in range(0, total, block):
+        n = min(block, total - start)
+        t = (start + np.arange(n)) / rate_hz
+        dips = np.convolve(rng.random(n) < 1.0 / (600.0 * rate_hz), np.ones(int(20 * rate_hz)), "same") > 0
+        torque = 0.40 + 0.08 * np.sin(2 * np.pi * t / 5400.0) - 0.30 * dips + rng.normal(0, 0.02, n)
+        thermal = 0.35 + 0.12 * np.sin(2 * np.pi * t / 86400.0) + rng.normal(0, 0.02, n)
+        change = np.flatnonzero(rng.random(n) < 1.0 / (300.0 * rate_hz))
+        levels = np.concatenate(([patch], rng.uniform(0.2, 0.95, change.size)))
+        patch = float(levels[-1])
+        friction = levels[np.searchsorted(change, np.arange(n), side="right")] + rng.normal(0, 0.03, n)
+        yield np.column_stack([torque, thermal, friction]).astype(np.float32)
+
+
+def _replay_task(task: tuple[str, ModeThresholds, float, int]) -> dict[str, float]:
+    path, thresholds, rate_hz, block = task
+    data = np.load(path, mmap_mode="r")
+    engine = ModeEngine(thresholds, rate_hz)
+    for start in range(0, data.shape[0], block):
+        engine.update(data[start: start + block])
+    return engine.summary()
+
+
+def replay_threshold_sets(
+    telemetry_path: Path,
+    threshold_sets: Sequence[ModeThresholds],
+    rate_hz: float = 10.0,
+    workers: int | None = None,
+    block_samples: int = BLOCK_SAMPLES,
+) -> list[dict[str, float]]:
+    """Summary per threshold set for a (samples, 3) `.npy` log (``workers=1`` runs inline)."""
+    tasks = [(str(telemetry_path), th, rate_hz, block_samples) for th in threshold_sets]
+    if workers == 1:
+        return [_replay_task(t) for t in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_replay_task, tasks))
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Replay health telemetry through the mode classifier")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    sim = sub.add_parser("simulate", help="write simulated telemetry as a (samples, 3) float32 .npy")
+    sim.add_argument("out")
+    sim.add_argument("--days", type=float, default=14.0)
+    sim.add_argument("--rate", type=float, default=10.0)
+    rep = sub.add_parser("replay", help="replay a .npy log against a hysteresis-band sweep")
+    rep.add_argument("telemetry")
+    rep.add_argument("--rate", type=float, default=10.0)
+    rep.add_argument("--workers", type=int, default=None)
+    args = ap.parse_args()
+
+    if args.cmd == "simulate":
+        blocks = list(iter_health_telemetry(args.days * 86400.0, args.rate))
+        np.save(args.out, np.concatenate(blocks))
+        print(f"Wrote {args.out} ({sum(b.shape[0] for b in blocks)} samples)")
+        return 0
+
+    sets = [
+        ModeThresholds(recovery_exit=0.15 + band, steep_exit=0.75 - band, dwell_steep_s=dwell, dwell_nominal_s=dwell)
+        for band in (0.0, 0.025, 0.05, 0.1)
+        for dwell in (0.0, 2.0, 10.0)
+    ]
+    t0 = time.perf_counter()
+    results = replay_threshold_sets(Path(args.telemetry), sets, args.rate, args.workers)
+    elapsed = time.perf_counter() - t0
+    for th, r in zip(sets, results):
+        print(f"band {th.recovery_exit - th.recovery_enter:.3f} dwell {th.dwell_steep_s:4.1f}s: "
+              f"{r['transitions_per_hour']:8.1f} transitions/h  recovery {r['recovery_fraction']:.3f}  "
+              f"steep {r['steep_slope_fraction']:.3f}")
+    samples = int(results[0]["samples"]) if results else 0
+    print(f"{len(sets)} threshold sets x {samples} samples in {elapsed:.1f} s")
+
+    engine = ModeEngine(ModeThresholds(), args.rate)
+    for row in np.load(args.telemetry, mmap_mode="r")[:100_000].tolist():
+        engine.step(*row)
+    lat = engine.latency_stats()
+    print(f"online step(): p50 {lat['p50_us']:.2f} us  p99 {lat['p99_us']:.2f} us  max {lat['max_us']:.1f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
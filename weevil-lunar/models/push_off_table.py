@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""Table-driven steep-slope push-off gate.
+
+The state machine's push-off decision is a table of deny guards, evaluated in
+order; push-off is allowed when no guard fires, otherwise the first firing
+guard is the reason. `compile_table()` turns guards into column indices,
+comparison ufuncs and thresholds so `evaluate()` runs over arrays of
+(slope_deg, anchored, margin_down, margin_lat) points with no per-point Python.
+
+- `PUSH_OFF_TABLE` mirrors `push_off_allowed` in
+  `verification/test_steep_slope_state_machine.py`
+- `spec_table()` compiles the reference guards from the clauses of
+  `specs/foot_anchoring_spec.md` (anchoring required above the slope
+  threshold; downslope / lateral margin minimums)
+- `dense_grid()` sweeps all four inputs, with every guard threshold and its
+  neighbouring floats inserted so ``<`` vs ``<=`` slips show up;
+  `decision_boundaries()` lists where the decision flips along each axis
+- `physics_margins()` derives the margins per terrain and slope from the
+  regolith contact model (cone-margin rule of `axis_sensitivity`)
+"""
+
+from __future__ import annotations
+
+import operator
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+ROOT = Path(__file__).resolve().parents[1]
+ROBOTICS_DIR = ROOT.parent / "results" / "GPT" / "Robotics"
+sys.path.append(str(ROOT))
+sys.path.append(str(ROBOTICS_DIR))
+
+from models.axis_sensitivity import TERRAINS, TrialPriors
+from models.lunar_integrated_weevil_leg import LUNAR_G, LegParams, load_params
+from regolith_contact_model import FootGeometry, RegolithContactModel, RegolithProperties  # type: ignore
+
+SPEC_PATH = ROOT / "specs" / "foot_anchoring_spec.md"
+COLUMNS = ("slope_deg", "anchored", "margin_down", "margin_lat")
+OPS: dict[str, Callable[[NDArray, float], NDArray]] = {
+    "<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge,
+}
+ALLOWED = -1
+
+
+@dataclass(frozen=True)
+class Guard:
+    """Deny push-off when ``column op threshold`` (unless anchored, if set)."""
+    name: str
+    column: str
+    op: str
+    threshold: float
+    unless_anchored: bool = False
+
+
+PUSH_OFF_TABLE = (
+    Guard("anchor_required", "slope_deg", ">", 25.0, unless_anchored=True),
+    Guard("downslope_margin", "margin_down", "<", 1.05),
+    Guard("lateral_margin", "margin_lat", "<", 1.20),
+)
+
+
+@dataclass(frozen=True)
+class CompiledTable:
+    guards: tuple[Guard, ...]
+    columns: tuple[int, ...]
+    ops: tuple[Callable[[NDArray, float], NDArray], ...]
+    thresholds: tuple[float, ...]
+    unless_anchored: tuple[bool, ...]
+
+
+def compile_table(guards: Sequence[Guard]) -> CompiledTable:
+    for g in guards:
+        if g.column not in COLUMNS or g.column == "anchored":
+            raise ValueError(f"guard {g.name}: unknown column {g.column!r}")
+        if g.op not in OPS:
+            raise ValueError(f"guard {g.name}: unknown op {g.op!r}")
+    return CompiledTable(
+        tuple(guards),
+        tuple(COLUMNS.index(g.column) for g in guards),
+        tuple(OPS[g.op] for g in guards),
+        tuple(float(g.threshold) for g in guards),
+        tuple(g.unless_anchored for g in guards),
+    )
+
+
+def evaluate(table: CompiledTable, points: Sequence[NDArray]) -> tuple[NDArray[np.bool_], NDArray[np.int8]]:
+    """(allowed, reason) per point; ``points`` holds one array per COLUMNS entry.
+
+    reason is the index of the first firing guard, ALLOWED (-1) when none fires.
+    """
+    anchored = np.asarray(points[1], dtype=bool)
+    shape = np.broadcast_shapes(*(np.shape(p) for p in points))
+    reason = np.full(shape, ALLOWED, dtype=np.int8)
+    for k in range(len(table.guards) - 1, -1, -1):  # reverse, so the first guard wins
+        fires = table.ops[k](np.asarray(points[table.columns[k]]), table.thresholds[k])
+        if table.unless_anchored[k]:
+            fires = fires & ~anchored
+        reason[np.broadcast_to(fires, shape)] = k
+    return reason == ALLOWED, reason
+
+
+def spec_table(path: Path = SPEC_PATH) -> tuple[Guard, ...]:
+    """Reference guards from the foot/anchoring spec text."""
+    text = path.read_text(encoding="utf-8")
+    clauses = {
+        "anchor_required": r"required for slopes\s*>\s*([0-9.]+)\s*°",
+        "downslope_margin": r"downslope margin\s*>=\s*([0-9.]+)",
+        "lateral_margin": r"lateral margin\s*>=\s*([0-9.]+)",
+    }
+    values = {}
+    for name, pattern in clauses.items():
+        m = re.search(pattern, text)
+        if m is None:
+            raise ValueError(f"{path}: no clause matching {pattern!r}")
+        values[name] = float(m.group(1))
+    return (
+        Guard("anchor_required", "slope_deg", ">", values["anchor_required"], unless_anchored=True),
+        Guard("downslope_margin", "margin_down", "<", values["downslope_margin"]),
+        Guard("lateral_margin", "margin_lat", "<", values["lateral_margin"]),
+    )
+
+
+def _axis(lo: float, hi: float, step: float, probes: Sequence[float]) -> NDArray[np.float64]:
+    base = np.round(np.arange(lo, hi + step / 2, step), 9)
+    extra = [x for t in probes for x in (np.nextafter(t, -np.inf), t, np.nextafter(t, np.inf))]
+    return np.unique(np.concatenate([base, extra]))
+
+
+def dense_grid(
+    tables: Sequence[CompiledTable],
+    slope_deg: tuple[float, float, float] = (0.0, 50.0, 0.1),
+    margin_down: tuple[float, float, float] = (0.8, 1.4, 0.005),
+    margin_lat: tuple[float, float, float] = (0.9, 1.5, 0.005),
+) -> tuple[NDArray[np.float64], ...]:
+    """Axes (slope, anchored, margin_down, margin_lat) covering every guard threshold of ``tables``."""
+    probes: dict[int, list[float]] = {0: [], 2: [], 3: []}
+    for t in tables:
+        for col, th in zip(t.columns, t.thresholds):
+            probes[col].append(th)
+    return (
+        _axis(*slope_deg, probes[0]),
+        np.array([0.0, 1.0]),
+        _axis(*margin_down, probes[2]),
+        _axis(*margin_lat, probes[3]),
+    )
+
+
+def grid_points(axes: Sequence[NDArray]) -> list[NDArray]:
+    """Broadcastable views of the full grid (no materialized copies)."""
+    n = len(axes)
+    return [a.reshape([-1 if i == k else 1 for i in range(n)]) for k, a in enumerate(axes)]
+
+
+def decision_boundaries(axes: Sequence[NDArray], allowed: NDArray[np.bool_]) -> list[dict]:
+    """Every (axis, lower, upper) grid interval across which the decision flips somewhere."""
+    out = []
+    for k, name in enumerate(COLUMNS):
+        flips = np.diff(allowed.astype(np.int8), axis=k) != 0
+        counts = flips.sum(axis=tuple(i for i in range(allowed.ndim) if i != k))
+        for i in np.flatnonzero(counts):
+            out.append({"axis": name, "lower": float(axes[k][i]), "upper": float(axes[k][i + 1]), "flips": int(counts[i])})
+    return out
+
+
+def physics_margins(
+    slopes_deg: NDArray[np.float64],
+    anchored: bool,
+    params: LegParams | None = None,
+    priors: TrialPriors = TrialPriors(),
+) -> dict[str, tuple[NDArray[np.float64], NDArray[np.float64]]]:
+    """(margin_down, margin_lat) per terrain over ``slopes_deg`` for free or anchored stance.
+
+    Tripod support carries the slope load; anchored feet add the commanded cleat
+    preload and directional cleat gains. Demand angles use the upper push-off
+    factor downslope and the bare slope laterally.
+    """
+    params = params or load_params()
+    slope = np.radians(np.asarray(slopes_deg, dtype=float))
+    normal = params.body_mass_kg * LUNAR_G / priors.stance_legs * np.cos(slope)
+    preload = params.preload_n * priors.preload_command_ratio if anchored else 0.0
+    demand_fwd = np.degrees(np.arctan(priors.push_off_factor[1] * np.tan(slope)))
+    demand_lat = np.degrees(slope)
+    out = {}
+    for terrain in TERRAINS:
+        foot = FootGeometry.circular(
+            radius=params.foot_radius_mm / 1000.0,
+            cleat_gain_forward=params.cleat_forward_gain,
+            cleat_gain_lateral=params.cleat_lateral_gain,
+            cleat_engage_threshold_preload=params.preload_n,
+        )
+        model = RegolithContactModel(RegolithProperties.from_type(terrain), foot, gravity=LUNAR_G)
+        c = model.compute_contact_forces_with_preload_batch(normal, preload_normal=preload, use_directional_cleats=anchored)
+        with np.errstate(divide="ignore"):
+            out[terrain.value] = (
+                np.where(demand_fwd > 0, c.friction_cone_forward_angle / demand_fwd, np.inf),
+                np.where(demand_lat > 0, c.friction_cone_lateral_angle / demand_lat, np.inf),
+            )
+    return out
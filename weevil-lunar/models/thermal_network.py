@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""Lumped-node thermal network over lunar day/night and thermal-vac cycles.
+
+Nodes per vehicle: warm electronics core, radiator (`thermal.radiator_area_m2`),
+MLI outer shell around the core, and the structural conduction spine split
+into SPINE_SEGMENTS nodes ending in foot contact with the regolith. Couplings:
+- core <-> radiator: variable-conductance heat pipe, open below
+  `switch_open_c`, fully conducting above `switch_full_c`
+- core <-> shell: MLI-equivalent radiative exchange (effective emittance)
+- core <-> spine: low-conductance isolating mounts, then spine segments
+- external surfaces: absorbed sun (horizontal radiator, side-lit shell and
+  spine), IR from the surface they view, emission to the sink
+Core sources: RHU (hybrid power profile), electronics dissipation while
+awake, thermostatic survival heater.
+
+Backward Euler with radiation linearized about the previous step
+(T^4 ~= 4 T_n^3 T - 3 T_n^4). An ensemble of N vehicles is one
+block-diagonal sparse system per step (SuperLU), so N parameter sets advance
+together. `sample_ensemble()` scatters the nominal parameters.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import sys
+import time
+from dataclasses import dataclass, fields, replace
+from pathlib import Path
+
+import numpy as np
+import scipy.sparse as sp
+from numpy.typing import NDArray
+from scipy.sparse.linalg import splu
+
+try:
+    import yaml  # type: ignore
+except Exception:  # pragma: no cover
+    yaml = None
+
+ROOT = Path(__file__).resolve().parents[1]
+PARAMS_PATH = ROOT / "cad" / "weevil_leg_params.yaml"
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "cad" / "scripts"))
+from simple_yaml import load_yaml_text  # type: ignore
+
+from models.energy_budget import LUNAR_DAY_H, LUNAR_NIGHT_H, load_power_params
+
+SIGMA = 5.670374419e-8
+SOLAR_W_M2 = 1361.0
+KELVIN = 273.15
+SPINE_SEGMENTS = 4
+NODES = ("core", "radiator", "shell") + tuple(f"spine_{k}" for k in range(SPINE_SEGMENTS))
+CORE, RADIATOR, SHELL, SPINE0 = 0, 1, 2, 3
+N_NODES = len(NODES)
+SURFACE_NIGHT_K = 95.0
+SURFACE_NOON_K = 392.0
+SINK_K = 3.0
+SHROUD_K = 93.0
+
+
+@dataclass(frozen=True)
+class ThermalParams:
+    """Per-vehicle network parameters (POC values); fields may hold ensemble arrays."""
+    radiator_area_m2: float = 0.18
+    radiator_emissivity: float = 0.85
+    radiator_absorptivity: float = 0.10
+    radiator_capacity_j_k: float = 700.0
+    core_capacity_j_k: float = 4000.0
+    core_dissipation_w: float = 7.0
+    rhu_w: float = 1.5
+    heater_w: float = 4.0
+    heater_on_c: float = -30.0
+    heater_off_c: float = -25.0
+    switch_g_on_w_k: float = 2.0
+    switch_g_off_w_k: float = 0.002
+    switch_open_c: float = 10.0
+    switch_full_c: float = 30.0
+    mli_area_m2: float = 0.30
+    mli_effective_emittance: float = 0.01
+    shell_area_m2: float = 0.60
+    shell_emissivity: float = 0.60
+    shell_absorptivity: float = 0.30
+    shell_sun_fraction: float = 0.35
+    shell_view_surface: float = 0.5
+    shell_capacity_j_k: float = 300.0
+    spine_capacity_j_k: float = 8000.0        # whole spine, split over segments
+    spine_g_isolator_w_k: float = 0.004
+    spine_g_segment_w_k: float = 0.5
+    spine_area_m2: float = 0.40
+    spine_emissivity: float = 0.30
+    spine_absorptivity: float = 0.30
+    spine_sun_fraction: float = 0.30
+    spine_view_surface: float = 0.5
+    foot_contact_g_w_k: float = 0.05
+
+
+SCATTERED = (
+    "radiator_emissivity", "radiator_absorptivity", "core_dissipation_w", "rhu_w", "switch_g_on_w_k",
+    "switch_g_off_w_k", "mli_effective_emittance", "shell_absorptivity", "spine_g_isolator_w_k",
+    "spine_emissivity", "foot_contact_g_w_k",
+)
+
+
+def load_thermal_params(path: Path = PARAMS_PATH) -> ThermalParams:
+    text = path.read_text(encoding="utf-8")
+    raw = yaml.safe_load(text) if yaml is not None else load_yaml_text(text)
+    return ThermalParams(radiator_area_m2=float(raw["thermal"]["radiator_area_m2"]))
+
+
+def sample_ensemble(n: int, nominal: ThermalParams, scatter: float = 0.15, seed: int = 20260305) -> ThermalParams:
+    """``nominal`` with SCATTERED fields drawn uniformly within +/- ``scatter`` (relative) per member."""
+    rng = np.random.default_rng(seed)
+    changes = {name: getattr(nominal, name) * rng.uniform(1.0 - scatter, 1.0 + scatter, n) for name in SCATTERED}
+    return replace(nominal, **changes)
+
+
+@dataclass(frozen=True)
+class Environment:
+    name: str
+    dt_s: float
+    sink_k: NDArray[np.float64]        # per step
+    surface_k: NDArray[np.float64]
+    sun_normal_w_m2: NDArray[np.float64]
+    sun_sin: NDArray[np.float64]       # sine of sun elevation (horizontal radiator)
+    awake: NDArray[np.bool_]
+    cycle: NDArray[np.int64]           # cycle index per step (for per-cycle envelopes)
+    night: NDArray[np.bool_]
+
+
+def lunar_cycle(dt_s: float = 1800.0, ops_min_sun_elevation_deg: float = 10.0) -> Environment:
+    """Dawn-to-dawn synodic cycle at an equatorial site."""
+    steps = int(round((LUNAR_DAY_H + LUNAR_NIGHT_H) * 3600.0 / dt_s))
+    t_h = (np.arange(steps) + 1) * dt_s / 3600.0
+    day = t_h < LUNAR_DAY_H
+    sun_sin = np.where(day, np.sin(np.pi * np.minimum(t_h, LUNAR_DAY_H) / LUNAR_DAY_H), 0.0).clip(0.0)
+    surface = np.maximum(SURFACE_NIGHT_K, SURFACE_NOON_K * sun_sin ** 0.25)
+    return Environment(
+        name="lunar_cycle",
+        dt_s=dt_s,
+        sink_k=np.full(steps, SINK_K),
+        surface_k=surface,
+        sun_normal_w_m2=np.where(sun_sin > 0.0, SOLAR_W_M2, 0.0),
+        sun_sin=sun_sin,
+        awake=sun_sin >= math.sin(math.radians(ops_min_sun_elevation_deg)),
+        cycle=np.zeros(steps, dtype=np.int64),
+        night=~day,
+    )
+
+
+def chamber_cycles(n_cycles: int = 3, period_h: float = 24.0, lamp_fraction: float = 0.5,
+                   dt_s: float = 600.0) -> Environment:
+    """Thermal-vac: LN2 shroud throughout, solar-equivalent lamps for the hot half of each cycle."""
+    steps = int(round(n_cycles * period_h * 3600.0 / dt_s))
+    t_h = (np.arange(steps) + 1) * dt_s / 3600.0
+    lamps = (t_h % period_h) < lamp_fraction * period_h
+    return Environment(
+        name="chamber",
+        dt_s=dt_s,
+        sink_k=np.full(steps, SHROUD_K),
+        surface_k=np.full(steps, SHROUD_K),
+        sun_normal_w_m2=np.where(lamps, SOLAR_W_M2, 0.0),
+        sun_sin=lamps.astype(float),
+        awake=np.ones(steps, dtype=bool),
+        cycle=np.minimum((t_h / period_h).astype(np.int64), n_cycles - 1),
+        night=~lamps,
+    )
+
+
+@dataclass(frozen=True)
+class ThermalResult:
+    environment: str
+    core_k: NDArray[np.float32]        # (steps, members)
+    node_min_k: NDArray[np.float64]    # (members, nodes)
+    node_max_k: NDArray[np.float64]
+    heater_wh: NDArray[np.float64]     # (members,)
+    heater_night_wh: NDArray[np.float64]
+
+
+def _block_pattern(n: int) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.int64], NDArray[np.int64]]:
+    """CSC indices/indptr of the block-diagonal pattern and the (row, col) order of its data."""
+    coupled = [(CORE, RADIATOR), (CORE, SHELL), (CORE, SPINE0)]
+    coupled += [(SPINE0 + k, SPINE0 + k + 1) for k in range(SPINE_SEGMENTS - 1)]
+    mask = np.eye(N_NODES, dtype=bool)
+    for i, j in coupled:
+        mask[i, j] = mask[j, i] = True
+    cols, rows = np.nonzero(mask.T)  # column-major
+    nnz = rows.size
+    offsets = np.arange(n) * N_NODES
+    indices = (rows[None, :] + offsets[:, None]).ravel()
+    counts = np.bincount(cols, minlength=N_NODES)
+    indptr = np.concatenate(([0], np.cumsum(np.tile(counts, n))))
+    return indices, indptr, rows, cols
+
+
+def simulate(env: Environment, params: ThermalParams, n: int, t0_c: float = 0.0) -> ThermalResult:
+    """Advance ``n`` vehicles (params fields scalar or length-``n``) through ``env``."""
+    p = {f.name: np.broadcast_to(np.asarray(getattr(params, f.name), dtype=float), (n,)) for f in fields(params)}
+    dt = env.dt_s
+    indices, indptr, prow, pcol = _block_pattern(n)
+
+    cap = np.empty((n, N_NODES))
+    cap[:, CORE] = p["core_capacity_j_k"]
+    cap[:, RADIATOR] = p["radiator_capacity_j_k"]
+    cap[:, SHELL] = p["shell_capacity_j_k"]
+    cap[:, SPINE0:] = (p["spine_capacity_j_k"] / SPINE_SEGMENTS)[:, None]
+
+    # External radiative surfaces: emissivity * area, absorptivity * projected sun area, surface view factor.
+    seg_area = p["spine_area_m2"] / SPINE_SEGMENTS
+    eps_a = np.zeros((n, N_NODES))
+    eps_a[:, RADIATOR] = p["radiator_emissivity"] * p["radiator_area_m2"]
+    eps_a[:, SHELL] = p["shell_emissivity"] * p["shell_area_m2"]
+    eps_a[:, SPINE0:] = (p["spine_emissivity"] * seg_area)[:, None]
+    view = np.zeros((n, N_NODES))
+    view[:, SHELL] = p["shell_view_surface"]
+    view[:, SPINE0:] = p["spine_view_surface"][:, None]
+    sun_side = np.zeros((n, N_NODES))
+    sun_side[:, SHELL] = p["shell_absorptivity"] * p["shell_area_m2"] * p["shell_sun_fraction"]
+    sun_side[:, SPINE0:] = (p["spine_absorptivity"] * seg_area * p["spine_sun_fraction"])[:, None]
+    sun_top = p["radiator_absorptivity"] * p["radiator_area_m2"]
+
+    g_fixed = np.zeros((n, N_NODES, N_NODES))
+    g_fixed[:, CORE, SPINE0] = g_fixed[:, SPINE0, CORE] = p["spine_g_isolator_w_k"]
+    for k in range(SPINE_SEGMENTS - 1):
+        g_fixed[:, SPINE0 + k, SPINE0 + k + 1] = g_fixed[:, SPINE0 + k + 1, SPINE0 + k] = p["spine_g_segment_w_k"]
+    foot = SPINE0 + SPINE_SEGMENTS - 1
+    k_mli = SIGMA * p["mli_effective_emittance"] * p["mli_area_m2"]
+
+    T = np.full((n, N_NODES), t0_c + KELVIN)
+    heater_on = np.zeros(n, dtype=bool)
+    heater_wh = np.zeros(n)
+    heater_night_wh = np.zeros(n)
+    node_min = T.copy()
+    node_max = T.copy()
+    core_trace = np.empty((env.sink_k.size, n), dtype=np.float32)
+    rows_n = np.arange(N_NODES)
+
+    for s in range(env.sink_k.size):
+        Tc = T[:, CORE] - KELVIN
+        frac = np.clip((Tc - p["switch_open_c"]) / (p["switch_full_c"] - p["switch_open_c"]), 0.0, 1.0)
+        g_switch = p["switch_g_off_w_k"] + (p["switch_g_on_w_k"] - p["switch_g_off_w_k"]) * frac
+        heater_on = np.where(Tc < p["heater_on_c"], True, np.where(Tc > p["heater_off_c"], False, heater_on))
+
+        G = g_fixed.copy()
+        G[:, CORE, RADIATOR] = G[:, RADIATOR, CORE] = g_switch
+        A = -G
+        A[:, rows_n, rows_n] = G.sum(axis=2) + cap / dt
+        rhs = cap / dt * T
+
+        # External emission (linearized) and absorbed IR / sun.
+        T3 = T ** 3
+        h = SIGMA * eps_a * 4.0 * T3
+        A[:, rows_n, rows_n] += h
+        rhs += SIGMA * eps_a * (3.0 * T3 * T)
+        sink4, surf4 = env.sink_k[s] ** 4, env.surface_k[s] ** 4
+        rhs += SIGMA * eps_a * (view * surf4 + (1.0 - view) * sink4)
+        rhs += sun_side * env.sun_normal_w_m2[s]
+        rhs[:, RADIATOR] += sun_top * SOLAR_W_M2 * env.sun_sin[s]
+        A[:, foot, foot] += p["foot_contact_g_w_k"]
+        rhs[:, foot] += p["foot_contact_g_w_k"] * env.surface_k[s]
+
+        # Core <-> shell MLI exchange k (Tc^4 - Ts^4), linearized at both ends.
+        Tc3, Ts3 = T3[:, CORE], T3[:, SHELL]
+        A[:, CORE, CORE] += 4.0 * k_mli * Tc3
+        A[:, CORE, SHELL] -= 4.0 * k_mli * Ts3
+        A[:, SHELL, SHELL] += 4.0 * k_mli * Ts3
+        A[:, SHELL, CORE] -= 4.0 * k_mli * Tc3
+        q3 = 3.0 * k_mli * (Tc3 * T[:, CORE] - Ts3 * T[:, SHELL])
+        rhs[:, CORE] += q3
+        rhs[:, SHELL] -= q3
+
+        q_heater = np.where(heater_on, p["heater_w"], 0.0)
+        rhs[:, CORE] += p["rhu_w"] + q_heater + (p["core_dissipation_w"] if env.awake[s] else 0.0)
+
+        data = A[:, prow, pcol].ravel()
+        m = sp.csc_matrix((data, indices, indptr), shape=(n * N_NODES, n * N_NODES))
+        T = splu(m).solve(rhs.ravel()).reshape(n, N_NODES)
+
+        np.minimum(node_min, T, out=node_min)
+        np.maximum(node_max, T, out=node_max)
+        core_trace[s] = T[:, CORE]
+        heater_wh += q_heater * dt / 3600.0
+        if env.night[s]:
+            heater_night_wh += q_heater * dt / 3600.0
+
+    return ThermalResult(env.name, core_trace, node_min, node_max, heater_wh, heater_night_wh)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Thermal network ensemble over lunar and chamber cycles")
+    ap.add_argument("--members", type=int, default=256)
+    args = ap.parse_args()
+
+    ens = sample_ensemble(args.members, load_thermal_params())
+    budget = load_power_params().night_survival_load_wh
+    for env in (lunar_cycle(), chamber_cycles()):
+        t0 = time.perf_counter()
+        res = simulate(env, ens, args.members)
+        elapsed = time.perf_counter() - t0
+        print(f"{env.name}: {env.sink_k.size} steps x {args.members} members in {elapsed:.2f} s")
+        for k, node in enumerate(NODES):
+            print(f"  {node:9s} {res.node_min_k[:, k].min() - KELVIN:8.1f} .. {res.node_max_k[:, k].max() - KELVIN:7.1f} C")
+        print(f"  heater night Wh: max {res.heater_night_wh.max():.1f} (budget {budget:.0f})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""Streaming actuation metrics from high-rate joint bench logs.
+
+Input: CSV `t_s,motor_deg,joint_deg,torque_Nm,push_off` at rig rate
+(motor encoder referred to the joint through the gear ratio, push_off = 1 while
+the gait controller commands push-off). The log is read in fixed-size byte
+blocks (`bench_ingest.iter_raw_blocks`); each metric keeps only carried state,
+so memory is bounded however long the run is:
+
+- torque ripple: Welch spectrum of torque (Hann window, 50% overlap, segment
+  mean removed) over segments clear of push-off; ripple is the RMS in
+  RIPPLE_BAND_HZ as the amplitude of an equivalent sinusoid, in % of mean |torque|
+- backlash: motor direction with a position hysteresis; lost motion
+  d = motor - joint is regressed on (1, torque, direction) over samples past
+  REVERSAL_SETTLE_DEG of travel, separating compliance windup from play. Each
+  reversal gives one hysteresis-loop width (compliance-corrected run means);
+  backlash is their median
+- push-off spike ratio: peak |torque| over each push-off window (plus
+  PUSH_OFF_TAIL_S of ringing) divided by the joint torque limit
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import math
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from bench_ingest import BLOCK_BYTES, iter_raw_blocks
+
+LOG_FIELDS = ["t_s", "motor_deg", "joint_deg", "torque_Nm", "push_off"]
+T, MOTOR, JOINT, TORQUE, PUSH = range(len(LOG_FIELDS))
+
+JOINT_TORQUE_LIMIT_NM = 12.0   # POC joint rating (coxa 50 W BLDC, 80:1)
+WELCH_NPERSEG = 1024
+RIPPLE_BAND_HZ = (5.0, math.inf)
+DIRECTION_HYSTERESIS_DEG = 0.05
+REVERSAL_SETTLE_DEG = 2.0
+MIN_RUN_SAMPLES = 50
+PUSH_OFF_TAIL_S = 0.05
+SEARCH_WINDOW = 4096
+
+
+class WelchAccumulator:
+    """Running Welch PSD; samples straddling block edges are carried to the next block."""
+
+    def __init__(self, nperseg: int = WELCH_NPERSEG) -> None:
+        self.nperseg = nperseg
+        self.step = nperseg // 2
+        self.window = np.hanning(nperseg)
+        self.tail = np.empty(0)
+        self.tail_excluded = np.empty(0, dtype=bool)
+        self.power = np.zeros(nperseg // 2 + 1)
+        self.segments = 0
+
+    def update(self, x: np.ndarray, excluded: np.ndarray) -> None:
+        buf = np.concatenate((self.tail, x))
+        ex = np.concatenate((self.tail_excluded, excluded))
+        if buf.size < self.nperseg:
+            self.tail, self.tail_excluded = buf, ex
+            return
+        n_seg = (buf.size - self.nperseg) // self.step + 1
+        frames = sliding_window_view(buf, self.nperseg)[:: self.step][:n_seg]
+        keep = ~sliding_window_view(ex, self.nperseg)[:: self.step][:n_seg].any(axis=1)
+        if np.any(keep):
+            seg = frames[keep]
+            spec = np.fft.rfft((seg - seg.mean(axis=1, keepdims=True)) * self.window, axis=1)
+            self.power += np.sum(spec.real ** 2 + spec.imag ** 2, axis=0)
+            self.segments += int(np.count_nonzero(keep))
+        self.tail = buf[n_seg * self.step:]
+        self.tail_excluded = ex[n_seg * self.step:]
+
+    def psd(self, fs: float) -> tuple[np.ndarray, np.ndarray]:
+        """(freqs, one-sided PSD in units^2/Hz)."""
+        psd = self.power / max(self.segments, 1) / (fs * np.sum(self.window ** 2))
+        psd[1:-1] *= 2.0
+        return np.fft.rfftfreq(self.nperseg, 1.0 / fs), psd
+
+    def band_rms(self, fs: float, band: tuple[float, float]) -> tuple[float, float]:
+        """(RMS within ``band``, frequency of the strongest bin in it)."""
+        freqs, psd = self.psd(fs)
+        sel = (freqs >= band[0]) & (freqs < band[1])
+        if not np.any(sel) or self.segments == 0:
+            return math.nan, math.nan
+        rms = math.sqrt(float(np.sum(psd[sel])) * (freqs[1] - freqs[0]))
+        return rms, float(freqs[sel][np.argmax(psd[sel])])
+
+
+@dataclass
+class BacklashAccumulator:
+    """Direction tracking with hysteresis, lost-motion regression and per-run sums."""
+    hysteresis_deg: float = DIRECTION_HYSTERESIS_DEG
+    settle_deg: float = REVERSAL_SETTLE_DEG
+    direction: int = 0
+    extremum: float = math.nan
+    travel: float = 0.0
+    last_motor: float = math.nan
+    xtx: np.ndarray = field(default_factory=lambda: np.zeros((3, 3)))
+    xty: np.ndarray = field(default_factory=lambda: np.zeros(3))
+    run: list[float] = field(default_factory=lambda: [0.0, 0.0, 0.0])   # n, sum d, sum torque
+    runs: list[tuple[int, float, float, float]] = field(default_factory=list)
+    reversals: int = 0
+
+    def _reversal_points(self, m: np.ndarray) -> tuple[np.ndarray, list[int]]:
+        """Per-sample direction and block indices where a reversal is confirmed."""
+        n = m.size
+        direction = np.empty(n, dtype=np.int8)
+        points = []
+        i = 0
+        if self.direction == 0:
+            if math.isnan(self.extremum):
+                self.extremum = float(m[0])
+            moved = np.flatnonzero(np.abs(m - self.extremum) >= self.hysteresis_deg)
+            if moved.size == 0:
+                direction[:] = 0
+                return direction, points
+            i = int(moved[0])
+            direction[:i] = 0
+            self.direction = 1 if m[i] > self.extremum else -1
+            self.extremum = float(m[i])
+        while i < n:
+            found = -1
+            start = i
+            while start < n:
+                seg = m[start: start + SEARCH_WINDOW]
+                if self.direction > 0:
+                    run_ext = np.maximum.accumulate(np.maximum(seg, self.extremum))
+                    hit = np.flatnonzero(seg <= run_ext - self.hysteresis_deg)
+                else:
+                    run_ext = np.minimum.accumulate(np.minimum(seg, self.extremum))
+                    hit = np.flatnonzero(seg >= run_ext + self.hysteresis_deg)
+                if hit.size:
+                    found = start + int(hit[0])
+                    self.extremum = float(run_ext[hit[0]])
+                    break
+                self.extremum = float(run_ext[-1])
+                start += seg.size
+            if found < 0:
+                direction[i:] = self.direction
+                break
+            direction[i:found] = self.direction
+            self.direction = -self.direction
+            self.extremum = float(m[found])
+            points.append(found)
+            i = found
+        return direction, points
+
+    def update(self, motor: np.ndarray, joint: np.ndarray, torque: np.ndarray) -> None:
+        direction, points = self._reversal_points(motor)
+        prev = motor[0] if math.isnan(self.last_motor) else self.last_motor
+        step = np.abs(np.diff(motor, prepend=prev))
+        self.last_motor = float(motor[-1])
+        edges = [0, *points, motor.size]
+        d = motor - joint
+        for k in range(len(edges) - 1):
+            a, b = edges[k], edges[k + 1]
+            if k > 0:  # a reversal at a
+                self._close_run(-int(direction[a]))
+                self.reversals += 1
+                self.travel = 0.0
+            if a == b:
+                continue
+            travel = self.travel + np.cumsum(step[a:b])
+            self.travel = float(travel[-1])
+            steady = (travel >= self.settle_deg) & (direction[a:b] != 0)
+            if not np.any(steady):
+                continue
+            dd, tq = d[a:b][steady], torque[a:b][steady]
+            dirs = direction[a:b][steady].astype(float)
+            x = np.stack((np.ones(dd.size), tq, dirs))
+            self.xtx += x @ x.T
+            self.xty += x @ dd
+            self.run[0] += dd.size
+            self.run[1] += float(dd.sum())
+            self.run[2] += float(tq.sum())
+
+    def _close_run(self, direction: int) -> None:
+        if self.run[0] >= MIN_RUN_SAMPLES and direction != 0:
+            self.runs.append((direction, self.run[0], self.run[1] / self.run[0], self.run[2] / self.run[0]))
+        self.run = [0.0, 0.0, 0.0]
+
+    def finish(self) -> tuple[float, float, np.ndarray]:
+        """(backlash from the regression, compliance deg/Nm, per-reversal loop widths)."""
+        self._close_run(self.direction)
+        if np.linalg.matrix_rank(self.xtx) < 3:
+            return math.nan, math.nan, np.empty(0)
+        c0, compliance, half_play = np.linalg.solve(self.xtx, self.xty)
+        widths = [
+            abs((d0 - compliance * t0) - (d1 - compliance * t1))
+            for (s0, _, d0, t0), (s1, _, d1, t1) in zip(self.runs, self.runs[1:])
+            if s0 != s1
+        ]
+        return 2.0 * float(half_play), float(compliance), np.asarray(widths)
+
+
+@dataclass
+class SpikeAccumulator:
+    """Peak |torque| per push-off window, windows extended by ``tail`` samples."""
+    tail: int
+    seen: int = 0
+    last_on: int = -(1 << 62)
+    open_peak: float = math.nan
+    peaks: list[float] = field(default_factory=list)
+
+    def update(self, push_off: np.ndarray, torque: np.ndarray) -> np.ndarray:
+        """Record event peaks; return the extended push-off mask for this block."""
+        n = push_off.size
+        idx = np.arange(self.seen, self.seen + n)
+        on = np.where(push_off > 0.5, idx, -(1 << 62))
+        last_on = np.maximum.accumulate(np.maximum(on, self.last_on))
+        active = idx - last_on <= self.tail
+        self.last_on = int(last_on[-1])
+        self.seen += n
+
+        change = np.flatnonzero(np.diff(active.astype(np.int8))) + 1
+        starts = np.concatenate(([0], change))
+        peaks = np.maximum.reduceat(np.abs(torque), starts)
+        for k, s in enumerate(starts):
+            if not active[s]:
+                if not math.isnan(self.open_peak):
+                    self.peaks.append(self.open_peak)
+                    self.open_peak = math.nan
+                continue
+            if math.isnan(self.open_peak):
+                self.open_peak = float(peaks[k])
+            else:
+                self.open_peak = max(self.open_peak, float(peaks[k]))
+        return active
+
+    def finish(self) -> np.ndarray:
+        if not math.isnan(self.open_peak):
+            self.peaks.append(self.open_peak)
+            self.open_peak = math.nan
+        return np.asarray(self.peaks)
+
+
+@dataclass(frozen=True)
+class ActuationMetrics:
+    samples: int
+    duration_s: float
+    sample_rate_hz: float
+    torque_ripple_pct: float
+    ripple_peak_hz: float
+    backlash_deg: float
+    backlash_regression_deg: float
+    backlash_p95_deg: float
+    compliance_deg_per_nm: float
+    reversals: int
+    push_off_events: int
+    push_off_spike_ratio: float
+    push_off_spike_ratio_p95: float
+
+
+def analyze_log(
+    path: Path,
+    torque_limit_nm: float = JOINT_TORQUE_LIMIT_NM,
+    nperseg: int = WELCH_NPERSEG,
+    block_bytes: int = BLOCK_BYTES,
+) -> ActuationMetrics:
+    welch = WelchAccumulator(nperseg)
+    backlash = BacklashAccumulator()
+    spikes: SpikeAccumulator | None = None
+    fs = math.nan
+    t0 = t1 = math.nan
+    samples = 0
+    abs_torque = 0.0
+    for block in iter_raw_blocks(path, block_bytes, LOG_FIELDS):
+        if block.size == 0:
+            continue
+        if spikes is None:
+            t0 = float(block[0, T])
+            fs = 1.0 / float(np.median(np.diff(block[: min(block.shape[0], 10_000), T])))
+            spikes = SpikeAccumulator(tail=int(round(PUSH_OFF_TAIL_S * fs)))
+        torque = block[:, TORQUE]
+        in_push = spikes.update(block[:, PUSH], torque)
+        welch.update(torque, in_push)
+        backlash.update(block[:, MOTOR], block[:, JOINT], torque)
+        abs_torque += float(np.sum(np.abs(torque)))
+        samples += block.shape[0]
+        t1 = float(block[-1, T])
+    if spikes is None:
+        raise ValueError(f"{path}: no samples")
+
+    rms, peak_hz = welch.band_rms(fs, RIPPLE_BAND_HZ)
+    mean_abs = abs_torque / samples
+    play, compliance, widths = backlash.finish()
+    ratios = spikes.finish() / torque_limit_nm
+    return ActuationMetrics(
+        samples=samples,
+        duration_s=t1 - t0,
+        sample_rate_hz=fs,
+        torque_ripple_pct=100.0 * math.sqrt(2.0) * rms / mean_abs if mean_abs > 0 else math.nan,
+        ripple_peak_hz=peak_hz,
+        backlash_deg=float(np.median(widths)) if widths.size else math.nan,
+        backlash_regression_deg=play,
+        backlash_p95_deg=float(np.percentile(widths, 95)) if widths.size else math.nan,
+        compliance_deg_per_nm=compliance,
+        reversals=backlash.reversals,
+        push_off_events=int(ratios.size),
+        push_off_spike_ratio=float(ratios.max()) if ratios.size else 0.0,
+        push_off_spike_ratio_p95=float(np.percentile(ratios, 95)) if ratios.size else 0.0,
+    )
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Torque ripple / backlash / push-off spike metrics from joint bench logs")
+    ap.add_argument("logs", nargs="+", help="CSV logs with columns " + ",".join(LOG_FIELDS))
+    ap.add_argument("--torque-limit", type=float, default=JOINT_TORQUE_LIMIT_NM, help="joint torque limit, N m")
+    ap.add_argument("--nperseg", type=int, default=WELCH_NPERSEG, help="Welch segment length, samples")
+    ap.add_argument("--block-mb", type=float, default=BLOCK_BYTES / (1 << 20), help="read block size")
+    ap.add_argument("--out", help="write one metrics row per log to this CSV")
+    args = ap.parse_args()
+
+    rows = []
+    for log in args.logs:
+        m = analyze_log(Path(log), args.torque_limit, args.nperseg, int(args.block_mb * (1 << 20)))
+        rows.append({"log": log, **asdict(m)})
+        print(f"{log}: ripple {m.torque_ripple_pct:.2f}% @ {m.ripple_peak_hz:.1f} Hz, backlash {m.backlash_deg:.3f} deg "
+              f"({m.reversals} reversals), spike ratio {m.push_off_spike_ratio:.3f} ({m.push_off_events} push-offs)")
+    if args.out:
+        with open(args.out, "w", encoding="utf-8", newline="") as f:
+            w = csv.DictWriter(f, fieldnames=list(rows[0]))
+            w.writeheader()
+            w.writerows(rows)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""Single-pass aggregation of bench trial logs (v0 template columns).
+
+Streams the trial-log CSV once and feeds grouped Welford accumulators, so
+campaign-scale logs aggregate in constant memory without pandas. Computes the
+`report_aggregates` and `acceptance_targets_v0` quantities of
+`verification/data_schema/bench_test_data_v0.yaml`:
+
+- per (soil, strategy, preload) and per (soil, strategy): mean/std of
+  f_peak_N, k_t_N_per_mm, x_slip_mm, e_diss_N_mm and the slip rate
+- degradation ratios: mean f_peak / k_t at cycle 10 over cycle 1
+- preload_trend_slope: least-squares d(f_peak_N)/d(preload_N) per (soil, strategy)
+- acceptance checks at the lowest preload of each soil (bench_test_plan_v0.md);
+  cycle-10 retention applies to the candidate strategies only, not the S0 baseline
+
+Writes `verification/reports/bench_summary.{csv,md}`; the acceptance checks feed
+the `bench` gate through `test_bench_acceptance.py`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable
+
+from report_io import REPORT_DIR, ROOT, HarnessReport, is_true, write_report
+
+try:
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+except Exception:
+    plt = None
+
+TRIAL_LOG = ROOT / "verification" / "templates" / "minimal_hardware_trials.csv"
+PLOT_DIR = ROOT.parent / "results" / "plots"
+
+METRICS = ["f_peak_N", "k_t_N_per_mm", "x_slip_mm", "e_diss_N_mm"]
+STRATEGIES = ["S0", "S1", "S2"]
+CANDIDATE_STRATEGIES = ["S1", "S2"]  # S0 is the baseline the targets compare against
+FIRST_CYCLE, LAST_CYCLE = 1, 10
+
+# acceptance_targets_v0
+LOW_PRELOAD_GAIN_F_PEAK_S1_OVER_S0_MIN = 1.20
+LOW_PRELOAD_CYCLE10_RETENTION_F_PEAK_MIN = 0.85
+
+
+@dataclass
+class Welford:
+    n: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def add(self, x: float) -> None:
+        self.n += 1
+        d = x - self.mean
+        self.mean += d / self.n
+        self.m2 += d * (x - self.mean)
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.m2 / (self.n - 1)) if self.n > 1 else math.nan
+
+
+@dataclass
+class LinearFit:
+    """Running sums for an ordinary least-squares slope."""
+
+    n: int = 0
+    sx: float = 0.0
+    sy: float = 0.0
+    sxx: float = 0.0
+    sxy: float = 0.0
+
+    def add(self, x: float, y: float) -> None:
+        self.n += 1
+        self.sx += x
+        self.sy += y
+        self.sxx += x * x
+        self.sxy += x * y
+
+    @property
+    def slope(self) -> float:
+        denom = self.n * self.sxx - self.sx * self.sx
+        return (self.n * self.sxy - self.sx * self.sy) / denom if self.n > 1 and denom > 1e-12 else math.nan
+
+
+@dataclass
+class GroupStats:
+    metrics: dict[str, Welford] = field(default_factory=lambda: {m: Welford() for m in METRICS})
+    slips: int = 0
+    first_cycle: dict[str, Welford] = field(default_factory=lambda: {"f_peak_N": Welford(), "k_t_N_per_mm": Welford()})
+    last_cycle: dict[str, Welford] = field(default_factory=lambda: {"f_peak_N": Welford(), "k_t_N_per_mm": Welford()})
+    preload_fit: LinearFit = field(default_factory=LinearFit)
+
+    @property
+    def n(self) -> int:
+        return self.metrics["f_peak_N"].n
+
+    def add(self, values: dict[str, float], preload: float, cycle: int, slip: bool) -> None:
+        for m in METRICS:
+            if not math.isnan(values[m]):
+                self.metrics[m].add(values[m])
+        self.slips += slip
+        for key in self.first_cycle:
+            if math.isnan(values[key]):
+                continue
+            if cycle == FIRST_CYCLE:
+                self.first_cycle[key].add(values[key])
+            elif cycle == LAST_CYCLE:
+                self.last_cycle[key].add(values[key])
+        if not math.isnan(values["f_peak_N"]):
+            self.preload_fit.add(preload, values["f_peak_N"])
+
+    def ratio(self, metric: str) -> float:
+        first, last = self.first_cycle[metric], self.last_cycle[metric]
+        return last.mean / first.mean if first.n and last.n and first.mean else math.nan
+
+
+@dataclass
+class BenchAggregate:
+    by_preload: dict[tuple[str, str, float], GroupStats] = field(default_factory=dict)
+    by_strategy: dict[tuple[str, str], GroupStats] = field(default_factory=dict)
+    trials: int = 0
+    skipped: int = 0
+
+    def add_row(self, row: dict[str, str]) -> None:
+        try:
+            soil, strategy = row["soil_type"], row["strategy"]
+            preload, cycle = float(row["preload_N"]), int(row["cycle_num"])
+            values = {m: _num(row.get(m, "")) for m in METRICS}
+        except (KeyError, ValueError):
+            self.skipped += 1
+            return
+        slip = is_true(row.get("slip_detected", ""))
+        self.trials += 1
+        for groups, key in ((self.by_preload, (soil, strategy, preload)), (self.by_strategy, (soil, strategy))):
+            stats = groups.get(key)
+            if stats is None:
+                stats = groups[key] = GroupStats()
+            stats.add(values, preload, cycle, slip)
+
+    def soils(self) -> list[str]:
+        return sorted({soil for soil, _ in self.by_strategy})
+
+    def low_preload(self, soil: str) -> float | None:
+        preloads = [p for s, _, p in self.by_preload if s == soil]
+        return min(preloads) if preloads else None
+
+
+def _num(value: str) -> float:
+    return float(value) if value not in ("", None) else math.nan
+
+
+def aggregate(rows: Iterable[dict[str, str]]) -> BenchAggregate:
+    agg = BenchAggregate()
+    for row in rows:
+        agg.add_row(row)
+    return agg
+
+
+def aggregate_csv(path: Path = TRIAL_LOG) -> BenchAggregate:
+    with path.open("r", encoding="utf-8", newline="") as f:
+        return aggregate(csv.DictReader(f))
+
+
+def _r(x: float, nd: int = 4) -> Any:
+    return "" if math.isnan(x) else round(x, nd)
+
+
+def summary_rows(agg: BenchAggregate) -> list[dict[str, Any]]:
+    rows: list[dict[str, Any]] = []
+    groups: list[tuple[str, str, Any, GroupStats]] = [
+        (soil, strategy, "all", st) for (soil, strategy), st in sorted(agg.by_strategy.items())
+    ]
+    groups += [(soil, strategy, preload, st) for (soil, strategy, preload), st in sorted(agg.by_preload.items())]
+    for soil, strategy, preload, st in groups:
+        row: dict[str, Any] = {"soil_type": soil, "strategy": strategy, "preload_N": preload, "n": st.n}
+        for m in METRICS:
+            row[f"{m}_mean"] = _r(st.metrics[m].mean if st.metrics[m].n else math.nan)
+            row[f"{m}_std"] = _r(st.metrics[m].std)
+        row["slip_rate"] = _r(st.slips / st.n if st.n else math.nan, 3)
+        row["f_peak_ratio_cycle10_vs1"] = _r(st.ratio("f_peak_N"))
+        row["k_t_ratio_cycle10_vs1"] = _r(st.ratio("k_t_N_per_mm"))
+        row["preload_trend_slope"] = _r(st.preload_fit.slope) if preload == "all" else ""
+        rows.append(row)
+    return rows
+
+
+def _mean(stats: GroupStats | None, metric: str) -> float:
+    return stats.metrics[metric].mean if stats is not None and stats.metrics[metric].n else math.nan
+
+
+def _check(check: str, soil: str, strategy: str, value: float, threshold: Any, passed: bool) -> dict[str, Any]:
+    no_data = isinstance(value, float) and math.isnan(value)
+    return {
+        "check": check,
+        "soil_type": soil,
+        "strategy": strategy,
+        "value": _r(value) if isinstance(value, float) else value,
+        "threshold": threshold,
+        "pass": bool(passed) and not no_data,
+        "status": "no-data" if no_data else ("pass" if passed else "fail"),
+    }
+
+
+def acceptance_rows(agg: BenchAggregate) -> list[dict[str, Any]]:
+    """acceptance_targets_v0 / bench plan gates, one row per check."""
+    rows: list[dict[str, Any]] = []
+    ranked_soils: list[str] = []
+    for soil in agg.soils():
+        low = agg.low_preload(soil)
+        s0 = agg.by_preload.get((soil, "S0", low))
+        s1 = agg.by_preload.get((soil, "S1", low))
+        f0, f1 = _mean(s0, "f_peak_N"), _mean(s1, "f_peak_N")
+        gain = f1 / f0 if f0 else math.nan
+        rows.append(_check(f"low_preload_gain_f_peak_s1_over_s0@{low:g}N", soil, "S1/S0", gain,
+                           LOW_PRELOAD_GAIN_F_PEAK_S1_OVER_S0_MIN, gain >= LOW_PRELOAD_GAIN_F_PEAK_S1_OVER_S0_MIN))
+        for metric in ("k_t_N_per_mm", "x_slip_mm"):
+            d = _mean(s1, metric) - _mean(s0, metric)
+            rows.append(_check(f"low_preload_{metric}_s1_minus_s0@{low:g}N", soil, "S1-S0", d, "> 0", d > 0))
+        for strategy in CANDIDATE_STRATEGIES:
+            st = agg.by_preload.get((soil, strategy, low))
+            if st is None:
+                continue
+            ret = st.ratio("f_peak_N")
+            rows.append(_check(f"low_preload_cycle10_retention_f_peak@{low:g}N", soil, strategy, ret,
+                               LOW_PRELOAD_CYCLE10_RETENTION_F_PEAK_MIN, ret >= LOW_PRELOAD_CYCLE10_RETENTION_F_PEAK_MIN))
+        means = {m: [_mean(agg.by_strategy.get((soil, s)), m) for s in STRATEGIES] for m in ("f_peak_N", "k_t_N_per_mm")}
+        if all(v[2] >= v[1] >= v[0] for v in means.values()):
+            ranked_soils.append(soil)
+    rows.append(
+        {
+            "check": "ranking_S2>=S1>=S0_f_peak_and_k_t",
+            "soil_type": ";".join(ranked_soils) or "none",
+            "strategy": "S2>=S1>=S0",
+            "value": len(ranked_soils),
+            "threshold": ">= 1 soil",
+            "pass": bool(ranked_soils),
+            "status": "pass" if ranked_soils else "fail",
+        }
+    )
+    return rows
+
+
+def summary_report(agg: BenchAggregate, source: Path) -> HarnessReport:
+    rows = summary_rows(agg)
+    md_lines = [
+        "# Bench Summary",
+        "",
+        f"- Trial log: `{source.relative_to(ROOT) if source.is_relative_to(ROOT) else source}`",
+        f"- Trials aggregated: {agg.trials} (skipped {agg.skipped})",
+        "",
+        "| soil | strategy | preload N | n | f_peak N | k_t N/mm | x_slip mm | e_diss N*mm | slip rate | f_peak c10/c1 | trend dF/dP |",
+        "|---|---|---|---|---|---|---|---|---|---|---|",
+    ]
+    for r in rows:
+        md_lines.append(
+            f"| {r['soil_type']} | {r['strategy']} | {r['preload_N']} | {r['n']} "
+            f"| {r['f_peak_N_mean']} ± {r['f_peak_N_std']} | {r['k_t_N_per_mm_mean']} ± {r['k_t_N_per_mm_std']} "
+            f"| {r['x_slip_mm_mean']} | {r['e_diss_N_mm_mean']} | {r['slip_rate']} "
+            f"| {r['f_peak_ratio_cycle10_vs1']} | {r['preload_trend_slope']} |"
+        )
+    return HarnessReport("bench_summary", rows, md_lines)
+
+
+def plot_stiffness(agg: BenchAggregate, out_dir: Path = PLOT_DIR) -> Path | None:
+    """k_t vs preload per strategy/soil (needs matplotlib)."""
+    if plt is None:
+        return None
+    out_dir.mkdir(parents=True, exist_ok=True)
+    fig, ax = plt.subplots(figsize=(7, 4))
+    for (soil, strategy), _ in sorted(agg.by_strategy.items()):
+        pts = sorted((p, st.metrics["k_t_N_per_mm"].mean) for (s, g, p), st in agg.by_preload.items()
+                     if s == soil and g == strategy and st.metrics["k_t_N_per_mm"].n)
+        if pts:
+            ax.plot(*zip(*pts), marker="o", linestyle="-" if soil == agg.soils()[0] else "--", label=f"{strategy} {soil}")
+    ax.set_xlabel("preload_N")
+    ax.set_ylabel("k_t_N_per_mm")
+    ax.set_title("Initial Stiffness vs Preload")
+    ax.legend()
+    fig.tight_layout()
+    path = out_dir / "stiffness_vs_preload.png"
+    fig.savefig(path, dpi=150)
+    plt.close(fig)
+    return path
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--trials", default=str(TRIAL_LOG), help="trial-log CSV (v0 template columns)")
+    ap.add_argument("--report-dir", default=str(REPORT_DIR))
+    ap.add_argument("--plot", action="store_true", help="also write results/plots/stiffness_vs_preload.png")
+    args = ap.parse_args()
+
+    source = Path(args.trials)
+    agg = aggregate_csv(source)
+    csv_path, md_path = write_report(summary_report(agg, source), Path(args.report_dir))
+    print(f"Wrote {csv_path}")
+    print(f"Wrote {md_path}")
+    if args.plot:
+        path = plot_stiffness(agg)
+        print(f"Wrote {path}" if path else "matplotlib not available; no plot written")
+    failed = 0
+    for r in acceptance_rows(agg):
+        failed += not r["pass"]
+        print(f"{r['check']:<52} {r['soil_type']:<12} {r['strategy']:<10} {r['value']!s:>8}  {r['status']}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
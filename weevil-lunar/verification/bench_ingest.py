@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""Stream raw bench pull-test logs into v0 trial-log rows.
+
+Inputs:
+- manifest CSV: one row per trial with the template metadata columns
+  (run_id, timestamp_utc, soil_type, strategy, cleat_variant, preload_N,
+  cycle_num, pull_rate_mm_per_s, sample_rate_hz, notes); row order = trial index
+- raw CSV: `trial,t_s,z_mm,f_z_N,twist_deg,x_mm,f_t_N` samples, trials
+  contiguous (z positive into the soil, x = tangential pull displacement)
+- or a waveform store (`waveform_store.py`), which carries both
+
+The raw file is read in fixed-size byte blocks and parsed with numpy, so
+memory stays constant however long the campaign log is. Each trial feeds a
+`TrialAccumulator` that segments the phases and keeps only running sums:
+
+- placement: contact (f_z >= 10% preload) until engagement starts
+- engagement: first twist motion, or (press-only) the end of the 3 s minimum
+  placement hold, until the pull starts
+- pull: tangential displacement > 0.02 mm past contact, to the end of trial
+
+Per-phase metrics (bench_test_data_v0.yaml):
+- delta_z_init_mm / delta_z_engage_mm: sinkage over placement / engagement
+- f_peak_N: peak pull force; x_slip_mm: pull displacement at the peak
+- k_t_N_per_mm: least-squares slope of f_t vs x over the first 0.25 mm
+- e_diss_N_mm: trapezoidal integral of f_t dx over the pull
+- slip_detected: force fell >20% below the running peak (and by > 0.05 N)
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import math
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+TEMPLATE = ROOT / "verification" / "templates" / "bench_test_data_template.csv"
+DEFAULT_OUT = ROOT / "verification" / "templates" / "minimal_hardware_trials.csv"
+
+RAW_FIELDS = ["trial", "t_s", "z_mm", "f_z_N", "twist_deg", "x_mm", "f_t_N"]
+BLOCK_BYTES = 8 << 20
+
+CONTACT_FORCE_FRACTION = 0.10
+PRELOAD_REACHED_FRACTION = 0.90
+PLACEMENT_HOLD_S = 3.0  # bench plan minimum hold
+TWIST_START_DEG = 0.5
+PULL_START_MM = 0.02
+STIFFNESS_FIT_MM = 0.25
+SLIP_DROP_FRACTION = 0.20
+SLIP_MIN_DROP_N = 0.05  # load-cell noise margin; small-force wiggles are not slip
+
+APPROACH, PLACEMENT, ENGAGEMENT, PULL = range(4)
+
+
+def template_fields(path: Path = TEMPLATE) -> list[str]:
+    return path.read_text(encoding="utf-8").splitlines()[0].split(",")
+
+
+def read_manifest(path: Path) -> list[dict[str, str]]:
+    with path.open("r", encoding="utf-8", newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def iter_raw_blocks(path: Path, block_bytes: int = BLOCK_BYTES, fields: list[str] = RAW_FIELDS) -> Iterator[np.ndarray]:
+    """Yield (n, len(fields)) float64 sample blocks; a block never splits a line, blank lines are skipped."""
+    ncols = len(fields)
+    with path.open("rb") as f:
+        header = f.readline().decode("ascii").strip().split(",")
+        if header != fields:
+            raise ValueError(f"{path}: raw header {header} != {fields}")
+        line = 2  # file line of the next block's first line
+        carry = b""
+        while True:
+            chunk = f.read(block_bytes)
+            if not chunk:
+                break
+            chunk = carry + chunk
+            cut = chunk.rfind(b"\n")
+            if cut < 0:
+                carry = chunk
+                continue
+            carry = chunk[cut + 1:]
+            yield _parse(chunk[: cut + 1], ncols, path, line)
+            line += chunk.count(b"\n", 0, cut + 1)
+        if carry.strip():
+            yield _parse(carry, ncols, path, line)
+
+
+_BLANK_LINES = re.compile(rb"^[ \t\r]*\n", re.MULTILINE)
+
+
+def _parse(data: bytes, ncols: int, path: Path, first_line: int) -> np.ndarray:
+    text = _BLANK_LINES.sub(b"", data).decode("ascii").replace("\r", "").replace("\n", ",")
+    try:
+        values = np.fromstring(text, sep=",")
+    except ValueError:
+        raise ValueError(f"{path}: line {_bad_line(data, ncols, first_line)}: unparseable raw sample") from None
+    if values.size % ncols:
+        raise ValueError(
+            f"{path}: line {_bad_line(data, ncols, first_line)}: malformed raw block "
+            f"({values.size} values, {ncols} columns)"
+        )
+    return values.reshape(-1, ncols)
+
+
+def _bad_line(data: bytes, ncols: int, first_line: int) -> int:
+    """File line of the first line in ``data`` that is not ``ncols`` numbers (slow path, errors only)."""
+    for k, raw in enumerate(data.split(b"\n")):
+        fields = raw.strip().split(b",")
+        if fields == [b""]:
+            continue
+        try:
+            [float(v) for v in fields]
+        except ValueError:
+            return first_line + k
+        if len(fields) != ncols:
+            return first_line + k
+    return first_line
+
+
+def _first(mask: np.ndarray) -> int:
+    """Index of the first True in ``mask`` or -1."""
+    idx = int(np.argmax(mask)) if mask.size else 0
+    return idx if mask.size and mask[idx] else -1
+
+
+@dataclass
+class TrialAccumulator:
+    preload_n: float
+    phase: int = APPROACH
+    z_contact: float = math.nan
+    x_contact: float = math.nan
+    twist_ref: float = math.nan
+    t_preload: float = math.nan
+    z_hold_end: float = math.nan
+    z_engage_start: float = math.nan
+    z_pull_start: float = math.nan
+    f_peak: float = -math.inf
+    x_at_peak: float = math.nan
+    slip: bool = False
+    energy: float = 0.0
+    last_x: float = math.nan
+    last_f: float = math.nan
+    fit_n: int = 0
+    fit_sx: float = 0.0
+    fit_sy: float = 0.0
+    fit_sxx: float = 0.0
+    fit_sxy: float = 0.0
+    samples: int = 0
+
+    def update(self, block: np.ndarray) -> None:
+        """Consume one contiguous sample block (columns t, z, f_z, twist, x, f_t)."""
+        t, z, fz, tw, x, ft = block.T
+        self.samples += t.size
+        i = 0
+
+        if self.phase == APPROACH:
+            k = _first(fz >= max(CONTACT_FORCE_FRACTION * self.preload_n, 1e-3))
+            if k < 0:
+                return
+            i = k
+            self.z_contact, self.x_contact, self.twist_ref = float(z[i]), float(x[i]), float(tw[i])
+            self.phase = PLACEMENT
+
+        if self.phase == PLACEMENT:
+            if math.isnan(self.t_preload):
+                k = _first(fz[i:] >= PRELOAD_REACHED_FRACTION * self.preload_n)
+                if k >= 0:
+                    self.t_preload = float(t[i + k])
+            if not math.isnan(self.t_preload) and math.isnan(self.z_hold_end):
+                k = _first(t[i:] >= self.t_preload + PLACEMENT_HOLD_S)
+                if k >= 0:
+                    self.z_hold_end = float(z[i + k])
+            twist_k = _first(np.abs(tw[i:] - self.twist_ref) > TWIST_START_DEG)
+            pull_k = _first(x[i:] - self.x_contact > PULL_START_MM)
+            if twist_k >= 0 and (pull_k < 0 or twist_k < pull_k):
+                i += twist_k
+                self.z_engage_start = float(z[i])
+                self.phase = ENGAGEMENT
+            elif pull_k >= 0:
+                # Press-only: engagement is the hold after the minimum placement hold.
+                i += pull_k
+                self.z_engage_start = self.z_hold_end if not math.isnan(self.z_hold_end) else float(z[i])
+                self._start_pull(float(z[i]))
+            else:
+                return
+
+        if self.phase == ENGAGEMENT:
+            k = _first(x[i:] - self.x_contact > PULL_START_MM)
+            if k < 0:
+                return
+            i += k
+            self._start_pull(float(z[i]))
+
+        if self.phase == PULL and i < t.size:
+            self._pull(x[i:] - self.x_contact, ft[i:])
+
+    def _start_pull(self, z_now: float) -> None:
+        self.z_pull_start = z_now
+        self.phase = PULL
+
+    def _pull(self, xs: np.ndarray, fs: np.ndarray) -> None:
+        # Dissipated energy: trapezoid over this block plus the seam to the previous one.
+        if not math.isnan(self.last_x):
+            self.energy += 0.5 * (fs[0] + self.last_f) * (xs[0] - self.last_x)
+        self.energy += float(np.sum(0.5 * (fs[1:] + fs[:-1]) * np.diff(xs)))
+        self.last_x, self.last_f = float(xs[-1]), float(fs[-1])
+
+        running = np.maximum.accumulate(np.maximum(fs, self.f_peak))
+        drop = running - fs
+        self.slip = self.slip or bool(np.any((drop > SLIP_DROP_FRACTION * running) & (drop > SLIP_MIN_DROP_N)))
+        k = int(np.argmax(fs))
+        if fs[k] > self.f_peak:
+            self.f_peak, self.x_at_peak = float(fs[k]), float(xs[k])
+
+        fit = xs <= STIFFNESS_FIT_MM
+        if fit.any():
+            xf, yf = xs[fit], fs[fit]
+            self.fit_n += int(xf.size)
+            self.fit_sx += float(xf.sum())
+            self.fit_sy += float(yf.sum())
+            self.fit_sxx += float(xf @ xf)
+            self.fit_sxy += float(xf @ yf)
+
+    def metrics(self) -> dict[str, Any]:
+        if self.phase != PULL:
+            stage = ("approach", "placement", "engagement")[self.phase]
+            return {"error": f"no pull phase detected (ended in {stage})"}
+        denom = self.fit_n * self.fit_sxx - self.fit_sx ** 2
+        k_t = (self.fit_n * self.fit_sxy - self.fit_sx * self.fit_sy) / denom if self.fit_n >= 3 and denom > 0 else math.nan
+        return {
+            "delta_z_init_mm": round(self.z_engage_start - self.z_contact, 4),
+            "delta_z_engage_mm": round(self.z_pull_start - self.z_engage_start, 4),
+            "f_peak_N": round(self.f_peak, 4),
+            "k_t_N_per_mm": round(k_t, 4),
+            "x_slip_mm": round(self.x_at_peak, 4),
+            "e_diss_N_mm": round(self.energy, 4),
+            "slip_detected": self.slip,
+        }
+
+
+class TrialLogWriter:
+    """Template-ordered trial-log CSV; one row per finished `TrialAccumulator`."""
+
+    def __init__(self, f: Any) -> None:
+        self.fields = template_fields()
+        self.writer = csv.DictWriter(f, fieldnames=self.fields, lineterminator="\n")
+        self.writer.writeheader()
+        self.written = 0
+        self.failed = 0
+
+    def finish(self, meta: dict[str, str], acc: TrialAccumulator) -> None:
+        m = acc.metrics()
+        row = {k: meta.get(k, "") for k in self.fields}
+        if "error" in m:
+            self.failed += 1
+            row["notes"] = "; ".join(filter(None, [meta.get("notes", ""), m["error"]]))
+        else:
+            row.update(m)
+        self.writer.writerow(row)
+        self.written += 1
+
+
+def ingest(manifest_path: Path, raw_path: Path, out_path: Path, block_bytes: int = BLOCK_BYTES) -> tuple[int, int]:
+    """Stream ``raw_path`` into template rows at ``out_path``; returns (trials written, failed)."""
+    manifest = read_manifest(manifest_path)
+    seen: set[int] = set()
+    current: int | None = None
+    acc: TrialAccumulator | None = None
+
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    with out_path.open("w", encoding="utf-8", newline="") as f:
+        log = TrialLogWriter(f)
+        for block in iter_raw_blocks(raw_path, block_bytes):
+            trial_col = block[:, 0].astype(np.int64)
+            bounds = np.flatnonzero(np.diff(trial_col)) + 1
+            for seg in np.split(np.arange(block.shape[0]), bounds):
+                trial = int(trial_col[seg[0]])
+                if trial != current:
+                    if acc is not None and current is not None:
+                        log.finish(manifest[current], acc)
+                    if trial in seen:
+                        raise ValueError(f"{raw_path}: trial {trial} is not contiguous")
+                    if not 0 <= trial < len(manifest):
+                        raise ValueError(f"{raw_path}: trial {trial} has no manifest row")
+                    seen.add(trial)
+                    current = trial
+                    acc = TrialAccumulator(preload_n=float(manifest[trial]["preload_N"]))
+                acc.update(block[seg[0]: seg[-1] + 1, 1:])  # type: ignore[union-attr]
+        if acc is not None and current is not None:
+            log.finish(manifest[current], acc)
+    return log.written, log.failed
+
+
+def ingest_store(store_path: Path, out_path: Path) -> tuple[int, int]:
+    """Same as `ingest` but reading trials from a memory-mapped waveform store."""
+    from waveform_store import WaveformStore
+
+    store = WaveformStore(store_path)
+    manifest = read_manifest(store_path / "manifest.csv")
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    with out_path.open("w", encoding="utf-8", newline="") as f:
+        log = TrialLogWriter(f)
+        for i, meta in enumerate(manifest):
+            acc = TrialAccumulator(preload_n=float(meta["preload_N"]))
+            acc.update(np.asarray(store.trial(i), dtype=np.float64))
+            log.finish(meta, acc)
+    return log.written, log.failed
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--manifest", help="trial manifest CSV (row order = raw trial index)")
+    ap.add_argument("--raw", help="raw sample CSV")
+    ap.add_argument("--store", help="read trials from a waveform store directory instead of --manifest/--raw")
+    ap.add_argument("--out", default=str(DEFAULT_OUT), help="trial-log CSV in template column order")
+    ap.add_argument("--block-mb", type=float, default=BLOCK_BYTES / (1 << 20), help="read block size")
+    args = ap.parse_args()
+
+    if args.store:
+        written, failed = ingest_store(Path(args.store), Path(args.out))
+    elif args.manifest and args.raw:
+        written, failed = ingest(Path(args.manifest), Path(args.raw), Path(args.out), int(args.block_mb * (1 << 20)))
+    else:
+        ap.error("either --store or both --manifest and --raw are required")
+    print(f"Wrote {args.out} ({written} trials, {failed} without a complete pull)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""Scenario-matrix comparison of original vs patched reduced-order model.
+
+Expands the three hand-written `benchmark_runner` scenarios into a full grid
+over femur pitch, tibia theta, regolith mu, internal-mu wear scale and terrain
+(tens of thousands of states), evaluates both contact settings in one batched
+call each and summarises the traction delta per scenario family
+(terrain x pose band) with quantiles and the worst-k regressions.
+
+Terrain enters through the regolith friction: mu is scaled by
+tan(phi_terrain) / tan(phi_mare) from `RegolithProperties.from_type`.
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import math
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT.parent / "results" / "GPT" / "Robotics"))
+
+from models.lunar_integrated_weevil_leg import ContactModel, LegParams, evaluate_leg_states, load_params
+from regolith_contact_model import RegolithProperties, RegolithType  # type: ignore
+from report_io import HarnessReport, write_report
+from results_store import record
+
+REPORT_DIR = ROOT / "verification" / "reports"
+WORST_PATH = REPORT_DIR / "benchmark_matrix_worst.csv"
+MAX_DROP_FRACTION = 0.10  # same per-scenario floor as check_benchmark_regression.py
+SUCCESS_TRACTION_N = 1.0
+QUANTILES = (0.01, 0.05, 0.50, 0.95)
+
+TERRAINS = (RegolithType.MARE, RegolithType.HIGHLAND, RegolithType.MIXED, RegolithType.COMPACTED)
+# Pose bands named after the hand-written scenarios they generalise.
+POSE_BANDS = (("sinkage_recovery", -math.inf, -20.0), ("flat", -20.0, 0.0), ("slope", 0.0, math.inf))
+
+
+@dataclass(frozen=True)
+class MatrixAxes:
+    femur_pitch_deg: tuple[float, ...] = tuple(float(v) for v in np.linspace(-100.0, 55.0, 32))
+    tibia_theta_deg: tuple[float, ...] = tuple(float(v) for v in np.linspace(-80.0, 80.0, 17))
+    regolith_mu: tuple[float, ...] = (0.35, 0.45, 0.55, 0.65, 0.75)
+    internal_mu_scale: tuple[float, ...] = (0.5, 1.0, 2.0, 4.0)  # wear multiplier on both models
+
+
+@dataclass
+class ScenarioMatrix:
+    femur_pitch_deg: np.ndarray
+    tibia_theta_deg: np.ndarray
+    regolith_mu: np.ndarray  # terrain-scaled
+    internal_mu_scale: np.ndarray
+    terrain: np.ndarray  # index into TERRAINS
+    family: np.ndarray  # index into families()
+
+    @property
+    def size(self) -> int:
+        return int(self.femur_pitch_deg.shape[0])
+
+
+def families() -> list[str]:
+    return [f"{t.value}/{band}" for t in TERRAINS for band, _, _ in POSE_BANDS]
+
+
+def grid_fingerprint(axes: MatrixAxes = MatrixAxes()) -> str:
+    """Identity of the scenario ordering; per-scenario history is only comparable within one grid."""
+    spec = repr((axes, [t.value for t in TERRAINS], POSE_BANDS))
+    return hashlib.sha256(spec.encode()).hexdigest()[:16]
+
+
+def scenario_labels(axes: MatrixAxes = MatrixAxes()) -> list[str]:
+    m = build_matrix(axes)
+    fams = families()
+    return [
+        f"{fams[m.family[i]]} femur={m.femur_pitch_deg[i]:.1f} tibia={m.tibia_theta_deg[i]:.1f} "
+        f"mu={m.regolith_mu[i]:.3f} wear={m.internal_mu_scale[i]:g}"
+        for i in range(m.size)
+    ]
+
+
+def terrain_mu_scale(terrain: RegolithType) -> float:
+    ref = math.tan(math.radians(RegolithProperties.from_type(RegolithType.MARE).phi))
+    return math.tan(math.radians(RegolithProperties.from_type(terrain).phi)) / ref
+
+
+def build_matrix(axes: MatrixAxes = MatrixAxes()) -> ScenarioMatrix:
+    grids = np.meshgrid(
+        np.asarray(axes.femur_pitch_deg),
+        np.asarray(axes.tibia_theta_deg),
+        np.asarray(axes.regolith_mu),
+        np.asarray(axes.internal_mu_scale),
+        np.arange(len(TERRAINS)),
+        indexing="ij",
+    )
+    femur, tibia, mu, wear, terrain = (g.ravel() for g in grids)
+    scales = np.array([terrain_mu_scale(t) for t in TERRAINS])
+    band = np.zeros(femur.shape, dtype=int)
+    for i, (_, lo, hi) in enumerate(POSE_BANDS):
+        band[(femur >= lo) & (femur < hi)] = i
+    return ScenarioMatrix(
+        femur_pitch_deg=femur,
+        tibia_theta_deg=tibia,
+        regolith_mu=mu * scales[terrain],
+        internal_mu_scale=wear,
+        terrain=terrain,
+        family=terrain * len(POSE_BANDS) + band,
+    )
+
+
+def evaluate(matrix: ScenarioMatrix, params: LegParams, contact: ContactModel) -> tuple[np.ndarray, np.ndarray]:
+    """(traction_n, success) for every scenario under ``contact`` (internal mu scaled per scenario)."""
+    out = evaluate_leg_states(
+        np.zeros(matrix.size),
+        matrix.femur_pitch_deg,
+        matrix.tibia_theta_deg,
+        params,
+        regolith_mu=matrix.regolith_mu,
+        internal_mu=contact.internal_mu * matrix.internal_mu_scale,
+    )
+    return out.traction_n, out.reachable & (out.traction_n > SUCCESS_TRACTION_N)
+
+
+def compare(
+    original: ContactModel, patched: ContactModel, axes: MatrixAxes = MatrixAxes(), worst_k: int = 5
+) -> tuple[list[dict], list[dict], dict[str, np.ndarray]]:
+    """Per-family summary rows, worst-k rows and the raw per-scenario traction vectors."""
+    params = load_params()
+    m = build_matrix(axes)
+    t_orig, ok_orig = evaluate(m, params, original)
+    t_pat, ok_pat = evaluate(m, params, patched)
+    rel = (t_pat - t_orig) / np.maximum(t_orig, 1e-12)
+    regressed = (ok_orig & ~ok_pat) | (rel < -MAX_DROP_FRACTION)
+
+    summary: list[dict] = []
+    worst: list[dict] = []
+    for fam_idx, fam in enumerate(families()):
+        sel = np.flatnonzero(m.family == fam_idx)
+        if sel.size == 0:
+            continue
+        q = np.quantile(rel[sel], QUANTILES)
+        summary.append(
+            {
+                "family": fam,
+                "scenarios": int(sel.size),
+                "original_success_rate": round(float(ok_orig[sel].mean()), 4),
+                "patched_success_rate": round(float(ok_pat[sel].mean()), 4),
+                **{f"rel_delta_p{int(round(qq * 100)):02d}": round(float(v), 5) for qq, v in zip(QUANTILES, q)},
+                "rel_delta_min": round(float(rel[sel].min()), 5),
+                "success_lost": int(np.count_nonzero(ok_orig[sel] & ~ok_pat[sel])),
+                "regressions": int(np.count_nonzero(regressed[sel])),
+                "pass": not bool(regressed[sel].any()),
+            }
+        )
+        # Worst first: lost success, then most negative relative delta.
+        order = sel[np.lexsort((rel[sel], ~(ok_orig[sel] & ~ok_pat[sel])))][:worst_k]
+        for rank, i in enumerate(order, start=1):
+            worst.append(
+                {
+                    "family": fam,
+                    "rank": rank,
+                    "femur_pitch_deg": round(float(m.femur_pitch_deg[i]), 3),
+                    "tibia_theta_deg": round(float(m.tibia_theta_deg[i]), 3),
+                    "regolith_mu": round(float(m.regolith_mu[i]), 4),
+                    "original_internal_mu": round(original.internal_mu * float(m.internal_mu_scale[i]), 5),
+                    "patched_internal_mu": round(patched.internal_mu * float(m.internal_mu_scale[i]), 5),
+                    "original_traction_n": round(float(t_orig[i]), 4),
+                    "patched_traction_n": round(float(t_pat[i]), 4),
+                    "rel_delta": round(float(rel[i]), 5),
+                    "original_success": bool(ok_orig[i]),
+                    "patched_success": bool(ok_pat[i]),
+                    "regression": bool(regressed[i]),
+                }
+            )
+    return summary, worst, {"original_traction_n": t_orig, "patched_traction_n": t_pat}
+
+
+def run_matrix(original: ContactModel, patched: ContactModel, worst_k: int = 5) -> int:
+    axes = MatrixAxes()
+    summary, worst, traction = compare(original, patched, axes, worst_k=worst_k)
+    total = sum(r["scenarios"] for r in summary)
+    n_reg = sum(r["regressions"] for r in summary)
+
+    md_lines = [
+        "# Benchmark Scenario Matrix",
+        "",
+        f"Original internal_mu={original.internal_mu} vs patched internal_mu={patched.internal_mu}, "
+        f"{total} scenarios ({len(axes.femur_pitch_deg)} femur x {len(axes.tibia_theta_deg)} tibia x "
+        f"{len(axes.regolith_mu)} regolith mu x {len(axes.internal_mu_scale)} wear x {len(TERRAINS)} terrains).",
+        "",
+        f"Regression = success lost or traction more than {MAX_DROP_FRACTION:.0%} below original. "
+        f"Regressions found: **{n_reg}**",
+        "",
+        "| family | n | success orig | success patched | rel delta p01 | p50 | p95 | min | regressions |",
+        "|---|---|---|---|---|---|---|---|---|",
+    ]
+    for r in summary:
+        md_lines.append(
+            f"| {r['family']} | {r['scenarios']} | {r['original_success_rate']:.3f} | {r['patched_success_rate']:.3f} | "
+            f"{r['rel_delta_p01']:+.4f} | {r['rel_delta_p50']:+.4f} | {r['rel_delta_p95']:+.4f} | "
+            f"{r['rel_delta_min']:+.4f} | {r['regressions']} |"
+        )
+    md_lines += ["", f"Worst-{worst_k} scenarios per family: `{WORST_PATH.name}`."]
+
+    rep = HarnessReport("benchmark_matrix", summary, md_lines)
+    csv_path, md_path = write_report(rep, REPORT_DIR)
+    fingerprint = grid_fingerprint(axes)
+    record(
+        [rep],
+        source="benchmark_matrix",
+        vectors={
+            f"benchmark_matrix.{name}": (fingerprint, np.ascontiguousarray(v, dtype="<f8").tobytes(), int(v.size))
+            for name, v in traction.items()
+        },
+    )
+    with WORST_PATH.open("w", encoding="utf-8", newline="") as f:
+        w = csv.DictWriter(f, fieldnames=list(worst[0].keys()))
+        w.writeheader()
+        w.writerows(worst)
+
+    print(f"Wrote {csv_path}")
+    print(f"Wrote {md_path}")
+    print(f"Wrote {WORST_PATH}")
+    for r in summary:
+        print(f"{r['family']:<28} n={r['scenarios']:<6} p01={r['rel_delta_p01']:+.4f} "
+              f"p50={r['rel_delta_p50']:+.4f} regressions={r['regressions']}")
+    return 1 if n_reg else 0
@@ -1,8 +1,13 @@
 #!/usr/bin/env python3
-"""Run simple scenario benchmarks for original vs patched reduced-order model."""
+"""Run simple scenario benchmarks for original vs patched reduced-order model.
+
+`--matrix` additionally runs the batched scenario matrix (`benchmark_matrix.py`,
+needs numpy) and exits non-zero if any scenario family regresses.
+"""
 
 from __future__ import annotations
 
+import argparse
 import csv
 import sys
 from dataclasses import dataclass
@@ -47,9 +52,36 @@ def run(contact: ContactModel) -> list[tuple[str, float, bool]]:
     return rows
 
 
+def record_comparison(original: list[tuple[str, float, bool]], patched: list[tuple[str, float, bool]]) -> None:
+    """Append the comparison rows to the results store (history for `regression_engine.py`)."""
+    from report_io import HarnessReport
+    from results_store import record
+
+    rows = [
+        {
+            "scenario": o[0],
+            "original_traction_n": round(o[1], 4),
+            "patched_traction_n": round(p[1], 4),
+            "original_success": o[2],
+            "patched_success": p[2],
+        }
+        for o, p in zip(original, patched)
+    ]
+    record([HarnessReport(OUT_PATH.stem, rows, [])], source="benchmark_runner")
+
+
+ORIGINAL_CONTACT = ContactModel(regolith_mu=0.55, internal_mu=0.02)
+PATCHED_CONTACT = ContactModel(regolith_mu=0.55, internal_mu=0.004)
+
+
 def main() -> int:
-    original = run(ContactModel(regolith_mu=0.55, internal_mu=0.02))
-    patched = run(ContactModel(regolith_mu=0.55, internal_mu=0.004))
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--matrix", action="store_true", help="also run the full scenario matrix")
+    ap.add_argument("--worst-k", type=int, default=5, help="worst scenarios listed per family in matrix mode")
+    args = ap.parse_args()
+
+    original = run(ORIGINAL_CONTACT)
+    patched = run(PATCHED_CONTACT)
 
     OUT_PATH.parent.mkdir(parents=True, exist_ok=True)
     with OUT_PATH.open("w", encoding="utf-8", newline="") as f:
@@ -57,10 +89,16 @@ def main() -> int:
         writer.writerow(["scenario", "original_traction_n", "patched_traction_n", "original_success", "patched_success"])
         for o, p in zip(original, patched):
             writer.writerow([o[0], round(o[1], 4), round(p[1], 4), o[2], p[2]])
+    record_comparison(original, patched)
 
     print(f"Wrote {OUT_PATH}")
     for o, p in zip(original, patched):
         print(f"{o[0]}: original={o[1]:.3f}N patched={p[1]:.3f}N")
+
+    if args.matrix:
+        from benchmark_matrix import run_matrix
+
+        return run_matrix(ORIGINAL_CONTACT, PATCHED_CONTACT, worst_k=args.worst_k)
     return 0
 
 
@@ -1,15 +1,29 @@
 #!/usr/bin/env python3
-"""Fail CI when benchmark traction regresses beyond threshold."""
+"""Fail CI when benchmark traction or kernel throughput regresses beyond threshold.
+
+Guards 1-2 are fixed 10% floors (same run, committed baseline); guard 3 is the
+per-machine throughput check; guard 4 scores every scenario against a rolling
+window of stored runs (`regression_engine.py`) once enough history exists.
+
+Guards 3-4 are local-only: they need a machine baseline or a results store
+with run history (and numpy), none of which CI has. Without them they print a
+SKIP line; `--require-perf` / `--require-history` make the absence fatal.
+"""
 
 from __future__ import annotations
 
+import argparse
 import csv
+import json
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
 REPORT = ROOT / "verification" / "reports" / "benchmark_comparison.csv"
 BASELINE = ROOT / "verification" / "baselines" / "benchmark_baseline.csv"
 MAX_DROP_FRACTION = 0.10  # 10%
+PERF_REPORT = ROOT / "verification" / "reports" / "perf_benchmark.csv"
+PERF_BASELINE_DIR = ROOT / "verification" / "baselines" / "perf"
+MAX_THROUGHPUT_DROP_FRACTION = 0.25  # wall-clock noise is larger than model noise
 
 
 def load_rows(path: Path) -> dict[str, dict[str, float]]:
@@ -25,7 +39,79 @@ def load_rows(path: Path) -> dict[str, dict[str, float]]:
         return out
 
 
+def check_throughput(report: Path, baseline_dir: Path, max_drop: float, require: bool) -> None:
+    """Guard 3: kernel throughput vs this machine's stored perf baseline."""
+    if not report.exists():
+        if require:
+            raise SystemExit(f"Missing perf report: {report}")
+        print("SKIP throughput check: no perf report (local-only; run verification/perf_benchmark.py first).")
+        return
+    with report.open("r", encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    if not rows:
+        raise SystemExit(f"Empty perf report: {report}")
+
+    machine = rows[0]["machine_id"]
+    baseline = baseline_dir / f"{machine}.json"
+    if not baseline.exists():
+        if require:
+            raise SystemExit(f"No perf baseline for machine '{machine}' ({baseline})")
+        print(f"SKIP throughput check: no perf baseline for machine '{machine}' "
+              "(local-only; write one with perf_benchmark.py --update-baseline).")
+        return
+    kernels = json.loads(baseline.read_text(encoding="utf-8"))["kernels"]
+
+    failures = []
+    for row in rows:
+        base = kernels.get(row["kernel"])
+        if base is None:
+            continue
+        current = float(row["ops_per_s"])
+        change = current / float(base["ops_per_s"]) - 1.0
+        drop = -change
+        print(f"perf {row['kernel']:<26} {current:12.1f}/s vs baseline {float(base['ops_per_s']):12.1f}/s ({change:+.1%})")
+        if drop > max_drop:
+            failures.append(f"{row['kernel']} throughput down {drop:.1%}")
+    if failures:
+        raise SystemExit(f"Throughput regression (> {max_drop:.0%} below baseline): " + "; ".join(failures))
+
+
+def check_statistical_shifts(window: int, require: bool) -> None:
+    """Guard 4: per-scenario robust z-score shift vs the rolling results-store history."""
+    def skip(reason: str) -> None:
+        if require:
+            raise SystemExit(f"Statistical shift check cannot run: {reason}")
+        print(f"SKIP statistical shift check: {reason} (local-only; --require-history makes this fatal).")
+
+    try:
+        from regression_engine import MIN_HISTORY, scan, write_shifts
+        from results_store import ResultsStore, db_path
+    except ImportError as exc:  # numpy not installed
+        skip(f"unavailable ({exc})")
+        return
+    if not db_path().exists():
+        skip(f"no results store at {db_path()}")
+        return
+    with ResultsStore() as store:
+        results, skipped = scan(store, window)
+    for name in skipped:
+        skip(f"{name} has fewer than {MIN_HISTORY + 1} stored runs")
+    write_shifts(results)
+    shifted = [f"{r.source}: {int(r.flagged.sum())} scenarios" for r in results if r.flagged.any()]
+    if shifted:
+        raise SystemExit("Statistically significant drop vs rolling baseline: " + "; ".join(shifted))
+
+
 def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--perf-report", default=str(PERF_REPORT))
+    ap.add_argument("--perf-baseline-dir", default=str(PERF_BASELINE_DIR))
+    ap.add_argument("--max-throughput-drop", type=float, default=MAX_THROUGHPUT_DROP_FRACTION)
+    ap.add_argument("--require-perf", action="store_true", help="fail when the perf report or machine baseline is missing")
+    ap.add_argument("--history-window", type=int, default=30, help="stored runs forming the rolling baseline")
+    ap.add_argument("--require-history", action="store_true", help="fail when the shift check cannot run")
+    args = ap.parse_args()
+
     if not REPORT.exists():
         raise SystemExit(f"Missing report: {REPORT}")
 
@@ -54,6 +140,9 @@ def main() -> int:
                     f"< baseline floor {floor:.4f}"
                 )
 
+    check_throughput(Path(args.perf_report), Path(args.perf_baseline_dir), args.max_throughput_drop, args.require_perf)
+    check_statistical_shifts(args.history_window, args.require_history)
+
     print("Benchmark regression checks passed.")
     return 0
 
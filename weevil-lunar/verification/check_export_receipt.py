@@ -1,16 +1,19 @@
 #!/usr/bin/env python3
-"""Validate CAD export receipt presence, shape, freshness, and param hash consistency."""
+"""Validate CAD export receipt presence, shape, freshness, param hash and artifact hashes."""
 
 from __future__ import annotations
 
 import argparse
 import datetime as dt
-import hashlib
 import json
 import re
+import sys
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "cad" / "scripts"))
+from artifact_hash import hash_files  # type: ignore
+
 PARAMS = ROOT / "cad" / "weevil_leg_params.yaml"
 DEFAULT_RECEIPT = ROOT / "cad" / "exports" / "latest" / "export_receipt_v0.4.json"
 
@@ -28,10 +31,6 @@ REQUIRED_KEYS = {
 }
 
 
-def sha256(path: Path) -> str:
-    return hashlib.sha256(path.read_bytes()).hexdigest()
-
-
 def parse_ts(ts: str) -> dt.datetime:
     return dt.datetime.fromisoformat(ts.replace("Z", "+00:00"))
 
@@ -57,7 +56,7 @@ def main() -> int:
     if len(data["notes"].strip()) < 10:
         raise SystemExit("notes must be at least 10 characters")
 
-    expected_param_hash = sha256(PARAMS)
+    expected_param_hash = hash_files([PARAMS])[PARAMS]
     if data["params_hash_sha256"] != expected_param_hash:
         raise SystemExit(
             f"params_hash_sha256 mismatch: receipt={data['params_hash_sha256']} current={expected_param_hash}"
@@ -67,10 +66,14 @@ def main() -> int:
     if not artifacts:
         raise SystemExit("Receipt exported_files list is empty")
 
-    for artifact in artifacts:
-        p = ROOT / artifact["path"]
-        if not p.exists():
-            raise SystemExit(f"Missing artifact declared in receipt: {artifact['path']}")
+    missing_files = [a["path"] for a in artifacts if not (ROOT / a["path"]).exists()]
+    if missing_files:
+        raise SystemExit(f"Missing artifacts declared in receipt: {missing_files}")
+
+    digests = hash_files([ROOT / a["path"] for a in artifacts])
+    mismatched = [a["path"] for a in artifacts if digests[ROOT / a["path"]] != a["sha256"]]
+    if mismatched:
+        raise SystemExit(f"Artifact sha256 mismatch (receipt vs current file): {mismatched}")
 
     ts = parse_ts(data["timestamp_utc"])
     age_days = (dt.datetime.now(dt.timezone.utc) - ts).days
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""Wall-clock benchmark of the hot model kernels.
+
+Each kernel is warmed up, its inner loop count is calibrated so one repeat
+takes at least `--min-time` seconds, then `--repeats` repeats are timed. The
+per-call median and IQR are reported together with throughput (calls/s).
+
+Baselines are per machine (`verification/baselines/perf/<machine_id>.json`)
+because absolute timings do not transfer between hosts; write one with
+`--update-baseline` and gate with `check_benchmark_regression.py`. None is
+committed and CI does not run this benchmark, so the throughput gate is
+local-only.
+
+`--profile` instead runs each kernel once under the opt-in span profiler
+(`results/GPT/Robotics/weevil_profiling.py`) and writes a Chrome/Perfetto trace plus
+a flat self-time table, e.g. Newton iterations per `depth_from_normal_load`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import re
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+ROBOTICS_DIR = ROOT.parent / "results" / "GPT" / "Robotics"
+sys.path.append(str(ROOT))
+sys.path.append(str(ROBOTICS_DIR))
+
+from models.lunar_integrated_weevil_leg import (
+    LUNAR_G,
+    PARAMS_PATH,
+    ContactModel,
+    LegState,
+    evaluate_leg_state,
+    load_params,
+)
+from morphology_harness import build_leg, hull_volume, morphologies, workspace_cloud  # type: ignore
+from regolith_contact_model import FootGeometry, RegolithContactModel, RegolithProperties, RegolithType  # type: ignore
+from weevil_lunar_tests import slope_rescue_sweep  # type: ignore
+import weevil_profiling  # type: ignore
+from simple_yaml import load_yaml_text  # type: ignore
+
+OUT_PATH = ROOT / "verification" / "reports" / "perf_benchmark.csv"
+BASELINE_DIR = ROOT / "verification" / "baselines" / "perf"
+TRACE_PATH = ROOT / "verification" / "reports" / "profile_trace.json"
+PROFILE_SUMMARY_PATH = ROOT / "verification" / "reports" / "profile_summary.csv"
+FIELDNAMES = ["kernel", "loops", "repeats", "median_us", "iqr_us", "ops_per_s", "machine_id"]
+
+
+@dataclass(frozen=True)
+class KernelTiming:
+    kernel: str
+    loops: int
+    repeats: int
+    median_us: float
+    iqr_us: float
+    ops_per_s: float
+    machine_id: str
+
+
+def machine_id() -> str:
+    """Host fingerprint: hostname, CPU arch/count and interpreter + numpy version."""
+    node = re.sub(r"[^A-Za-z0-9_.-]+", "-", platform.node() or "unknown")
+    fingerprint = "|".join(
+        [platform.system(), platform.machine(), platform.processor(), str(os.cpu_count()),
+         platform.python_version(), np.__version__]
+    )
+    return f"{node}-{platform.machine()}-{hashlib.sha256(fingerprint.encode()).hexdigest()[:8]}"
+
+
+def baseline_path(mid: str | None = None) -> Path:
+    return BASELINE_DIR / f"{mid or machine_id()}.json"
+
+
+def calibrate(fn: Callable[[], object], min_time: float) -> int:
+    """Smallest power-of-two loop count whose run takes at least ``min_time`` seconds."""
+    loops = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        if time.perf_counter() - t0 >= min_time or loops >= 1 << 20:
+            return loops
+        loops *= 2
+
+
+def time_kernel(name: str, fn: Callable[[], object], repeats: int = 7, warmup: int = 2,
+                min_time: float = 0.05, mid: str = "") -> KernelTiming:
+    for _ in range(warmup):
+        fn()
+    loops = calibrate(fn, min_time)
+    per_call: list[float] = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        per_call.append((time.perf_counter() - t0) / loops)
+    q = statistics.quantiles(per_call, n=4, method="inclusive") if repeats > 1 else [per_call[0]] * 3
+    median = statistics.median(per_call)
+    return KernelTiming(name, loops, repeats, median * 1e6, (q[2] - q[0]) * 1e6, 1.0 / median, mid)
+
+
+def kernels() -> dict[str, Callable[[], object]]:
+    """Zero-argument callables for each benchmarked kernel (setup done here)."""
+    params = load_params()
+    body_load = params.body_mass_kg * LUNAR_G / 3.0
+    mare = RegolithProperties.from_type(RegolithType.MARE)
+    foot = FootGeometry.circular(
+        radius=params.foot_radius_mm / 1000.0,
+        cleat_gain_forward=params.cleat_forward_gain,
+        cleat_gain_lateral=params.cleat_lateral_gain,
+        cleat_engage_threshold_preload=params.preload_n,
+    )
+    model = RegolithContactModel(mare, foot, gravity=LUNAR_G)
+    loads = np.linspace(0.5, 2.0, 4096) * body_load
+
+    beetle = build_leg(next(s for s in morphologies() if "Weevil" in s.name))
+    contact = ContactModel(regolith_mu=0.55, internal_mu=0.004)
+    state = LegState(coxa_yaw_deg=0.0, femur_pitch_deg=-30.0, tibia_theta_deg=60.0)
+
+    def workspace_fk_hull() -> float:
+        return hull_volume(workspace_cloud(beetle, 2000, np.random.default_rng(7)))
+
+    return {
+        "contact_solve": lambda: model.compute_contact_forces_with_preload(body_load, preload_normal=params.preload_n),
+        "contact_solve_batch4096": lambda: model.compute_contact_forces_with_preload_batch(
+            loads, preload_normal=params.preload_n
+        ),
+        "slope_rescue_sweep": lambda: slope_rescue_sweep(mare, body_load, gravity=LUNAR_G),
+        "workspace_fk_hull": workspace_fk_hull,
+        "evaluate_leg_state": lambda: evaluate_leg_state(state, params, contact),
+        # Pinned to the repo's loader: load_params() switches to PyYAML when it is installed.
+        "yaml_load_params": lambda: load_yaml_text(PARAMS_PATH.read_text(encoding="utf-8")),
+    }
+
+
+def run(only: list[str] | None = None, repeats: int = 7, warmup: int = 2, min_time: float = 0.05) -> list[KernelTiming]:
+    mid = machine_id()
+    return [
+        time_kernel(name, fn, repeats=repeats, warmup=warmup, min_time=min_time, mid=mid)
+        for name, fn in kernels().items()
+        if not only or name in only
+    ]
+
+
+def profile_kernels(only: list[str] | None = None) -> weevil_profiling.Profiler:
+    """One warm call per kernel, then one profiled call inside a `kernel.<name>` span."""
+    selected = {name: fn for name, fn in kernels().items() if not only or name in only}
+    for fn in selected.values():
+        fn()
+    with weevil_profiling.session() as prof:
+        for name, fn in selected.items():
+            weevil_profiling.instrument(f"kernel.{name}")(fn)()
+    return prof
+
+
+def write_baseline(timings: list[KernelTiming], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "machine_id": timings[0].machine_id if timings else machine_id(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "kernels": {t.kernel: asdict(t) for t in timings},
+    }
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--kernel", action="append", default=None, help="benchmark only this kernel (repeatable)")
+    ap.add_argument("--repeats", type=int, default=7)
+    ap.add_argument("--warmup", type=int, default=2)
+    ap.add_argument("--min-time", type=float, default=0.05, help="minimum seconds per timed repeat")
+    ap.add_argument("--update-baseline", action="store_true", help="store results as this machine's baseline")
+    ap.add_argument("--profile", action="store_true", help="profile one call per kernel instead of timing")
+    args = ap.parse_args()
+
+    if args.profile:
+        weevil_profiling.enable()
+        prof = profile_kernels(args.kernel)
+        TRACE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        print(prof.format_table())
+        print(f"Wrote {prof.write_chrome_trace(TRACE_PATH)}")
+        print(f"Wrote {prof.write_summary_csv(PROFILE_SUMMARY_PATH)}")
+        return 0
+
+    sys.path.insert(0, str(ROOT / "verification"))
+    from report_io import HarnessReport, write_report
+    from results_store import record
+
+    timings = run(args.kernel, repeats=args.repeats, warmup=args.warmup, min_time=args.min_time)
+    rows = [{k: (round(v, 3) if isinstance(v, float) else v) for k, v in asdict(t).items()} for t in timings]
+    md_lines = [
+        "# Kernel Performance Benchmark",
+        "",
+        f"Machine: `{machine_id()}` (Python {platform.python_version()}, numpy {np.__version__})",
+        "",
+        "| kernel | loops x repeats | median (us) | IQR (us) | calls/s |",
+        "|---|---|---|---|---|",
+    ]
+    for t in timings:
+        md_lines.append(
+            f"| {t.kernel} | {t.loops} x {t.repeats} | {t.median_us:.2f} | {t.iqr_us:.2f} | {t.ops_per_s:.1f} |"
+        )
+    rep = HarnessReport(OUT_PATH.stem, rows, md_lines, fieldnames=FIELDNAMES)
+    csv_path, md_path = write_report(rep, OUT_PATH.parent)
+    record([rep], source="perf_benchmark")
+
+    print(f"Wrote {csv_path}")
+    print(f"Wrote {md_path}")
+    for t in timings:
+        print(f"{t.kernel:<26} {t.median_us:12.2f} us  IQR {t.iqr_us:10.2f} us  {t.ops_per_s:12.1f}/s")
+    if args.update_baseline:
+        path = baseline_path()
+        write_baseline(timings, path)
+        print(f"Wrote {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""Rolling-baseline regression detection for benchmark history.
+
+For every scenario the last `--window` stored runs (results store) form the
+baseline; the newest run is scored with a robust z-score
+
+    z = (x - median) / (1.4826 * MAD)
+
+computed column-wise over a (runs x scenarios) array, so the full benchmark
+matrix (~44k scenarios) is scored in one pass. Deterministic histories have
+MAD = 0, so the scale is floored at a small fraction of the median; a shift
+is only flagged if it is both significant (|z| > threshold) and material
+(relative change > `--min-shift`).
+
+Sources scored:
+- `benchmark_comparison` rows (one metric per scenario, from `metrics`)
+- `benchmark_matrix.*` per-scenario vectors (from `vectors`, same grid only)
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from report_io import REPORT_DIR
+from results_store import ResultsStore
+
+MAD_TO_SIGMA = 1.4826
+DEFAULT_WINDOW = 30
+MIN_HISTORY = 5
+Z_THRESHOLD = 3.5  # Iglewicz-Hoaglin outlier cut-off
+MIN_REL_SHIFT = 0.005
+REL_SCALE_FLOOR = 1e-3
+SHIFTS_PATH = REPORT_DIR / "benchmark_shifts.csv"
+
+
+@dataclass(frozen=True)
+class ShiftResult:
+    source: str
+    keys: list[str]
+    current: np.ndarray
+    median: np.ndarray
+    z: np.ndarray
+    rel_shift: np.ndarray
+    flagged: np.ndarray
+    history_runs: int
+
+    def flagged_rows(self, limit: int | None = None) -> list[dict]:
+        idx = np.flatnonzero(self.flagged)
+        idx = idx[np.argsort(self.z[idx])]  # most negative first
+        if limit is not None:
+            idx = idx[:limit]
+        return [
+            {
+                "source": self.source,
+                "key": self.keys[i],
+                "current": round(float(self.current[i]), 6),
+                "baseline_median": round(float(self.median[i]), 6),
+                "rel_shift": round(float(self.rel_shift[i]), 6),
+                "robust_z": round(float(self.z[i]), 3),
+                "history_runs": self.history_runs,
+            }
+            for i in idx
+        ]
+
+
+def robust_z(history: np.ndarray, current: np.ndarray, rel_floor: float = REL_SCALE_FLOOR) -> tuple[np.ndarray, np.ndarray]:
+    """Column-wise (median, z) of ``current`` against ``history`` (runs x scenarios, NaN = missing)."""
+    median = np.nanmedian(history, axis=0)
+    mad = np.nanmedian(np.abs(history - median), axis=0) * MAD_TO_SIGMA
+    scale = np.maximum(mad, np.maximum(rel_floor * np.abs(median), 1e-12))
+    return median, (current - median) / scale
+
+
+def detect_shifts(
+    source: str,
+    history: np.ndarray,
+    current: np.ndarray,
+    keys: list[str],
+    z_threshold: float = Z_THRESHOLD,
+    min_rel_shift: float = MIN_REL_SHIFT,
+    direction: str = "drop",
+) -> ShiftResult:
+    """Flag scenarios whose newest value shifted beyond ``z_threshold`` robust sigmas.
+
+    ``direction`` is "drop" (higher is better), "rise" (lower is better) or "both".
+    """
+    median, z = robust_z(history, current)
+    rel = (current - median) / np.maximum(np.abs(median), 1e-12)
+    if direction == "drop":
+        flagged = (z < -z_threshold) & (rel < -min_rel_shift)
+    elif direction == "rise":
+        flagged = (z > z_threshold) & (rel > min_rel_shift)
+    else:
+        flagged = (np.abs(z) > z_threshold) & (np.abs(rel) > min_rel_shift)
+    flagged &= np.isfinite(z)
+    return ShiftResult(source, keys, current, median, z, rel, flagged, history.shape[0])
+
+
+def metric_shifts(store: ResultsStore, harness: str, metric: str, window: int = DEFAULT_WINDOW,
+                  **kwargs) -> ShiftResult | None:
+    rows = store.metric_history(harness, metric, last=window + 1)
+    runs = list(dict.fromkeys(r[0] for r in rows))
+    if len(runs) < MIN_HISTORY + 1:
+        return None
+    keys = list(dict.fromkeys(r[2] for r in rows))
+    run_idx = {r: i for i, r in enumerate(runs)}
+    key_idx = {k: i for i, k in enumerate(keys)}
+    table = np.full((len(runs), len(keys)), np.nan)
+    for run_id, _, key, value in rows:
+        table[run_idx[run_id], key_idx[key]] = value
+    return detect_shifts(f"{harness}.{metric}", table[:-1], table[-1], keys, **kwargs)
+
+
+def vector_shifts(store: ResultsStore, name: str, fingerprint: str, keys: list[str],
+                  window: int = DEFAULT_WINDOW, **kwargs) -> ShiftResult | None:
+    hist = store.vector_history(name, fingerprint, last=window + 1)
+    if len(hist) < MIN_HISTORY + 1:
+        return None
+    table = np.stack([np.frombuffer(data, dtype="<f8") for _, data in hist])
+    return detect_shifts(name, table[:-1], table[-1], keys, **kwargs)
+
+
+def scan(store: ResultsStore, window: int = DEFAULT_WINDOW, **kwargs) -> tuple[list[ShiftResult], list[str]]:
+    """Score every benchmark source; returns (results, names skipped for lack of history)."""
+    from benchmark_matrix import grid_fingerprint, scenario_labels
+
+    candidates = {
+        "benchmark_comparison.patched_traction_n": lambda: metric_shifts(
+            store, "benchmark_comparison", "patched_traction_n", window, **kwargs
+        ),
+        "benchmark_matrix.patched_traction_n": lambda: vector_shifts(
+            store, "benchmark_matrix.patched_traction_n", grid_fingerprint(), scenario_labels(), window, **kwargs
+        ),
+    }
+    results: list[ShiftResult] = []
+    skipped: list[str] = []
+    for name, score in candidates.items():
+        res = score()
+        if res is None:
+            skipped.append(name)
+        else:
+            results.append(res)
+    return results, skipped
+
+
+def write_shifts(results: list[ShiftResult], path: Path = SHIFTS_PATH) -> Path:
+    fieldnames = ["source", "key", "current", "baseline_median", "rel_shift", "robust_z", "history_runs"]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as f:
+        w = csv.DictWriter(f, fieldnames=fieldnames)
+        w.writeheader()
+        for res in results:
+            w.writerows(res.flagged_rows())
+    return path
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--window", type=int, default=DEFAULT_WINDOW, help="baseline runs per scenario")
+    ap.add_argument("--z", type=float, default=Z_THRESHOLD, help="robust z threshold")
+    ap.add_argument("--min-shift", type=float, default=MIN_REL_SHIFT, help="minimum relative shift to flag")
+    ap.add_argument("--show", type=int, default=10, help="flagged scenarios printed per source")
+    args = ap.parse_args()
+
+    with ResultsStore() as store:
+        results, skipped = scan(store, args.window, z_threshold=args.z, min_rel_shift=args.min_shift)
+    for name in skipped:
+        print(f"{name}: fewer than {MIN_HISTORY + 1} stored runs; skipped")
+    path = write_shifts(results)
+    n_flagged = 0
+    for res in results:
+        count = int(np.count_nonzero(res.flagged))
+        n_flagged += count
+        print(f"{res.source}: {count}/{len(res.keys)} scenarios shifted (window {res.history_runs} runs)")
+        for row in res.flagged_rows(limit=args.show):
+            print(f"  {row['key']:<60} {row['current']:.4f} vs {row['baseline_median']:.4f} "
+                  f"({row['rel_shift']:+.2%}, z={row['robust_z']:.1f})")
+    print(f"Wrote {path}")
+    return 1 if n_flagged else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Shared report plumbing for verification harnesses.
+
+Every `verification/test_*.py` exposes `report() -> HarnessReport`. Its
+`main()` writes that report standalone; `run_verification.py` collects many
+reports in memory and writes them in one batch. Both also append the rows to
+the results store (`results_store.py`), of which the report files are a view.
+"""
+
+from __future__ import annotations
+
+import csv
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+REPORT_DIR = ROOT / "verification" / "reports"
+
+
+@dataclass
+class HarnessReport:
+    name: str  # report stem: <name>.csv / <name>.md
+    rows: list[dict[str, Any]]
+    md_lines: list[str]
+    fieldnames: list[str] | None = None
+    log_lines: list[str] = field(default_factory=list)
+
+    @property
+    def csv_name(self) -> str:
+        return f"{self.name}.csv"
+
+    @property
+    def status(self) -> str:
+        return status_from_rows(self.rows)
+
+
+NOT_RUN = "not_run"
+
+
+def is_true(value: Any) -> bool:
+    return str(value).lower() in {"true", "1"}
+
+
+def status_from_rows(rows: list[dict[str, Any]]) -> str:
+    """Rows with a blank ``pass`` are informational and do not count, unless every row is blank.
+
+    A report whose rows all carry ``status`` NOT_RUN (no input data yet) is NOT_RUN.
+    """
+    if not rows:
+        return "missing"
+    if all(r.get("status") == NOT_RUN for r in rows):
+        return NOT_RUN
+    gated = [r for r in rows if str(r.get("pass", "")).strip()] or rows
+    if all(is_true(r.get("pass", "")) for r in gated):
+        return "pass"
+    if any(is_true(r.get("pass", "")) for r in gated):
+        return "partial"
+    return "fail"
+
+
+def write_report(report: HarnessReport, report_dir: Path = REPORT_DIR) -> tuple[Path, Path]:
+    report_dir.mkdir(parents=True, exist_ok=True)
+    csv_path = report_dir / report.csv_name
+    md_path = report_dir / f"{report.name}.md"
+
+    fieldnames = report.fieldnames or list(report.rows[0].keys())
+    with csv_path.open("w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=fieldnames)
+        w.writeheader()
+        w.writerows(report.rows)
+
+    md_path.write_text("\n".join(report.md_lines) + "\n", encoding="utf-8")
+    return csv_path, md_path
+
+
+def main_for(report: HarnessReport, report_dir: Path = REPORT_DIR) -> None:
+    """Standalone `main()` body: write the report and echo paths + log lines."""
+    from results_store import record
+
+    csv_path, md_path = write_report(report, report_dir)
+    run_id = record([report], source="standalone")
+    print(f"Wrote {csv_path}")
+    print(f"Wrote {md_path}")
+    if run_id:
+        print(f"Recorded run {run_id}")
+    for line in report.log_lines:
+        print(line)
@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""Append-only SQLite store for verification results.
+
+Every harness run (standalone `main()` or `run_verification.py`) appends one
+row per report plus its numeric metrics and the gate classes under a run id.
+Rows are never updated or deleted (enforced by triggers), so the CSV/MD files
+under `verification/reports/` are just derived views of one stored run.
+Large per-scenario results (the benchmark matrix) are stored as packed float64
+vectors keyed by a grid fingerprint rather than as one metric row per scenario.
+
+Usage:
+  python verification/results_store.py runs --last 10
+  python verification/results_store.py history --harness axis_orthogonality_sensitivity \
+      --metric slope_recovery_success_rate --row 15.0 --last 20
+  python verification/results_store.py first-fail --gate coupling
+  python verification/results_store.py render [--run-id RUN_ID]
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import hashlib
+import json
+import os
+import sqlite3
+import subprocess
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+from report_io import REPORT_DIR, ROOT, HarnessReport, status_from_rows, write_report
+
+PARAMS_PATH = ROOT / "cad" / "weevil_leg_params.yaml"
+DEFAULT_DB = ROOT / "verification" / "results" / "results.sqlite3"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL UNIQUE,
+    started_utc TEXT NOT NULL,
+    git_commit TEXT NOT NULL,
+    params_sha256 TEXT NOT NULL,
+    source TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS reports (
+    run_id TEXT NOT NULL REFERENCES runs(run_id),
+    harness TEXT NOT NULL,
+    status TEXT NOT NULL,
+    input_sha256 TEXT NOT NULL,
+    report_json TEXT NOT NULL,
+    PRIMARY KEY (run_id, harness)
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    run_id TEXT NOT NULL REFERENCES runs(run_id),
+    harness TEXT NOT NULL,
+    row_key TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS gates (
+    run_id TEXT NOT NULL REFERENCES runs(run_id),
+    class TEXT NOT NULL,
+    status TEXT NOT NULL,
+    details TEXT NOT NULL,
+    PRIMARY KEY (run_id, class)
+);
+CREATE INDEX IF NOT EXISTS idx_metrics_lookup ON metrics (harness, metric, row_key, run_id);
+CREATE INDEX IF NOT EXISTS idx_reports_status ON reports (harness, status);
+CREATE TABLE IF NOT EXISTS vectors (
+    run_id TEXT NOT NULL REFERENCES runs(run_id),
+    name TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    length INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (run_id, name)
+);
+CREATE INDEX IF NOT EXISTS idx_gates_status ON gates (class, status);
+CREATE INDEX IF NOT EXISTS idx_vectors_lookup ON vectors (name, fingerprint, run_id);
+"""
+
+APPEND_ONLY_TABLES = ("runs", "reports", "metrics", "gates", "vectors")
+
+
+@dataclass(frozen=True)
+class RunInfo:
+    seq: int
+    run_id: str
+    started_utc: str
+    git_commit: str
+    params_sha256: str
+    source: str
+
+
+def db_path() -> Path:
+    """Store location; `WEEVIL_RESULTS_DB` overrides it, an empty value disables recording."""
+    env = os.environ.get("WEEVIL_RESULTS_DB")
+    return DEFAULT_DB if env is None else Path(env)
+
+
+def recording_enabled() -> bool:
+    return os.environ.get("WEEVIL_RESULTS_DB", None) != ""
+
+
+def params_sha256() -> str:
+    return hashlib.sha256(PARAMS_PATH.read_bytes()).hexdigest()
+
+
+def git_commit() -> str:
+    try:
+        out = subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=ROOT, stderr=subprocess.DEVNULL)
+        return out.decode().strip()
+    except Exception:
+        return "unknown"
+
+
+def as_number(value: Any) -> float | None:
+    if isinstance(value, bool):
+        return float(value)
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        low = value.strip().lower()
+        if low in {"true", "false"}:
+            return float(low == "true")
+        try:
+            return float(low)
+        except ValueError:
+            return None
+    return None
+
+
+def row_keys(rows: list[dict[str, Any]]) -> list[str]:
+    """Stable per-row key: first column whose values are unique, else the row index."""
+    if rows:
+        for col in rows[0].keys():
+            vals = [str(r.get(col, "")) for r in rows]
+            if len(set(vals)) == len(vals):
+                return vals
+    return [str(i) for i in range(len(rows))]
+
+
+class ResultsStore:
+    def __init__(self, path: Path | None = None):
+        self.path = path or db_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.executescript(SCHEMA)
+        for table in APPEND_ONLY_TABLES:
+            for op in ("UPDATE", "DELETE"):
+                self.conn.execute(
+                    f"CREATE TRIGGER IF NOT EXISTS {table}_no_{op.lower()} BEFORE {op} ON {table} "
+                    f"BEGIN SELECT RAISE(ABORT, '{table} is append-only'); END"
+                )
+        self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "ResultsStore":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # -- writes ---------------------------------------------------------------
+
+    def begin_run(self, source: str) -> str:
+        now = dt.datetime.now(dt.timezone.utc).replace(microsecond=0)
+        run_id = f"{now:%Y%m%dT%H%M%SZ}-{uuid.uuid4().hex[:8]}"
+        self.conn.execute(
+            "INSERT INTO runs (run_id, started_utc, git_commit, params_sha256, source) VALUES (?, ?, ?, ?, ?)",
+            (run_id, now.isoformat().replace("+00:00", "Z"), git_commit(), params_sha256(), source),
+        )
+        return run_id
+
+    def add_report(self, run_id: str, report: HarnessReport, input_sha256: str = "") -> None:
+        payload = {
+            "name": report.name,
+            "rows": report.rows,
+            "md_lines": report.md_lines,
+            "fieldnames": report.fieldnames,
+            "log_lines": report.log_lines,
+        }
+        self.conn.execute(
+            "INSERT INTO reports (run_id, harness, status, input_sha256, report_json) VALUES (?, ?, ?, ?, ?)",
+            (run_id, report.name, report.status, input_sha256, json.dumps(payload)),
+        )
+        metric_rows = []
+        for key, row in zip(row_keys(report.rows), report.rows):
+            for metric, value in row.items():
+                num = as_number(value)
+                if num is not None:
+                    metric_rows.append((run_id, report.name, key, metric, num))
+        self.conn.executemany(
+            "INSERT INTO metrics (run_id, harness, row_key, metric, value) VALUES (?, ?, ?, ?, ?)", metric_rows
+        )
+
+    def add_gates(self, run_id: str, gate_rows: Iterable[dict[str, str]]) -> None:
+        self.conn.executemany(
+            "INSERT INTO gates (run_id, class, status, details) VALUES (?, ?, ?, ?)",
+            [(run_id, r["class"], r["status"], r["details"]) for r in gate_rows],
+        )
+
+    def add_vector(self, run_id: str, name: str, fingerprint: str, data: bytes, length: int) -> None:
+        """``data`` is a packed little-endian float64 array of ``length`` values."""
+        if len(data) != 8 * length:
+            raise ValueError(f"vector {name}: {len(data)} bytes for {length} float64 values")
+        self.conn.execute(
+            "INSERT INTO vectors (run_id, name, fingerprint, length, data) VALUES (?, ?, ?, ?, ?)",
+            (run_id, name, fingerprint, length, data),
+        )
+
+    def commit(self) -> None:
+        self.conn.commit()
+
+    # -- queries --------------------------------------------------------------
+
+    def runs(self, last: int = 10) -> list[RunInfo]:
+        cur = self.conn.execute(
+            "SELECT seq, run_id, started_utc, git_commit, params_sha256, source FROM runs ORDER BY seq DESC LIMIT ?",
+            (last,),
+        )
+        return [RunInfo(*r) for r in cur.fetchall()]
+
+    def metric_history(
+        self, harness: str, metric: str, last: int = 20, row_key: str | None = None
+    ) -> list[tuple[str, str, str, float]]:
+        """(run_id, started_utc, row_key, value) for ``metric`` over the last ``last`` runs that produced it."""
+        key_clause = "AND m.row_key = ?" if row_key is not None else ""
+        args: list[Any] = [harness, metric]
+        if row_key is not None:
+            args.append(row_key)
+        sql = f"""
+            WITH recent AS (
+                SELECT DISTINCT r.seq, r.run_id, r.started_utc
+                FROM metrics m JOIN runs r ON r.run_id = m.run_id
+                WHERE m.harness = ? AND m.metric = ? {key_clause}
+                ORDER BY r.seq DESC LIMIT ?
+            )
+            SELECT recent.run_id, recent.started_utc, m.row_key, m.value
+            FROM recent JOIN metrics m ON m.run_id = recent.run_id
+            WHERE m.harness = ? AND m.metric = ? {key_clause}
+            ORDER BY recent.seq, m.rowid
+        """
+        params = args + [last] + args
+        return [tuple(r) for r in self.conn.execute(sql, params).fetchall()]
+
+    def first_gate_failure(self, gate_class: str, since_last_pass: bool = True) -> tuple[str, str, str] | None:
+        """(run_id, started_utc, status) of the first failing (not pass, not not_run) run for ``gate_class``.
+
+        With ``since_last_pass`` the search starts after the most recent passing
+        run, i.e. it returns the onset of the current failure streak.
+        """
+        floor = 0
+        if since_last_pass:
+            row = self.conn.execute(
+                "SELECT MAX(r.seq) FROM gates g JOIN runs r ON r.run_id = g.run_id WHERE g.class = ? AND g.status = 'pass'",
+                (gate_class,),
+            ).fetchone()
+            floor = row[0] or 0
+        row = self.conn.execute(
+            """
+            SELECT r.run_id, r.started_utc, g.status FROM gates g JOIN runs r ON r.run_id = g.run_id
+            WHERE g.class = ? AND g.status NOT IN ('pass', 'not_run') AND r.seq > ?
+            ORDER BY r.seq LIMIT 1
+            """,
+            (gate_class, floor),
+        ).fetchone()
+        return tuple(row) if row else None
+
+    def vector_history(self, name: str, fingerprint: str, last: int = 30) -> list[tuple[str, bytes]]:
+        """(run_id, packed float64) for the last ``last`` runs that stored ``name`` on the same grid, oldest first."""
+        cur = self.conn.execute(
+            """
+            SELECT v.run_id, v.data FROM vectors v JOIN runs r ON r.run_id = v.run_id
+            WHERE v.name = ? AND v.fingerprint = ?
+            ORDER BY r.seq DESC LIMIT ?
+            """,
+            (name, fingerprint, last),
+        )
+        return list(reversed(cur.fetchall()))
+
+    def load_reports(self, run_id: str | None = None) -> tuple[str, list[HarnessReport]]:
+        """Reports stored for ``run_id`` (default: latest run that stored any)."""
+        if run_id is None:
+            row = self.conn.execute(
+                "SELECT r.run_id FROM runs r WHERE EXISTS (SELECT 1 FROM reports p WHERE p.run_id = r.run_id) "
+                "ORDER BY r.seq DESC LIMIT 1"
+            ).fetchone()
+            if row is None:
+                raise SystemExit(f"No stored reports in {self.path}")
+            run_id = row[0]
+        cur = self.conn.execute("SELECT report_json FROM reports WHERE run_id = ? ORDER BY harness", (run_id,))
+        return run_id, [HarnessReport(**json.loads(r[0])) for r in cur.fetchall()]
+
+    def load_gates(self, run_id: str) -> list[dict[str, str]]:
+        cur = self.conn.execute("SELECT class, status, details FROM gates WHERE run_id = ? ORDER BY rowid", (run_id,))
+        return [{"class": c, "status": s, "details": d} for c, s, d in cur.fetchall()]
+
+
+def record(reports: list[HarnessReport], source: str, gate_rows: list[dict[str, str]] | None = None,
+           input_hashes: dict[str, str] | None = None,
+           vectors: dict[str, tuple[str, bytes, int]] | None = None) -> str | None:
+    """Append one run; returns its run id (None when recording is disabled)."""
+    if not recording_enabled():
+        return None
+    input_hashes = input_hashes or {}
+    with ResultsStore() as store:
+        run_id = store.begin_run(source)
+        for rep in reports:
+            store.add_report(run_id, rep, input_hashes.get(rep.name, ""))
+        if gate_rows:
+            store.add_gates(run_id, gate_rows)
+        for name, (fingerprint, data, length) in (vectors or {}).items():
+            store.add_vector(run_id, name, fingerprint, data, length)
+        store.commit()
+    return run_id
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--db", default=None, help="store path (default: verification/results/results.sqlite3)")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p_runs = sub.add_parser("runs")
+    p_runs.add_argument("--last", type=int, default=10)
+    p_hist = sub.add_parser("history")
+    p_hist.add_argument("--harness", required=True)
+    p_hist.add_argument("--metric", required=True)
+    p_hist.add_argument("--row", default=None, help="row key (first unique column value)")
+    p_hist.add_argument("--last", type=int, default=20)
+    p_fail = sub.add_parser("first-fail")
+    p_fail.add_argument("--gate", required=True)
+    p_fail.add_argument("--ever", action="store_true", help="first failure ever, not since the last pass")
+    p_render = sub.add_parser("render")
+    p_render.add_argument("--run-id", default=None)
+    p_render.add_argument("--report-dir", default=str(REPORT_DIR))
+    args = ap.parse_args()
+
+    with ResultsStore(Path(args.db) if args.db else None) as store:
+        if args.cmd == "runs":
+            for r in store.runs(args.last):
+                print(f"{r.seq:>6} {r.run_id} {r.started_utc} {r.git_commit[:10]} params={r.params_sha256[:10]} {r.source}")
+        elif args.cmd == "history":
+            for run_id, ts, key, value in store.metric_history(args.harness, args.metric, args.last, args.row):
+                print(f"{run_id} {ts} {key:>24} {value:g}")
+        elif args.cmd == "first-fail":
+            hit = store.first_gate_failure(args.gate, since_last_pass=not args.ever)
+            print("no failing run" if hit is None else f"{hit[0]} {hit[1]} {hit[2]}")
+        elif args.cmd == "render":
+            from run_gate_check import write_gate_report
+
+            report_dir = Path(args.report_dir)
+            run_id, reports = store.load_reports(args.run_id)
+            for rep in reports:
+                write_report(rep, report_dir)
+                print(f"Rendered {rep.name} ({status_from_rows(rep.rows)}) from {run_id}")
+            gates = store.load_gates(run_id)
+            if gates:
+                write_gate_report(gates, report_dir)
+                print(f"Rendered gate_check from {run_id}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -6,6 +6,7 @@ from __future__ import annotations
 import csv
 from pathlib import Path
 
+from report_io import NOT_RUN, REPORT_DIR, status_from_rows
 
 REPORTS = {
     "mobility": [
@@ -53,6 +54,10 @@ REPORTS = {
     "cad_phase2": [
         "phase2_cad_artifacts.csv",
         "phase2_export_bundle.csv",
+        "step_geometry.csv",
+    ],
+    "bench": [
+        "bench_acceptance.csv",
     ],
 }
 
@@ -63,33 +68,34 @@ def status_from_csv(path: Path) -> str:
     with path.open("r", encoding="utf-8", newline="") as f:
         rdr = csv.DictReader(f)
         rows = list(rdr)
-    if not rows:
-        return "missing"
-    if all(str(r.get("pass", "")).lower() in {"true", "1"} for r in rows):
-        return "pass"
-    if any(str(r.get("pass", "")).lower() in {"true", "1"} for r in rows):
-        return "partial"
-    return "fail"
+    return status_from_rows(rows)
 
 
-def main() -> None:
-    report_dir = Path("verification/reports")
+def gate_rows(statuses: dict[str, str]) -> list[dict[str, str]]:
+    """Aggregate per-report statuses (keyed by CSV name) into REPORTS class rows.
+
+    NOT_RUN reports (no input data yet) are left out of their class; a class
+    with only NOT_RUN reports is NOT_RUN rather than failing.
+    """
     out_rows = []
     for cls, files in REPORTS.items():
-        file_statuses = []
-        for fn in files:
-            s = status_from_csv(report_dir / fn)
-            file_statuses.append((fn, s))
-        if all(s == "pass" for _, s in file_statuses):
+        file_statuses = [(fn, statuses.get(fn, "missing")) for fn in files]
+        ran = [s for _, s in file_statuses if s != NOT_RUN]
+        if not ran:
+            cls_status = NOT_RUN
+        elif all(s == "pass" for s in ran):
             cls_status = "pass"
-        elif any(s == "missing" for _, s in file_statuses):
+        elif any(s == "missing" for s in ran):
             cls_status = "missing"
-        elif any(s in {"fail", "partial"} for _, s in file_statuses):
+        elif any(s in {"fail", "partial"} for s in ran):
             cls_status = "partial"
         else:
             cls_status = "unknown"
         out_rows.append({"class": cls, "status": cls_status, "details": "; ".join([f"{f}:{s}" for f, s in file_statuses])})
+    return out_rows
+
 
+def write_gate_report(out_rows: list[dict[str, str]], report_dir: Path = REPORT_DIR) -> tuple[Path, Path]:
     csv_path = report_dir / "gate_check.csv"
     with csv_path.open("w", newline="", encoding="utf-8") as f:
         w = csv.DictWriter(f, fieldnames=["class", "status", "details"])
@@ -102,9 +108,22 @@ def main() -> None:
 
     md_path = report_dir / "gate_check.md"
     md_path.write_text("\n".join(md_lines) + "\n", encoding="utf-8")
+    return csv_path, md_path
+
+
+def main() -> None:
+    from results_store import record
+
+    files = {fn for fns in REPORTS.values() for fn in fns}
+    statuses = {fn: status_from_csv(REPORT_DIR / fn) for fn in files}
+    rows = gate_rows(statuses)
+    csv_path, md_path = write_gate_report(rows)
+    run_id = record([], source="gate_check", gate_rows=rows)
 
     print(f"Wrote {csv_path}")
     print(f"Wrote {md_path}")
+    if run_id:
+        print(f"Recorded run {run_id}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""Run all verification harnesses in a worker pool and gate them in memory.
+
+Discovers `verification/test_*.py`, calls each module's `report()` concurrently,
+computes the `run_gate_check.REPORTS` class gate from the in-memory rows and
+writes every harness report plus `gate_check.*` in one batch at the end.
+
+Harnesses whose input hash (see `verification_cache.py`) is unchanged are not
+rerun; their cached rows are reused and `verification_manifest.csv` records
+the input hash and source (run/cache) of every report the gate consumed.
+Each invocation is appended to the results store as one run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import importlib
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+VERIFICATION_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(VERIFICATION_DIR))
+
+from report_io import REPORT_DIR, HarnessReport, write_report
+from results_store import record
+from run_gate_check import REPORTS, gate_rows, write_gate_report
+from verification_cache import ReportCache, input_digests, input_hash, is_cacheable
+
+
+@dataclass
+class HarnessOutcome:
+    module: str
+    report: HarnessReport | None
+    elapsed_s: float
+    error: str = ""
+    source: str = "run"
+    input_hash: str = ""
+
+
+def discover(pattern: str = "test_*.py") -> list[str]:
+    return [p.stem for p in sorted(VERIFICATION_DIR.glob(pattern))]
+
+
+def run_harness(module_name: str) -> HarnessOutcome:
+    t0 = time.perf_counter()
+    try:
+        module = importlib.import_module(module_name)
+        if not hasattr(module, "report"):
+            raise AttributeError(f"{module_name} has no report() entry point")
+        rep = module.report()
+        return HarnessOutcome(module_name, rep, time.perf_counter() - t0)
+    except Exception:
+        return HarnessOutcome(module_name, None, time.perf_counter() - t0, traceback.format_exc())
+
+
+def run_all(modules: list[str], jobs: int | None = None, executor: str = "process") -> list[HarnessOutcome]:
+    if jobs == 1:
+        return [run_harness(m) for m in modules]
+    pool_cls = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+    with pool_cls(max_workers=jobs) as pool:
+        return list(pool.map(run_harness, modules))
+
+
+def run_cached(
+    modules: list[str],
+    cache: ReportCache | None,
+    jobs: int | None = None,
+    executor: str = "process",
+) -> list[HarnessOutcome]:
+    """Serve unchanged harnesses from ``cache`` and run the rest in the pool."""
+    hashes: dict[str, str] = {}
+    digests: dict[str, dict[str, str]] = {}
+    cached: dict[str, HarnessOutcome] = {}
+    for name in modules:
+        try:
+            module = importlib.import_module(name)
+        except Exception:
+            continue  # surfaces as an error outcome from run_harness
+        if not is_cacheable(module):
+            continue
+        digests[name] = input_digests(module)
+        hashes[name] = input_hash(digests[name])
+        hit = cache.get(name, hashes[name]) if cache is not None else None
+        if hit is not None:
+            cached[name] = HarnessOutcome(name, hit, 0.0, source="cache", input_hash=hashes[name])
+
+    fresh = run_all([m for m in modules if m not in cached], jobs=jobs, executor=executor)
+    by_name = {o.module: o for o in fresh}
+    for o in fresh:
+        o.input_hash = hashes.get(o.module, "")
+        if cache is not None and o.report is not None and o.module in hashes:
+            cache.put(o.module, hashes[o.module], digests[o.module], o.report)
+    by_name.update(cached)
+    if cache is not None:
+        # Prune against every harness on disk: a --pattern run must keep the others' entries.
+        cache.prune(set(discover()) | set(modules))
+        cache.save()
+    return [by_name[m] for m in modules]
+
+
+def write_manifest(outcomes: list[HarnessOutcome], report_dir: Path) -> Path:
+    path = report_dir / "verification_manifest.csv"
+    with path.open("w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=["module", "report", "status", "source", "input_sha256"])
+        w.writeheader()
+        for o in outcomes:
+            w.writerow(
+                {
+                    "module": o.module,
+                    "report": o.report.csv_name if o.report is not None else "",
+                    "status": o.report.status if o.report is not None else "error",
+                    "source": o.source,
+                    "input_sha256": o.input_hash or "uncached",
+                }
+            )
+    return path
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--jobs", type=int, default=None, help="worker count (1 = serial, in-process)")
+    ap.add_argument("--executor", choices=["process", "thread"], default="process")
+    ap.add_argument("--pattern", default="test_*.py", help="harness glob under verification/")
+    ap.add_argument("--report-dir", default=str(REPORT_DIR))
+    ap.add_argument("--no-cache", action="store_true", help="rerun every harness and leave the cache untouched")
+    ap.add_argument("--no-store", action="store_true", help="do not append this run to the results store")
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+    cache = None if args.no_cache else ReportCache()
+    outcomes = run_cached(discover(args.pattern), cache, jobs=args.jobs, executor=args.executor)
+
+    statuses: dict[str, str] = {}
+    for o in outcomes:
+        if o.report is not None:
+            statuses[o.report.csv_name] = o.report.status
+    rows = gate_rows(statuses)
+
+    report_dir = Path(args.report_dir)
+    for o in outcomes:
+        if o.report is not None:
+            write_report(o.report, report_dir)
+    write_gate_report(rows, report_dir)
+    write_manifest(outcomes, report_dir)
+    run_id = None
+    if not args.no_store:
+        run_id = record(
+            [o.report for o in outcomes if o.report is not None],
+            source="run_verification",
+            gate_rows=rows,
+            input_hashes={o.report.name: o.input_hash for o in outcomes if o.report is not None},
+        )
+
+    failed = [o for o in outcomes if o.report is None]
+    for o in outcomes:
+        status = o.report.status if o.report is not None else "error"
+        print(f"{o.module:<40} {status:<8} {o.source:<6} {o.elapsed_s:7.3f}s")
+    for o in failed:
+        print(f"\n--- {o.module} raised ---\n{o.error}", file=sys.stderr)
+
+    gated = {fn for fns in REPORTS.values() for fn in fns}
+    ungated = sorted(set(statuses) - gated)
+    if ungated:
+        print(f"Not referenced by any gate class: {', '.join(ungated)}")
+    for r in rows:
+        print(f"gate {r['class']:<12} {r['status']}")
+    print(f"Wrote {len(outcomes) - len(failed)} harness reports + gate_check to {report_dir} "
+          f"in {time.perf_counter() - t0:.2f}s")
+    if run_id:
+        print(f"Recorded run {run_id}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
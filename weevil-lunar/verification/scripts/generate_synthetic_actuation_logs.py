@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Generate synthetic high-rate joint bench logs for `verification/actuation_signals.py`.
+
+Stands in for rig output until the integrated actuation bench exists. Each run
+is a sinusoidal joint sweep at gait rate with:
+- transmission play (`backlash_deg`) and torsional compliance windup on the
+  output encoder, both encoders quantized
+- gait load + smooth Coulomb friction + a cogging ripple line
+  (`ripple_pct` of the mean load at `ripple_hz`) + load-cell noise
+- one push-off window per gait cycle with a torque transient whose peak is
+  `spike_ratio` of the joint torque limit
+
+Samples are generated and written in chunks, so hour-long logs at kHz rates
+need no more memory than one chunk. Output columns:
+`t_s,motor_deg,joint_deg,torque_Nm,push_off`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[2]
+OUT_DIR = ROOT / "verification" / "bench_data" / "actuation"
+LOG_FIELDS = ["t_s", "motor_deg", "joint_deg", "torque_Nm", "push_off"]
+CHUNK_S = 10.0
+
+
+@dataclass(frozen=True)
+class RunSpec:
+    name: str
+    ripple_pct: float
+    backlash_deg: float
+    spike_ratio: float
+    torque_mean_nm: float = 4.0
+    torque_limit_nm: float = 12.0
+    gait_hz: float = 0.4
+    sweep_deg: float = 20.0
+    ripple_hz: float = 47.0
+    friction_nm: float = 0.3
+    compliance_deg_per_nm: float = 0.02
+    push_off_s: float = 0.15
+    noise_nm: float = 0.005
+    encoder_lsb_deg: float = 0.001
+
+
+RUNS = (
+    RunSpec("bench_nominal", ripple_pct=4.2, backlash_deg=0.35, spike_ratio=0.82),
+    RunSpec("bench_loaded", ripple_pct=6.8, backlash_deg=0.62, spike_ratio=0.93, torque_mean_nm=5.5),
+    RunSpec("bench_endurance", ripple_pct=7.4, backlash_deg=0.71, spike_ratio=0.98, friction_nm=0.45),
+)
+
+
+def _base_torque(spec: RunSpec, t: np.ndarray) -> np.ndarray:
+    w = 2.0 * math.pi * spec.gait_hz
+    velocity = spec.sweep_deg * w * np.cos(w * t)
+    return (
+        spec.torque_mean_nm * (1.0 + 0.5 * np.sin(w * t + 0.7))
+        + spec.friction_nm * np.tanh(velocity / (0.2 * spec.sweep_deg * w))
+        + spec.ripple_pct / 100.0 * spec.torque_mean_nm * np.sin(2.0 * math.pi * spec.ripple_hz * t)
+    )
+
+
+def chunk(spec: RunSpec, t: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """(n, 5) samples at times ``t``."""
+    w = 2.0 * math.pi * spec.gait_hz
+    a, half = spec.sweep_deg, spec.backlash_deg / 2.0
+    motor = a * np.sin(w * t)
+    rising = np.cos(w * t) >= 0.0
+    output = np.where(rising, np.maximum(motor - half, -a + half), np.minimum(motor + half, a - half))
+
+    # Push-off at a quarter past each gait cycle start; the transient peaks mid-window.
+    period = 1.0 / spec.gait_hz
+    centre = (np.floor(t / period) + 0.25) * period
+    push = np.abs(t - centre) <= spec.push_off_s / 2.0
+    peak_base = _base_torque(spec, centre)
+    sigma = spec.push_off_s / 8.0
+    pulse = (spec.spike_ratio * spec.torque_limit_nm - peak_base) * np.exp(-0.5 * ((t - centre) / sigma) ** 2)
+
+    torque = _base_torque(spec, t) + np.where(push, pulse, 0.0) + spec.noise_nm * rng.standard_normal(t.size)
+    joint = output - spec.compliance_deg_per_nm * torque
+    lsb = spec.encoder_lsb_deg
+    return np.column_stack((t, np.round(motor / lsb) * lsb, np.round(joint / lsb) * lsb, torque, push.astype(float)))
+
+
+def write_log(path: Path, spec: RunSpec, duration_s: float, fs: float, seed: int = 20260308) -> dict[str, float]:
+    """Write one run; return its ground truth (spike ratio measured from the written samples)."""
+    rng = np.random.default_rng(seed)
+    n_total = int(round(duration_s * fs))
+    per_chunk = int(round(CHUNK_S * fs))
+    peak = 0.0
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="ascii", newline="") as f:
+        f.write(",".join(LOG_FIELDS) + "\n")
+        for start in range(0, n_total, per_chunk):
+            t = np.arange(start, min(start + per_chunk, n_total)) / fs
+            block = chunk(spec, t, rng)
+            pushed = block[:, 4] > 0.5
+            if np.any(pushed):
+                peak = max(peak, float(np.abs(block[pushed, 3]).max()))
+            np.savetxt(f, block, fmt=["%.6f", "%.3f", "%.3f", "%.5f", "%d"], delimiter=",")
+    return {
+        "torque_ripple_pct": spec.ripple_pct,
+        "backlash_deg": spec.backlash_deg,
+        "push_off_spike_ratio": peak / spec.torque_limit_nm,
+    }
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--out-dir", default=str(OUT_DIR))
+    ap.add_argument("--duration-s", type=float, default=600.0)
+    ap.add_argument("--rate-hz", type=float, default=2000.0)
+    args = ap.parse_args()
+
+    for k, spec in enumerate(RUNS):
+        path = Path(args.out_dir) / f"{spec.name}.csv"
+        truth = write_log(path, spec, args.duration_s, args.rate_hz, seed=20260308 + k)
+        print(f"Wrote {path} " + ", ".join(f"{key}={v:.3f}" for key, v in truth.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Generate a synthetic raw bench campaign (manifest + high-rate raw log).
+
+Stands in for rig output until hardware data exists, so the ingestion and
+aggregation stages can be exercised end to end. Trial factors follow
+`verification/bench_test_plan_v0.md` (S0/S1/S2 x preload x soil x cycles).
+
+Outputs (under --out-dir):
+- campaign_manifest.csv: one row per trial, template metadata columns
+- campaign_raw.csv: trial,t_s,z_mm,f_z_N,twist_deg,x_mm,f_t_N samples
+  (`trial` = 0-based manifest row), written trial by trial
+
+Force/sinkage shapes are POC assumptions chosen to exercise the v0 acceptance
+targets, not a regolith model.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import datetime as dt
+import math
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[2]
+OUT_DIR = ROOT / "verification" / "bench_data" / "synthetic"
+
+MANIFEST_FIELDS = [
+    "run_id",
+    "timestamp_utc",
+    "soil_type",
+    "strategy",
+    "cleat_variant",
+    "preload_N",
+    "cycle_num",
+    "pull_rate_mm_per_s",
+    "sample_rate_hz",
+    "notes",
+]
+RAW_FIELDS = ["trial", "t_s", "z_mm", "f_z_N", "twist_deg", "x_mm", "f_t_N"]
+
+STRATEGY_GAIN = {"S0": 1.0, "S1": 1.35, "S2": 1.5}
+STRATEGY_X_PEAK_MM = {"S0": 0.8, "S1": 1.4, "S2": 1.6}
+STRATEGY_RESIDUAL = {"S0": 0.55, "S1": 0.7, "S2": 0.85}  # post-peak force / peak
+STRATEGY_DZ_ENGAGE_MM = {"S0": 0.05, "S1": 0.4, "S2": 0.6}
+STRATEGY_FADE_PER_CYCLE = {"S0": 0.02, "S1": 0.01, "S2": 0.008}
+SOIL = {  # (cohesion term N, friction coefficient, sinkage scale)
+    "frictional": (0.05, 0.62, 1.0),
+    "cohesive": (0.35, 0.45, 0.7),
+}
+FOOT_WEIGHT_N = 0.5
+
+
+def trial_samples(
+    rng: np.random.Generator,
+    soil: str,
+    strategy: str,
+    preload_n: float,
+    cycle: int,
+    fs: float,
+    pull_rate: float,
+) -> np.ndarray:
+    """(n, 6) array of t_s, z_mm, f_z_N, twist_deg, x_mm, f_t_N for one trial."""
+    cohesion, mu, sink_scale = SOIL[soil]
+    fade = 1.0 - STRATEGY_FADE_PER_CYCLE[strategy] * (cycle - 1)
+    f_peak = (cohesion + mu * (preload_n + FOOT_WEIGHT_N)) * STRATEGY_GAIN[strategy] * fade
+    x_peak = STRATEGY_X_PEAK_MM[strategy] * (1.0 + 0.05 * rng.standard_normal())
+    residual = STRATEGY_RESIDUAL[strategy]
+    dz_init = sink_scale * (0.3 + 0.2 * math.sqrt(preload_n))
+    dz_engage = sink_scale * STRATEGY_DZ_ENGAGE_MM[strategy]
+
+    t_approach, t_ramp = 0.5, 0.3
+    t_hold = rng.uniform(3.0, 5.0)
+    t_engage = 2.0
+    x_max = 4.0 * x_peak
+    t_pull = x_max / pull_rate
+    t_end = t_approach + t_hold + t_engage + t_pull
+    t = np.arange(0.0, t_end, 1.0 / fs)
+
+    t_place0 = t_approach
+    t_eng0 = t_place0 + t_hold
+    t_pull0 = t_eng0 + t_engage
+    placing = t >= t_place0
+    engaging = t >= t_eng0
+    pulling = t >= t_pull0
+
+    # Vertical: approach from -1 mm, preload ramp, sinkage during hold and engagement.
+    z = np.where(placing, 0.0, -1.0 + t / t_approach)
+    z = z + np.where(placing, dz_init * (1.0 - np.exp(-(t - t_place0) / 0.5)), 0.0)
+    z = z + np.where(engaging, dz_engage * (1.0 - np.exp(-(t - t_eng0) / 0.6)), 0.0)
+    f_z = np.where(placing, preload_n * np.clip((t - t_place0) / t_ramp, 0.0, 1.0), 0.0)
+
+    twist = np.zeros_like(t)
+    if strategy in ("S1", "S2"):
+        active = engaging & ~pulling
+        twist = np.where(active, 10.0 * np.sin(2.0 * math.pi * 1.0 * (t - t_eng0)), 0.0)
+    if strategy == "S2":
+        active = engaging & ~pulling
+        f_z = f_z * np.where(active, 1.0 + 0.1 * np.sin(2.0 * math.pi * 50.0 * (t - t_eng0)), 1.0)
+
+    # Tangential: constant-rate pull; parabolic rise to the peak, decay to residual.
+    x = np.where(pulling, pull_rate * (t - t_pull0), 0.0)
+    rise = f_peak * (1.0 - (1.0 - np.minimum(x, x_peak) / x_peak) ** 2)
+    post = f_peak * (residual + (1.0 - residual) * np.exp(-(x - x_peak) / (0.3 * x_peak)))
+    f_t = np.where(pulling, np.where(x <= x_peak, rise, post), 0.0)
+
+    z = z + rng.normal(0.0, 0.002, t.size)
+    f_z = np.where(placing, f_z + rng.normal(0.0, 0.002, t.size), 0.0)
+    x = x + rng.normal(0.0, 0.001, t.size)
+    f_t = f_t + rng.normal(0.0, 0.005, t.size)
+    return np.column_stack([t, z, f_z, twist, x, f_t])
+
+
+def generate(
+    out_dir: Path,
+    cycles: int = 10,
+    sample_rate_hz: float = 1000.0,
+    pull_rate_mm_per_s: float = 0.5,
+    preloads: tuple[float, ...] = (0.1, 0.5, 1.0, 5.0),
+    seed: int = 20260218,
+) -> tuple[Path, Path]:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_dir / "campaign_manifest.csv"
+    raw_path = out_dir / "campaign_raw.csv"
+    rng = np.random.default_rng(seed)
+    start = dt.datetime(2026, 3, 2, 9, 0, tzinfo=dt.timezone.utc)
+
+    trial = 0
+    with manifest_path.open("w", encoding="utf-8", newline="") as mf, raw_path.open("w", encoding="utf-8") as rf:
+        w = csv.DictWriter(mf, fieldnames=MANIFEST_FIELDS, lineterminator="\n")
+        w.writeheader()
+        rf.write(",".join(RAW_FIELDS) + "\n")
+        for soil in SOIL:
+            for strategy in STRATEGY_GAIN:
+                for preload in preloads:
+                    for cycle in range(1, cycles + 1):
+                        w.writerow(
+                            {
+                                "run_id": f"SYN-{soil[:3].upper()}-{strategy}-P{preload:g}-C{cycle:02d}",
+                                "timestamp_utc": (start + dt.timedelta(minutes=3 * trial)).isoformat().replace("+00:00", "Z"),
+                                "soil_type": soil,
+                                "strategy": strategy,
+                                "cleat_variant": "baseline",
+                                "preload_N": preload,
+                                "cycle_num": cycle,
+                                "pull_rate_mm_per_s": pull_rate_mm_per_s,
+                                "sample_rate_hz": sample_rate_hz,
+                                "notes": "synthetic",
+                            }
+                        )
+                        s = trial_samples(rng, soil, strategy, preload, cycle, sample_rate_hz, pull_rate_mm_per_s)
+                        block = np.column_stack([np.full(s.shape[0], trial), s])
+                        np.savetxt(rf, block, fmt=["%d", "%.5f", "%.5f", "%.5f", "%.4f", "%.5f", "%.5f"], delimiter=",")
+                        trial += 1
+    return manifest_path, raw_path
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--out-dir", default=str(OUT_DIR))
+    ap.add_argument("--cycles", type=int, default=10)
+    ap.add_argument("--sample-rate", type=float, default=1000.0, help="Hz")
+    ap.add_argument("--pull-rate", type=float, default=0.5, help="mm/s")
+    ap.add_argument("--seed", type=int, default=20260218)
+    args = ap.parse_args()
+
+    manifest, raw = generate(Path(args.out_dir), args.cycles, args.sample_rate, args.pull_rate, seed=args.seed)
+    print(f"Wrote {manifest}")
+    print(f"Wrote {raw} ({raw.stat().st_size / 1e6:.1f} MB)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
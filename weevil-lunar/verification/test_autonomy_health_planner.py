@@ -1,11 +1,34 @@
 #!/usr/bin/env python3
-"""Autonomy health-aware planning harness (v0.1 placeholders)."""
+"""Autonomy health-aware planning harness.
+
+The v0.1 scenario cases check `decide_mode`. The stream checks replay
+simulated health telemetry through `models/mode_classifier.py`: with
+hysteresis and dwell disabled it must agree with `decide_mode` on every
+sample; block-wise and online (`step()`) classification must match the
+single-batch result, and no non-preempting transition may leave a mode
+before its minimum dwell.
+"""
 
 from __future__ import annotations
 
-import csv
+import sys
 from dataclasses import dataclass
-from pathlib import Path
+
+import numpy as np
+
+from report_io import ROOT, HarnessReport, main_for
+
+sys.path.append(str(ROOT))
+
+from models.mode_classifier import MODES, ModeEngine, ModeThresholds, iter_health_telemetry
+
+STREAM_DURATION_S = 6 * 3600.0
+STREAM_RATE_HZ = 10.0
+STREAM_BLOCK_SAMPLES = 4096
+FIELDNAMES = [
+    "name", "torque_margin", "thermal_margin", "friction_index", "expected_mode", "actual_mode",
+    "value", "threshold", "pass",
+]
 
 
 @dataclass
@@ -25,7 +48,51 @@ def decide_mode(torque_margin: float, thermal_margin: float, friction_index: flo
     return "nominal"
 
 
-def main() -> None:
+def _dwell_respected(engine: ModeEngine) -> bool:
+    dwell = engine.thresholds.dwell_samples(engine.rate_hz)
+    entered, mode = 0, MODES.index("nominal")
+    for t in engine.transitions:
+        preempt = t.to_mode == "recovery" and engine.thresholds.recovery_preempts
+        if entered and not preempt and t.sample - entered < dwell[mode]:
+            return False
+        entered, mode = t.sample, MODES.index(t.to_mode)
+    return True
+
+
+def stream_checks() -> list[dict]:
+    x = np.concatenate(list(iter_health_telemetry(STREAM_DURATION_S, STREAM_RATE_HZ)))
+    samples = x.shape[0]
+
+    scalar_engine = ModeEngine(ModeThresholds.scalar(), STREAM_RATE_HZ)
+    scalar = scalar_engine.update(x)
+    ref = np.array([MODES.index(decide_mode(*r)) for r in x.tolist()], dtype=np.int8)
+    agree = int(np.count_nonzero(scalar == ref))
+
+    batch = ModeEngine(ModeThresholds(), STREAM_RATE_HZ)
+    modes = batch.update(x)
+    blocked = ModeEngine(ModeThresholds(), STREAM_RATE_HZ)
+    block_modes = np.concatenate(
+        [blocked.update(x[i: i + STREAM_BLOCK_SAMPLES]) for i in range(0, samples, STREAM_BLOCK_SAMPLES)]
+    )
+    online = ModeEngine(ModeThresholds(), STREAM_RATE_HZ)
+    online_modes = np.array([MODES.index(online.step(*r)) for r in x.tolist()], dtype=np.int8)
+    rate = batch.summary()["transitions_per_hour"]
+    scalar_rate = scalar_engine.summary()["transitions_per_hour"]
+
+    checks = [
+        ("stream_scalar_matches_decide_mode", f"{agree}/{samples}", f"{samples}/{samples}", agree == samples),
+        ("stream_blockwise_matches_batch", int(np.count_nonzero(block_modes != modes)), "0 mismatches",
+         bool(np.array_equal(block_modes, modes)) and blocked.transitions == batch.transitions),
+        ("stream_online_matches_batch", int(np.count_nonzero(online_modes != modes)), "0 mismatches",
+         bool(np.array_equal(online_modes, modes)) and online.transitions == batch.transitions),
+        ("stream_min_dwell_respected", len(batch.transitions), "all transitions", _dwell_respected(batch)),
+        ("stream_transitions_per_hour", round(rate, 1), f"< {scalar_rate:.1f} (no hysteresis/dwell)",
+         rate < scalar_rate),
+    ]
+    return [{"name": n, "value": v, "threshold": t, "pass": ok} for n, v, t, ok in checks]
+
+
+def report() -> HarnessReport:
     cases = [
         HealthScenario("healthy_nominal", 0.45, 0.50, 0.30, "nominal"),
         HealthScenario("high_friction_guard", 0.35, 0.40, 0.82, "steep_slope"),
@@ -51,29 +118,30 @@ def main() -> None:
             }
         )
 
-    report_dir = Path("verification/reports")
-    report_dir.mkdir(parents=True, exist_ok=True)
-    csv_path = report_dir / "autonomy_health_planner.csv"
-    md_path = report_dir / "autonomy_health_planner.md"
-
-    with csv_path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=list(out[0].keys()))
-        w.writeheader()
-        w.writerows(out)
+    checks = stream_checks()
+    out.extend(checks)
+    passes += sum(int(r["pass"]) for r in checks)
 
     status = "pass" if passes == len(out) else "fail"
     md = [
-        "# Autonomy Health Planner Test (v0.1)",
+        "# Autonomy Health Planner Test",
         "",
         f"- total: {len(out)}",
         f"- passed: {passes}",
         f"- status: **{status.upper()}**",
+        "",
+        f"Stream: {STREAM_DURATION_S / 3600.0:.0f} h simulated health telemetry at {STREAM_RATE_HZ:.0f} Hz.",
+        "",
+        "| check | value | threshold | pass |",
+        "|---|---:|---|---:|",
     ]
-    md_path.write_text("\n".join(md) + "\n", encoding="utf-8")
+    for r in checks:
+        md.append(f"| {r['name']} | {r['value']} | {r['threshold']} | {int(r['pass'])} |")
+    return HarnessReport("autonomy_health_planner", out, md, fieldnames=FIELDNAMES, log_lines=[f"STATUS={status}"])
 
-    print(f"Wrote {csv_path}")
-    print(f"Wrote {md_path}")
-    print(f"STATUS={status}")
+
+def main() -> None:
+    main_for(report())
 
 
 if __name__ == "__main__":
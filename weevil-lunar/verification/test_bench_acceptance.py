@@ -0,0 +1,59 @@
+"""Bench acceptance gate (bench_test_plan_v0.md, acceptance_targets_v0).
+
+Validates the filled trial log against the schema (`trial_log_schema.py`),
+aggregates it with `bench_aggregate.py` and checks the v0 targets at the
+lowest preload of each soil: S1/S0 f_peak gain, S1 > S0 for k_t and x_slip,
+cycle-10 f_peak retention of the candidate strategies (S1, S2), and
+S2 >= S1 >= S0 ranking in one soil.
+Until hardware trials are logged the report is NOT_RUN, which does not fail the
+`bench` gate class.
+"""
+
+from bench_aggregate import TRIAL_LOG, acceptance_rows, aggregate_csv
+from report_io import NOT_RUN, ROOT, HarnessReport, main_for
+from trial_log_schema import SCHEMA, validate_csv
+
+CACHE_INPUTS = [TRIAL_LOG.relative_to(ROOT).as_posix(), SCHEMA.relative_to(ROOT).as_posix()]
+FIELDNAMES = ["check", "soil_type", "strategy", "value", "threshold", "pass", "status"]
+
+
+def run() -> list[dict]:
+    if not TRIAL_LOG.exists():
+        return [
+            {
+                "check": "trial_log_present",
+                "soil_type": "",
+                "strategy": "",
+                "value": TRIAL_LOG.relative_to(ROOT).as_posix(),
+                "threshold": "exists",
+                "pass": False,
+                "status": NOT_RUN,
+            }
+        ]
+    n_rows, violations = validate_csv(TRIAL_LOG)
+    schema_row = {
+        "check": "trial_log_schema_violations",
+        "soil_type": "",
+        "strategy": "",
+        "value": len(violations),
+        "threshold": f"0 of {n_rows} rows",
+        "pass": not violations,
+        "status": "pass" if not violations else "fail",
+    }
+    return [schema_row] + acceptance_rows(aggregate_csv(TRIAL_LOG))
+
+
+def report() -> HarnessReport:
+    rows = run()
+    md_lines = ["# Bench Acceptance (v0)", "", "| check | soil | strategy | value | threshold | status |", "|---|---|---|---|---|---|"]
+    for r in rows:
+        md_lines.append(f"| {r['check']} | {r['soil_type']} | {r['strategy']} | {r['value']} | {r['threshold']} | {r['status']} |")
+    return HarnessReport("bench_acceptance", rows, md_lines, fieldnames=FIELDNAMES)
+
+
+def main() -> None:
+    main_for(report())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,65 +1,126 @@
-"""v0 stub: duty-cycle vs cadence envelope gate."""
+"""Duty-cycle vs cadence envelope gate.
 
-from pathlib import Path
-import csv
+The envelope surface comes from `models/duty_cycle_envelope.py`: for each
+terrain, slope (1 deg steps) and cadence (0.01 Hz steps) the admissible duty
+cycle is bounded by the gait_phase stance-fraction limits, minimum swing time,
+anchoring settle time and stance-time traction from the regolith contact model.
+The upper bound (duty_max) is set by the stance limit and swing time alone;
+traction and settle time raise duty_min or make a cell infeasible. So the gate
+checks, for every slope up to `mobility.tilt_hard_limit_deg` at cadences up to
+NOMINAL_CADENCE_HZ, that the cell is feasible and leaves a duty band
+(duty_max - duty_min) of at least MIN_DUTY_BAND for the gait controller. It also
+checks that each (terrain, slope) cadence column stays inside the stance-fraction
+limits without re-entering after going infeasible.
+The report lists the surface at REPORT_SLOPES_DEG x REPORT_CADENCES_HZ;
+`python models/duty_cycle_envelope.py --out <csv>` writes all of it.
+"""
 
+import math
+import sys
 
-def run() -> tuple[list[dict], bool]:
-    rows = [
-        {"cadence_hz": 0.2, "duty_cycle": 0.72},
-        {"cadence_hz": 0.4, "duty_cycle": 0.66},
-        {"cadence_hz": 0.6, "duty_cycle": 0.61},
-        {"cadence_hz": 0.8, "duty_cycle": 0.56},
-        {"cadence_hz": 1.0, "duty_cycle": 0.51},
-    ]
+import numpy as np
 
-    monotonic_nonincreasing = all(
-        rows[i]["duty_cycle"] >= rows[i + 1]["duty_cycle"] for i in range(len(rows) - 1)
-    )
-    in_bounds = all(0.35 <= r["duty_cycle"] <= 0.85 for r in rows)
-    passed = monotonic_nonincreasing and in_bounds
+from report_io import ROOT, HarnessReport, main_for
 
-    out = []
-    for r in rows:
-        out.append(
-            {
-                "test_id": "WL-VER-DUTY-CADENCE-001",
-                "cadence_hz": r["cadence_hz"],
-                "duty_cycle": r["duty_cycle"],
-                "pass": passed,
-            }
-        )
-    return out, passed
+sys.path.append(str(ROOT))
 
+from models.duty_cycle_envelope import load_tilt_limit_deg, run_envelope
+from models.stance_detector import load_gait_params
+
+TEST_ID = "WL-VER-DUTY-CADENCE-001"
+NOMINAL_CADENCE_HZ = 0.4
+REPORT_SLOPES_DEG = [0.0, 15.0, 25.0, 30.0, 35.0, 45.0]
+REPORT_CADENCES_HZ = [0.2, 0.4, 0.6, 0.8, 1.0]
+MIN_DUTY_BAND = 0.05  # duty-cycle headroom the gait controller needs at required cells
+
+
+def _column_checks(duty_min: np.ndarray, duty_max: np.ndarray, lo: float, hi: float) -> bool:
+    """No re-entry after infeasible and lo <= duty_min <= duty_max <= hi over one cadence column."""
+    ok = np.isfinite(duty_max)
+    contiguous = not np.any(~ok[:-1] & ok[1:])
+    dmin, dmax = duty_min[ok], duty_max[ok]
+    return contiguous and bool(np.all((dmin >= lo - 1e-9) & (dmin <= dmax) & (dmax <= hi + 1e-9)))
 
-def main() -> None:
-    rows, passed = run()
-    reports = Path(__file__).resolve().parent / "reports"
-    reports.mkdir(parents=True, exist_ok=True)
 
-    csv_path = reports / "duty_cycle_cadence_envelope.csv"
-    md_path = reports / "duty_cycle_cadence_envelope.md"
+def _band_ok(env, i: int, cadences: np.ndarray, tilt_limit: float, slope: float) -> bool:
+    """Feasible with at least MIN_DUTY_BAND at every required cadence of slope row ``i``."""
+    if slope > tilt_limit:
+        return True
+    req = cadences <= NOMINAL_CADENCE_HZ + 1e-9
+    band = env.duty_max[i, req] - env.duty_min[i, req]
+    return bool(np.all(np.isfinite(band) & (band >= MIN_DUTY_BAND - 1e-9)))
 
-    with csv_path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
-        w.writeheader()
-        w.writerows(rows)
 
+def run() -> list[dict]:
+    gait = load_gait_params()
+    tilt_limit = load_tilt_limit_deg()
+    surface = run_envelope(workers=1, gait=gait)
+    slopes = list(surface.slopes_deg)
+    cadences = list(np.round(surface.cadences_hz, 4))
+
+    rows = []
+    for env in surface.terrains:
+        fmax = surface.max_cadence_hz(env.terrain)
+        for slope in REPORT_SLOPES_DEG:
+            i = slopes.index(slope)
+            in_bounds = _column_checks(env.duty_min[i], env.duty_max[i], gait.min_stance_fraction,
+                                       gait.max_stance_fraction)
+            band_ok = _band_ok(env, i, surface.cadences_hz, tilt_limit, slope)
+            for cadence in REPORT_CADENCES_HZ:
+                j = cadences.index(cadence)
+                feasible = math.isfinite(env.duty_max[i, j])
+                required = slope <= tilt_limit and cadence <= NOMINAL_CADENCE_HZ
+                band = float(env.duty_max[i, j] - env.duty_min[i, j]) if feasible else math.nan
+                passed = in_bounds and band_ok and (not required or (feasible and band >= MIN_DUTY_BAND - 1e-9))
+                rows.append(
+                    {
+                        "test_id": TEST_ID,
+                        "terrain": env.terrain,
+                        "slope_deg": slope,
+                        "cadence_hz": cadence,
+                        "duty_min": round(float(env.duty_min[i, j]), 4) if feasible else "",
+                        "duty_max": round(float(env.duty_max[i, j]), 4) if feasible else "",
+                        "duty_band": round(band, 4) if feasible else "",
+                        "anchored": bool(env.anchored[i, j]),
+                        "traction_margin": round(float(env.traction_margin[i, j]), 3) if feasible else "",
+                        "max_cadence_hz": round(float(fmax[i]), 2) if math.isfinite(fmax[i]) else "",
+                        "required_feasible": required,
+                        "band_ok": band_ok,
+                        "within_stance_limits": in_bounds,
+                        "pass": passed,
+                        "status": "pass" if passed else "baseline-fail",
+                    }
+                )
+    return rows
+
+
+def report() -> HarnessReport:
+    rows = run()
+    passed = all(r["pass"] for r in rows)
     status = "pass" if passed else "baseline-fail"
     md_lines = [
         "# Duty Cycle vs Cadence Envelope",
         "",
-        f"- Test ID: `WL-VER-DUTY-CADENCE-001`",
-        f"- Monotonic non-increasing duty cycle vs cadence: {passed}",
+        f"- Test ID: `{TEST_ID}`",
+        "- Bounds: gait_phase stance fraction and swing time (duty max); anchoring settle time and "
+        "stance-time traction (duty min, feasibility)",
+        f"- Required: slope <= tilt hard limit at cadence <= {NOMINAL_CADENCE_HZ} Hz feasible with "
+        f"duty band >= {MIN_DUTY_BAND}",
         f"- Status: **{status}**",
         "",
-        "| cadence_hz | duty_cycle |",
-        "|---:|---:|",
+        "| terrain | slope deg | cadence Hz | duty min | duty max | band | anchored | traction margin | max cadence Hz | status |",
+        "|---|---:|---:|---:|---:|---:|---:|---:|---:|---|",
     ]
     for r in rows:
-        md_lines.append(f"| {r['cadence_hz']:.2f} | {r['duty_cycle']:.2f} |")
+        md_lines.append(
+            f"| {r['terrain']} | {r['slope_deg']:.0f} | {r['cadence_hz']:.2f} | {r['duty_min']} | {r['duty_max']} | {r['duty_band']} "
+            f"| {int(r['anchored'])} | {r['traction_margin']} | {r['max_cadence_hz']} | {r['status']} |"
+        )
+    return HarnessReport("duty_cycle_cadence_envelope", rows, md_lines)
+
 
-    md_path.write_text("\n".join(md_lines) + "\n", encoding="utf-8")
+def main() -> None:
+    main_for(report())
 
 
 if __name__ == "__main__":
@@ -1,7 +1,6 @@
 """v0 stub: off-plane coupling index gate."""
 
-from pathlib import Path
-import csv
+from report_io import HarnessReport, main_for
 
 
 def run() -> dict:
@@ -18,19 +17,8 @@ def run() -> dict:
     }
 
 
-def main() -> None:
+def report() -> HarnessReport:
     result = run()
-    reports = Path(__file__).resolve().parent / "reports"
-    reports.mkdir(parents=True, exist_ok=True)
-
-    csv_path = reports / "offplane_coupling_index.csv"
-    md_path = reports / "offplane_coupling_index.md"
-
-    with csv_path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=list(result.keys()))
-        w.writeheader()
-        w.writerow(result)
-
     md_lines = [
         "# Off-Plane Coupling Index",
         "",
@@ -39,7 +27,11 @@ def main() -> None:
         f"- Limit: {result['offplane_index_limit']:.3f}",
         f"- Status: **{result['status']}**",
     ]
-    md_path.write_text("\n".join(md_lines) + "\n", encoding="utf-8")
+    return HarnessReport("offplane_coupling_index", [result], md_lines)
+
+
+def main() -> None:
+    main_for(report())
 
 
 if __name__ == "__main__":
@@ -4,8 +4,7 @@ Purpose:
 - quantify whether proximal compliance improves recovery under lateral/off-plane perturbations.
 """
 
-from pathlib import Path
-import csv
+from report_io import HarnessReport, main_for
 
 
 def run() -> dict:
@@ -30,27 +29,23 @@ def run() -> dict:
     }
 
 
-def main() -> None:
+def report() -> HarnessReport:
     result = run()
-    reports = Path(__file__).resolve().parent / "reports"
-    reports.mkdir(parents=True, exist_ok=True)
-
-    csv_path = reports / "offplane_impulse_recovery.csv"
-    md_path = reports / "offplane_impulse_recovery.md"
-
-    with csv_path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=list(result.keys()))
-        w.writeheader()
-        w.writerow(result)
-
-    with md_path.open("w", encoding="utf-8") as f:
-        f.write("# Off-Plane Impulse Recovery\n\n")
-        f.write(f"- Test ID: `{result['test_id']}`\n")
-        f.write(f"- Status: **{result['status']}**\n")
-        f.write(f"- Baseline recovery time: {result['baseline_recovery_time_s']} s\n")
-        f.write(f"- Compliant recovery time: {result['compliant_recovery_time_s']} s\n")
-        f.write(f"- Baseline peak slip: {result['baseline_peak_slip_mm']} mm\n")
-        f.write(f"- Compliant peak slip: {result['compliant_peak_slip_mm']} mm\n")
+    md_lines = [
+        "# Off-Plane Impulse Recovery",
+        "",
+        f"- Test ID: `{result['test_id']}`",
+        f"- Status: **{result['status']}**",
+        f"- Baseline recovery time: {result['baseline_recovery_time_s']} s",
+        f"- Compliant recovery time: {result['compliant_recovery_time_s']} s",
+        f"- Baseline peak slip: {result['baseline_peak_slip_mm']} mm",
+        f"- Compliant peak slip: {result['compliant_peak_slip_mm']} mm",
+    ]
+    return HarnessReport("offplane_impulse_recovery", [result], md_lines)
+
+
+def main() -> None:
+    main_for(report())
 
 
 if __name__ == "__main__":
@@ -3,8 +3,7 @@
 
 from __future__ import annotations
 
-import csv
-from pathlib import Path
+from report_io import ROOT, HarnessReport, main_for
 
 
 REQUIRED = [
@@ -22,27 +21,17 @@ REQUIRED = [
     "cad/fixtures/actuation_lever_25mm_template.md",
     "cad/export/weevil_leg_module.urdf",
 ]
+CACHE_INPUTS = REQUIRED
 
 
-def main() -> None:
-    root = Path('.')
+def report() -> HarnessReport:
     rows = []
     passes = 0
     for rel in REQUIRED:
-        exists = (root / rel).exists()
+        exists = (ROOT / rel).exists()
         passes += int(exists)
         rows.append({"artifact": rel, "pass": exists})
 
-    report_dir = Path("verification/reports")
-    report_dir.mkdir(parents=True, exist_ok=True)
-    csv_path = report_dir / "phase2_cad_artifacts.csv"
-    md_path = report_dir / "phase2_cad_artifacts.md"
-
-    with csv_path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=["artifact", "pass"])
-        w.writeheader()
-        w.writerows(rows)
-
     status = "pass" if passes == len(REQUIRED) else "fail"
     md = [
         "# Phase 2 CAD Artifacts Check",
@@ -56,11 +45,11 @@ def main() -> None:
     ]
     for r in rows:
         md.append(f"| {r['artifact']} | {int(bool(r['pass']))} |")
-    md_path.write_text("\n".join(md) + "\n", encoding="utf-8")
+    return HarnessReport("phase2_cad_artifacts", rows, md, fieldnames=["artifact", "pass"], log_lines=[f"STATUS={status}"])
 
-    print(f"Wrote {csv_path}")
-    print(f"Wrote {md_path}")
-    print(f"STATUS={status}")
+
+def main() -> None:
+    main_for(report())
 
 
 if __name__ == "__main__":
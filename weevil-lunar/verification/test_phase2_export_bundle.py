@@ -3,10 +3,11 @@
 
 from __future__ import annotations
 
-import csv
 import datetime as dt
 from pathlib import Path
 
+from report_io import ROOT, HarnessReport, main_for
+
 REQUIRED = [
     Path("cad/export/Phase2_Templates.FCStd"),
     Path("cad/export/weevil_leg_module_ap242.step"),
@@ -14,19 +15,21 @@ REQUIRED = [
 ]
 
 FRESH_HOURS = 24 * 7  # one week freshness window
+CACHEABLE = False  # result depends on wall-clock age of the artifacts
 
 
-def main() -> None:
+def report() -> HarnessReport:
     now = dt.datetime.now(dt.timezone.utc)
     rows = []
     passed = 0
 
     for p in REQUIRED:
-        exists = p.exists()
+        path = ROOT / p
+        exists = path.exists()
         fresh = False
         age_hours = None
         if exists:
-            mtime = dt.datetime.fromtimestamp(p.stat().st_mtime, tz=dt.timezone.utc)
+            mtime = dt.datetime.fromtimestamp(path.stat().st_mtime, tz=dt.timezone.utc)
             age_hours = (now - mtime).total_seconds() / 3600.0
             fresh = age_hours <= FRESH_HOURS
         ok = bool(exists and fresh)
@@ -41,16 +44,6 @@ def main() -> None:
             }
         )
 
-    out_dir = Path("verification/reports")
-    out_dir.mkdir(parents=True, exist_ok=True)
-    csv_path = out_dir / "phase2_export_bundle.csv"
-    md_path = out_dir / "phase2_export_bundle.md"
-
-    with csv_path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=["artifact", "exists", "age_hours", "fresh_lte_168h", "pass"])
-        w.writeheader()
-        w.writerows(rows)
-
     status = "pass" if passed == len(REQUIRED) else "fail"
     lines = [
         "# Phase 2 Export Bundle Validation",
@@ -65,11 +58,17 @@ def main() -> None:
     ]
     for r in rows:
         lines.append(f"| {r['artifact']} | {int(bool(r['exists']))} | {r['age_hours']} | {int(bool(r['fresh_lte_168h']))} | {int(bool(r['pass']))} |")
-    md_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return HarnessReport(
+        "phase2_export_bundle",
+        rows,
+        lines,
+        fieldnames=["artifact", "exists", "age_hours", "fresh_lte_168h", "pass"],
+        log_lines=[f"STATUS={status}"],
+    )
+
 
-    print(f"Wrote {csv_path}")
-    print(f"Wrote {md_path}")
-    print(f"STATUS={status}")
+def main() -> None:
+    main_for(report())
 
 
 if __name__ == "__main__":
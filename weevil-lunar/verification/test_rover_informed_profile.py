@@ -1,11 +1,23 @@
 #!/usr/bin/env python3
-"""Rover-informed mobility/thermal/power profile checks (v0.1)."""
+"""Rover-informed mobility/thermal/power profile checks (v0.1).
+
+Energy and telemetry checks run the `models/energy_budget.py` ensemble for the
+matching power/comms profile family: the recovery reserve and night survival
+must hold in at least MIN_ENSEMBLE_PROBABILITY of scenarios, and p95 telemetry
+loss must stay within MAX_TELEMETRY_LOSS_PCT.
+"""
 
 from __future__ import annotations
 
-import csv
+import sys
 from dataclasses import dataclass
-from pathlib import Path
+
+from report_io import ROOT, HarnessReport, main_for
+
+sys.path.append(str(ROOT))
+
+from models.energy_budget import load_power_params, sample_scenarios, simulate, summarize
+from test_power_comms_profile import ENSEMBLE_SCENARIOS, FAMILIES, MAX_TELEMETRY_LOSS_PCT, MIN_ENSEMBLE_PROBABILITY
 
 
 @dataclass
@@ -15,36 +27,49 @@ class Scenario:
     virtual_rocker_bogie: bool
     traction_margin_down: float
     traction_margin_lat: float
-    day_energy_wh: float
-    loads_wh: float
-    dust_derate_factor: float
+    power_family: str
     thermal_core_ok: bool
-    telemetry_retained_after_dropout: bool
 
 
-def evaluate(s: Scenario) -> tuple[bool, dict[str, bool]]:
+def evaluate(s: Scenario, energy: dict[str, float]) -> tuple[bool, dict[str, bool]]:
     checks = {
         "tilt_envelope_ok": s.tilt_deg <= 30.0,
         "virtual_rocker_bogie_ok": s.virtual_rocker_bogie,
         "traction_margin_ok": s.traction_margin_down >= 1.05 and s.traction_margin_lat >= 1.20,
-        "energy_margin_ok": (s.day_energy_wh * s.dust_derate_factor) - s.loads_wh >= 0.0,
+        "energy_margin_ok": (
+            energy["p_reserve_kept"] >= MIN_ENSEMBLE_PROBABILITY
+            and energy["p_night_survived"] >= MIN_ENSEMBLE_PROBABILITY
+        ),
         "thermal_core_ok": s.thermal_core_ok,
-        "telemetry_retention_ok": s.telemetry_retained_after_dropout,
+        "telemetry_retention_ok": energy["telemetry_loss_pct_p95"] <= MAX_TELEMETRY_LOSS_PCT,
     }
     return all(checks.values()), checks
 
 
-def main() -> None:
+def energy_summaries(scenarios: list[Scenario]) -> dict[str, dict[str, float]]:
+    """One ensemble per power/comms family, seeded as in test_power_comms_profile.py."""
+    power = load_power_params()
+    seeds = {family: 20260301 + k for k, family in enumerate(FAMILIES)}
+    out = {}
+    for family in sorted({s.power_family for s in scenarios}):
+        scen = sample_scenarios(ENSEMBLE_SCENARIOS, power, FAMILIES[family], seed=seeds[family])
+        out[family] = summarize(simulate(power, scen))
+    return out
+
+
+def report() -> HarnessReport:
     scenarios = [
-        Scenario("nominal_mare_day", 18.0, True, 1.20, 1.34, 520.0, 330.0, 0.78, True, True),
-        Scenario("steep_slope_recovery", 28.0, True, 1.08, 1.23, 520.0, 360.0, 0.78, True, True),
-        Scenario("dropout_night_survival", 12.0, True, 1.15, 1.28, 520.0, 390.0, 0.78, True, True),
+        Scenario("nominal_mare_day", 18.0, True, 1.20, 1.34, "nominal_day", True),
+        Scenario("steep_slope_recovery", 28.0, True, 1.08, 1.23, "steep_slope", True),
+        Scenario("dropout_night_survival", 12.0, True, 1.15, 1.28, "dropout_window", True),
     ]
+    energy = energy_summaries(scenarios)
 
     out_rows = []
     passes = 0
     for s in scenarios:
-        ok, checks = evaluate(s)
+        e = energy[s.power_family]
+        ok, checks = evaluate(s, e)
         passes += int(ok)
         out_rows.append(
             {
@@ -53,11 +78,12 @@ def main() -> None:
                 "virtual_rocker_bogie": s.virtual_rocker_bogie,
                 "traction_margin_down": s.traction_margin_down,
                 "traction_margin_lat": s.traction_margin_lat,
-                "day_energy_wh": s.day_energy_wh,
-                "loads_wh": s.loads_wh,
-                "dust_derate_factor": s.dust_derate_factor,
+                "power_family": s.power_family,
+                "p_reserve_kept": round(e["p_reserve_kept"], 4),
+                "p_night_survived": round(e["p_night_survived"], 4),
+                "min_soc_p05_wh": round(e["min_soc_p05_wh"], 4),
+                "telemetry_loss_pct_p95": round(e["telemetry_loss_pct_p95"], 4),
                 "thermal_core_ok": s.thermal_core_ok,
-                "telemetry_retained_after_dropout": s.telemetry_retained_after_dropout,
                 "tilt_envelope_ok": checks["tilt_envelope_ok"],
                 "virtual_rocker_bogie_ok": checks["virtual_rocker_bogie_ok"],
                 "traction_margin_ok": checks["traction_margin_ok"],
@@ -67,38 +93,32 @@ def main() -> None:
             }
         )
 
-    report_dir = Path("verification/reports")
-    report_dir.mkdir(parents=True, exist_ok=True)
-    csv_path = report_dir / "rover_informed_profile.csv"
-    md_path = report_dir / "rover_informed_profile.md"
-
-    with csv_path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=list(out_rows[0].keys()))
-        writer.writeheader()
-        writer.writerows(out_rows)
-
     status = "pass" if passes == len(out_rows) else "fail"
     lines = [
         "# Rover-Informed Profile Test",
         "",
-        "Model-based check for rover-derived requirements in mobility/thermal/power/comms continuity.",
+        "Model-based check for rover-derived requirements in mobility/thermal/power/comms continuity; "
+        f"energy and telemetry come from models/energy_budget.py ensembles ({ENSEMBLE_SCENARIOS} scenarios each).",
         "",
         f"- total: {len(out_rows)}",
         f"- passed: {passes}",
         f"- status: **{status.upper()}**",
         "",
-        "| scenario | tilt_ok | traction_ok | energy_ok | telemetry_ok | pass |",
-        "|---|---:|---:|---:|---:|---:|",
+        "| scenario | power family | tilt_ok | traction_ok | P(reserve kept) | min SOC p05 Wh | energy_ok "
+        "| telemetry loss p95 % | telemetry_ok | pass |",
+        "|---|---|---:|---:|---:|---:|---:|---:|---:|---:|",
     ]
     for r in out_rows:
         lines.append(
-            f"| {r['scenario']} | {int(bool(r['tilt_envelope_ok']))} | {int(bool(r['traction_margin_ok']))} | {int(bool(r['energy_margin_ok']))} | {int(bool(r['telemetry_retention_ok']))} | {int(bool(r['pass']))} |"
+            f"| {r['scenario']} | {r['power_family']} | {int(bool(r['tilt_envelope_ok']))} | {int(bool(r['traction_margin_ok']))} "
+            f"| {r['p_reserve_kept']:.4f} | {r['min_soc_p05_wh']:.1f} | {int(bool(r['energy_margin_ok']))} "
+            f"| {r['telemetry_loss_pct_p95']:.2f} | {int(bool(r['telemetry_retention_ok']))} | {int(bool(r['pass']))} |"
         )
-    md_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return HarnessReport("rover_informed_profile", out_rows, lines, log_lines=[f"STATUS={status}"])
 
-    print(f"Wrote {csv_path}")
-    print(f"Wrote {md_path}")
-    print(f"STATUS={status}")
+
+def main() -> None:
+    main_for(report())
 
 
 if __name__ == "__main__":
@@ -1,56 +1,115 @@
-"""v0 stub: stance-phase detection gate.
+"""Stance-phase detection gate.
 
-Evaluates whether contact-state transitions inferred from z/force proxies stay
-within expected stance fraction envelope.
+Streams six-leg foot telemetry through `models/stance_detector.py` (z threshold
+from `gait_phase.contact_z_threshold_mm` with hysteresis, force confirmation
+and debounce) and checks each leg's stance fraction against the gait_phase
+envelope. Uses recorded telemetry from `verification/bench_data/leg_telemetry.npz`
+(arrays `z_mm`, `f_z_N` of shape (samples, legs) and scalar `sample_rate_hz`)
+when present, otherwise replays simulated 1 kHz tripod-gait telemetry, where
+the detected state is also scored against the simulated ground truth.
 """
 
+import sys
 from pathlib import Path
-import csv
 
+import numpy as np
 
-def run() -> dict:
-    test_id = "WL-VER-STANCE-PHASE-001"
-    contact_z_threshold_mm = 2.5
-    measured_stance_fraction = 0.62
-    min_stance_fraction = 0.45
-    max_stance_fraction = 0.75
+from report_io import ROOT, HarnessReport, main_for
 
-    passed = min_stance_fraction <= measured_stance_fraction <= max_stance_fraction
+sys.path.append(str(ROOT))
 
-    return {
-        "test_id": test_id,
-        "contact_z_threshold_mm": contact_z_threshold_mm,
-        "measured_stance_fraction": measured_stance_fraction,
-        "min_stance_fraction": min_stance_fraction,
-        "max_stance_fraction": max_stance_fraction,
-        "pass": passed,
-        "status": "pass" if passed else "baseline-fail",
-    }
+from models.stance_detector import StanceDetector, iter_tripod_telemetry, load_gait_params
 
+TEST_ID = "WL-VER-STANCE-PHASE-001"
+TELEMETRY = ROOT / "verification" / "bench_data" / "leg_telemetry.npz"
+CACHE_INPUTS = [TELEMETRY.relative_to(ROOT).as_posix()]
+SIM_DURATION_S = 120.0
+SIM_RATE_HZ = 1000.0
+BLOCK_SAMPLES = 10_000
+MIN_TRUTH_AGREEMENT = 0.97
 
-def main() -> None:
-    result = run()
-    reports = Path(__file__).resolve().parent / "reports"
-    reports.mkdir(parents=True, exist_ok=True)
 
-    csv_path = reports / "stance_phase_detection.csv"
-    md_path = reports / "stance_phase_detection.md"
+def recorded_blocks(path: Path):
+    with np.load(path) as data:
+        z, f = data["z_mm"], data["f_z_N"]
+    for start in range(0, z.shape[0], BLOCK_SAMPLES):
+        yield z[start: start + BLOCK_SAMPLES], f[start: start + BLOCK_SAMPLES], None
+
+
+def run() -> list[dict]:
+    params = load_gait_params()
+    if TELEMETRY.exists():
+        with np.load(TELEMETRY) as data:
+            rate = float(data["sample_rate_hz"])
+            n_legs = int(data["z_mm"].shape[1])
+        source = f"recorded:{TELEMETRY.relative_to(ROOT).as_posix()}"
+        blocks = recorded_blocks(TELEMETRY)
+    else:
+        rate, n_legs = SIM_RATE_HZ, params.leg_count
+        source = "simulated"
+        blocks = iter_tripod_telemetry(SIM_DURATION_S, rate, leg_load_n=params.tripod_leg_load_n, n_legs=n_legs)
+
+    det = StanceDetector.from_params(params, rate, n_legs=n_legs)
+    agree = np.zeros(n_legs, dtype=np.int64)
+    scored = False
+    for z, f, truth in blocks:
+        contact = det.update(z, f)
+        if truth is not None:
+            agree += np.count_nonzero(contact == truth, axis=0)
+            scored = True
+
+    rows = []
+    for leg in det.summary():
+        agreement = agree[leg["leg"]] / det.samples if scored and det.samples else None
+        in_envelope = params.min_stance_fraction <= leg["stance_fraction"] <= params.max_stance_fraction
+        passed = bool(in_envelope and (agreement is None or agreement >= MIN_TRUTH_AGREEMENT))
+        rows.append(
+            {
+                "test_id": TEST_ID,
+                "source": source,
+                "leg": leg["leg"],
+                "contact_z_threshold_mm": params.contact_z_threshold_mm,
+                "measured_stance_fraction": round(leg["stance_fraction"], 4),
+                "min_stance_fraction": params.min_stance_fraction,
+                "max_stance_fraction": params.max_stance_fraction,
+                "touchdowns": leg["touchdowns"],
+                "liftoffs": leg["liftoffs"],
+                "debounce_rejected": leg["debounce_rejected"],
+                "unconfirmed_z_samples": leg["unconfirmed_z_samples"],
+                "mean_stance_s": round(leg["mean_stance_s"], 4),
+                "truth_agreement": "" if agreement is None else round(float(agreement), 4),
+                "pass": passed,
+                "status": "pass" if passed else "baseline-fail",
+            }
+        )
+    return rows
 
-    with csv_path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=list(result.keys()))
-        w.writeheader()
-        w.writerow(result)
 
+def report() -> HarnessReport:
+    rows = run()
+    r0 = rows[0]
     md_lines = [
         "# Stance Phase Detection",
         "",
-        f"- Test ID: `{result['test_id']}`",
-        f"- Contact Z threshold: {result['contact_z_threshold_mm']} mm",
-        f"- Measured stance fraction: {result['measured_stance_fraction']:.2f}",
-        f"- Allowed range: [{result['min_stance_fraction']:.2f}, {result['max_stance_fraction']:.2f}]",
-        f"- Status: **{result['status']}**",
+        f"- Test ID: `{TEST_ID}`",
+        f"- Telemetry: {r0['source']}",
+        f"- Contact Z threshold: {r0['contact_z_threshold_mm']} mm (+ hysteresis, force-confirmed, debounced)",
+        f"- Allowed range: [{r0['min_stance_fraction']:.2f}, {r0['max_stance_fraction']:.2f}]",
+        "",
+        "| leg | stance fraction | touchdowns | liftoffs | debounce rejected | unconfirmed z samples | mean stance s | truth agreement | status |",
+        "|---:|---:|---:|---:|---:|---:|---:|---:|---|",
     ]
-    md_path.write_text("\n".join(md_lines) + "\n", encoding="utf-8")
+    for r in rows:
+        md_lines.append(
+            f"| {r['leg']} | {r['measured_stance_fraction']:.3f} | {r['touchdowns']} | {r['liftoffs']} "
+            f"| {r['debounce_rejected']} | {r['unconfirmed_z_samples']} | {r['mean_stance_s']:.3f} "
+            f"| {r['truth_agreement']} | {r['status']} |"
+        )
+    return HarnessReport("stance_phase_detection", rows, md_lines)
+
+
+def main() -> None:
+    main_for(report())
 
 
 if __name__ == "__main__":
@@ -1,11 +1,46 @@
 #!/usr/bin/env python3
-"""Steep-slope state machine validation harness (v0.1)."""
+"""Steep-slope state machine validation harness.
+
+Besides the v0.1 scenarios, the table-driven push-off gate
+(`models/push_off_table.py`) is checked exhaustively: against
+`push_off_allowed` on every combination of guard thresholds and their
+neighbouring floats, against the reference guards compiled from
+`specs/foot_anchoring_spec.md` on a dense ~15M-point grid, and for decision
+boundaries that sit exactly on a guard threshold. Margins derived from the
+regolith contact model per terrain must give a push-off region that is
+contiguous in slope.
+"""
 
 from __future__ import annotations
 
-import csv
+import itertools
+import sys
 from dataclasses import dataclass
-from pathlib import Path
+
+import numpy as np
+
+from report_io import ROOT, HarnessReport, main_for
+
+sys.path.append(str(ROOT))
+
+from models.push_off_table import (
+    PUSH_OFF_TABLE,
+    SPEC_PATH,
+    compile_table,
+    decision_boundaries,
+    dense_grid,
+    evaluate,
+    grid_points,
+    physics_margins,
+    spec_table,
+)
+
+CACHE_INPUTS = [SPEC_PATH.relative_to(ROOT).as_posix()]
+PHYSICS_SLOPES_DEG = np.round(np.arange(0.0, 45.0 + 1e-9, 0.1), 6)
+FIELDNAMES = [
+    "scenario", "slope_deg", "anchored", "margin_down", "margin_lat", "expected_push_off", "actual_push_off",
+    "value", "threshold", "pass",
+]
 
 
 @dataclass
@@ -27,7 +62,53 @@ def push_off_allowed(slope_deg: float, anchored: bool, margin_down: float, margi
     return True
 
 
-def main() -> None:
+def _check(name: str, value, threshold: str, ok: bool, **extra) -> dict:
+    return {"scenario": name, **extra, "value": value, "threshold": threshold, "pass": bool(ok)}
+
+
+def table_checks() -> list[dict]:
+    table = compile_table(PUSH_OFF_TABLE)
+    reference = compile_table(spec_table())
+    rows = []
+
+    probes = dense_grid([table], slope_deg=(0.0, 45.0, 45.0), margin_down=(1.0, 1.1, 0.1), margin_lat=(1.1, 1.3, 0.2))
+    allowed, _ = evaluate(table, [a.ravel() for a in np.meshgrid(*probes, indexing="ij")])
+    scalar = [push_off_allowed(s, bool(a), d, lat) for s, a, d, lat in itertools.product(*[p.tolist() for p in probes])]
+    mismatches = int(np.count_nonzero(allowed != np.array(scalar)))
+    rows.append(_check("table_matches_push_off_allowed", f"{mismatches}/{len(scalar)}", "0 mismatches", mismatches == 0))
+
+    axes = dense_grid([table, reference])
+    points = grid_points(axes)
+    allowed, _ = evaluate(table, points)
+    ref_allowed, _ = evaluate(reference, points)
+    diff = np.argwhere(allowed != ref_allowed)
+    first = "" if not diff.size else " first at " + ",".join(f"{axes[k][i]:.6g}" for k, i in enumerate(diff[0]))
+    rows.append(_check("table_matches_spec", f"{len(diff)}/{allowed.size}{first}", "0 disagreements", len(diff) == 0))
+
+    thresholds = {(g.column, g.threshold) for g in table.guards}
+    found = set()
+    for b in decision_boundaries(axes, allowed):
+        if b["axis"] == "anchored":
+            continue
+        at = next(((c, t) for c, t in thresholds if c == b["axis"] and b["lower"] <= t <= b["upper"]), None)
+        tight = np.nextafter(b["lower"], np.inf) == b["upper"]
+        found.add(at)
+        rows.append(_check(f"boundary_{b['axis']}", f"({b['lower']!r}, {b['upper']!r}] x{b['flips']}",
+                           f"adjacent floats at {at[1] if at else 'a guard threshold'}", at is not None and tight))
+    missing = sorted(thresholds - found)
+    rows.append(_check("boundary_every_guard", len(thresholds) - len(missing), f"{len(thresholds)} guards", not missing))
+
+    for anchored in (False, True):
+        for terrain, (md, ml) in physics_margins(PHYSICS_SLOPES_DEG, anchored).items():
+            ok, _ = evaluate(table, [PHYSICS_SLOPES_DEG, np.full(PHYSICS_SLOPES_DEG.shape, anchored), md, ml])
+            contiguous = not np.any(~ok[:-1] & ok[1:])
+            max_slope = float(PHYSICS_SLOPES_DEG[ok].max()) if ok.any() else ""
+            rows.append(_check(f"physics_{terrain}", max_slope, "push-off region contiguous in slope", contiguous,
+                               anchored=anchored))
+    return rows
+
+
+def report() -> HarnessReport:
     scenarios = [
         Scenario("nominal_flat", 5.0, False, 1.30, 1.40),
         Scenario("steep_unanchored", 32.0, False, 1.20, 1.30),
@@ -63,34 +144,33 @@ def main() -> None:
             }
         )
 
-    report_dir = Path("verification/reports")
-    report_dir.mkdir(parents=True, exist_ok=True)
-    csv_path = report_dir / "steep_slope_state_machine.csv"
-    md_path = report_dir / "steep_slope_state_machine.md"
-
-    with csv_path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=list(out_rows[0].keys()))
-        w.writeheader()
-        w.writerows(out_rows)
+    checks = table_checks()
+    out_rows.extend(checks)
+    passes += sum(int(r["pass"]) for r in checks)
 
-    summary = "pass" if passes == len(scenarios) else "fail"
+    summary = "pass" if passes == len(out_rows) else "fail"
     md_lines = [
         "# Steep Slope State Machine Test",
         "",
-        f"- total: {len(scenarios)}",
+        f"- total: {len(out_rows)}",
         f"- passed: {passes}",
         f"- status: **{summary.upper()}**",
         "",
         "| scenario | expected | actual | pass |",
         "|---|---:|---:|---:|",
     ]
-    for r in out_rows:
+    for r in out_rows[: len(scenarios)]:
         md_lines.append(f"| {r['scenario']} | {int(r['expected_push_off'])} | {int(r['actual_push_off'])} | {int(r['pass'])} |")
-    md_path.write_text("\n".join(md_lines) + "\n", encoding="utf-8")
+    md_lines += ["", "Table-driven gate (physics rows: max slope with push-off allowed)", "",
+                 "| check | anchored | value | threshold | pass |", "|---|---:|---|---|---:|"]
+    for r in checks:
+        md_lines.append(f"| {r['scenario']} | {r.get('anchored', '')} | {r['value']} | {r['threshold']} | {int(r['pass'])} |")
+    return HarnessReport("steep_slope_state_machine", out_rows, md_lines, fieldnames=FIELDNAMES,
+                         log_lines=[f"STATUS={summary}"])
 
-    print(f"Wrote {csv_path}")
-    print(f"Wrote {md_path}")
-    print(f"STATUS={summary}")
+
+def main() -> None:
+    main_for(report())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Headless geometry checks on the exported AP242 STEP (no FreeCAD needed).
+
+`cad/scripts/step_reader.py` streams the export once; this gate then checks:
+- the file's length unit matches `meta.units` of the leg parameters (mm)
+- every template body of the Phase 2 manifest is in the export as a solid
+- each body fits within the femur link length (a single-link part)
+- the whole module fits within the leg reach: femur link + tibia stroke + foot radius
+
+Bounding boxes are taken in each product's own frame (all Phase 2 templates
+are placed at the origin).
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "cad" / "scripts"))
+
+from models.lunar_integrated_weevil_leg import load_params
+from report_io import HarnessReport, main_for
+from simple_yaml import load_yaml_file
+from step_reader import STEP_PATH, read_step
+
+MANIFEST = ROOT / "cad" / "phase2_integration_manifest.yaml"
+CACHE_INPUTS = [
+    STEP_PATH.relative_to(ROOT).as_posix(),
+    MANIFEST.relative_to(ROOT).as_posix(),
+    "cad/scripts/step_reader.py",
+]
+LENGTH_UNIT = "mm"  # meta.units, enforced by validate_weevil_leg_params.py
+FIELDNAMES = ["check", "item", "solids", "extents_mm", "max_extent_mm", "limit_mm", "limit_source", "pass"]
+
+
+def _fmt_extents(extents: tuple[float, float, float]) -> str:
+    return " x ".join(f"{e:g}" for e in extents)
+
+
+def report() -> HarnessReport:
+    params = load_params()
+    manifest = load_yaml_file(MANIFEST)
+    bodies = [t["body"] for t in manifest["phase2_integration"]["templates"]]
+
+    t0 = time.perf_counter()
+    step = read_step(STEP_PATH)
+    read_s = time.perf_counter() - t0
+
+    units = ",".join(step.length_units)
+    rows = [
+        {
+            "check": "length_unit",
+            "item": units or "none",
+            "solids": "",
+            "extents_mm": "",
+            "max_extent_mm": "",
+            "limit_mm": "",
+            "limit_source": "meta.units",
+            "pass": step.length_units == [LENGTH_UNIT],
+        }
+    ]
+
+    link = params.femur_link_mm
+    for body in bodies:
+        product = step.product(body)
+        extents = product.box.extents if product else (0.0, 0.0, 0.0)
+        solids = product.solids if product else 0
+        rows.append(
+            {
+                "check": "body_extent",
+                "item": body,
+                "solids": solids,
+                "extents_mm": _fmt_extents(extents),
+                "max_extent_mm": round(max(extents), 3),
+                "limit_mm": link,
+                "limit_source": "femur.link_length_mm",
+                "pass": bool(solids >= 1 and min(extents) > 0.0 and max(extents) <= link),
+            }
+        )
+
+    reach = params.femur_link_mm + params.tibia_stroke_mm + params.foot_radius_mm
+    extents = step.box.extents
+    rows.append(
+        {
+            "check": "module_envelope",
+            "item": ",".join(step.roots),
+            "solids": sum(p.solids for p in step.products),
+            "extents_mm": _fmt_extents(extents),
+            "max_extent_mm": round(max(extents), 3),
+            "limit_mm": reach,
+            "limit_source": "femur.link_length_mm + tibia_screw.stroke_mm + foot.radius_mm",
+            "pass": bool(not step.box.empty and max(extents) <= reach),
+        }
+    )
+
+    passed = sum(bool(r["pass"]) for r in rows)
+    status = "pass" if passed == len(rows) else "fail"
+    lines = [
+        "# STEP Export Geometry Check",
+        "",
+        f"- file: {STEP_PATH.relative_to(ROOT).as_posix()}",
+        f"- schema: {', '.join(step.schema)}",
+        f"- entities: {step.entities}",
+        f"- products: {len(step.products)} (roots: {', '.join(step.roots)})",
+        f"- checks: {len(rows)}",
+        f"- passed: {passed}",
+        f"- status: **{status.upper()}**",
+        "",
+        "| check | item | solids | extents_mm | max_extent_mm | limit_mm | pass |",
+        "|---|---|---:|---|---:|---:|---:|",
+    ]
+    for r in rows:
+        lines.append(
+            f"| {r['check']} | {r['item']} | {r['solids']} | {r['extents_mm']} | {r['max_extent_mm']} | "
+            f"{r['limit_mm']} | {int(bool(r['pass']))} |"
+        )
+    return HarnessReport(
+        "step_geometry",
+        rows,
+        lines,
+        fieldnames=FIELDNAMES,
+        log_lines=[f"READ_S={read_s:.4f} ENTITIES={step.entities}", f"STATUS={status}"],
+    )
+
+
+def main() -> None:
+    main_for(report())
+
+
+if __name__ == "__main__":
+    main()
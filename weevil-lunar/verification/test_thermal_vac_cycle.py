@@ -1,11 +1,36 @@
 #!/usr/bin/env python3
-"""Thermal-vac cycle placeholder harness (v0.1 model-based)."""
+"""Thermal-vac cycle harness.
+
+Rows come from the lumped-node thermal network (`models/thermal_network.py`)
+run for an ensemble of ENSEMBLE_MEMBERS parameter sets: one row per
+thermal-vac chamber cycle (LN2 shroud, solar-equivalent lamps half of each
+cycle) and one for a full lunar day/night. Each row carries the ensemble
+envelope of the warm electronics core; a shutdown is a member whose core
+left CORE_OPERATING_C during the cycle. The lunar row also bounds the night
+survival-heater energy by `power.night_survival_load_Wh`.
+"""
 
 from __future__ import annotations
 
-import csv
+import sys
 from dataclasses import dataclass
-from pathlib import Path
+
+import numpy as np
+
+from report_io import ROOT, HarnessReport, main_for
+
+sys.path.append(str(ROOT))
+
+from models.energy_budget import load_power_params
+from models.thermal_network import KELVIN, chamber_cycles, load_thermal_params, lunar_cycle, sample_ensemble, simulate
+
+ENSEMBLE_MEMBERS = 256
+CHAMBER_CYCLES = 3
+CORE_OPERATING_C = (-40.0, 60.0)
+FIELDNAMES = [
+    "cycle_id", "profile", "members", "min_temp_c", "max_temp_c", "thermal_shutdowns",
+    "heater_night_wh_max", "heater_budget_wh", "pass",
+]
 
 
 @dataclass
@@ -14,20 +39,43 @@ class ThermalRun:
     min_temp_c: float
     max_temp_c: float
     thermal_shutdowns: int
+    profile: str = "chamber"
+    heater_night_wh: float = 0.0
+    heater_budget_wh: float | None = None
 
 
 def evaluate(run: ThermalRun) -> bool:
-    # initial envelope placeholder
     in_band = (run.min_temp_c >= -120.0) and (run.max_temp_c <= 80.0)
-    return in_band and (run.thermal_shutdowns == 0)
+    heater_ok = run.heater_budget_wh is None or run.heater_night_wh <= run.heater_budget_wh
+    return in_band and (run.thermal_shutdowns == 0) and heater_ok
 
 
-def main() -> None:
-    runs = [
-        ThermalRun(1, -85.0, 62.0, 0),
-        ThermalRun(2, -92.0, 71.0, 0),
-        ThermalRun(3, -101.0, 76.0, 0),
-    ]
+def _core_run(cycle_id: int, profile: str, core_c: np.ndarray, **extra) -> ThermalRun:
+    lo, hi = CORE_OPERATING_C
+    shutdowns = int(np.count_nonzero((core_c.min(axis=0) < lo) | (core_c.max(axis=0) > hi)))
+    return ThermalRun(cycle_id, round(float(core_c.min()), 2), round(float(core_c.max()), 2), shutdowns, profile, **extra)
+
+
+def simulated_runs() -> list[ThermalRun]:
+    ensemble = sample_ensemble(ENSEMBLE_MEMBERS, load_thermal_params())
+    chamber = chamber_cycles(CHAMBER_CYCLES)
+    res = simulate(chamber, ensemble, ENSEMBLE_MEMBERS)
+    core_c = res.core_k.astype(np.float64) - KELVIN
+    runs = [_core_run(k + 1, "chamber", core_c[chamber.cycle == k]) for k in range(CHAMBER_CYCLES)]
+
+    res = simulate(lunar_cycle(), ensemble, ENSEMBLE_MEMBERS)
+    runs.append(
+        _core_run(
+            1, "lunar_cycle", res.core_k.astype(np.float64) - KELVIN,
+            heater_night_wh=round(float(res.heater_night_wh.max()), 2),
+            heater_budget_wh=load_power_params().night_survival_load_wh,
+        )
+    )
+    return runs
+
+
+def report() -> HarnessReport:
+    runs = simulated_runs()
 
     out_rows = []
     passes = 0
@@ -37,38 +85,43 @@ def main() -> None:
         out_rows.append(
             {
                 "cycle_id": r.cycle_id,
+                "profile": r.profile,
+                "members": ENSEMBLE_MEMBERS,
                 "min_temp_c": r.min_temp_c,
                 "max_temp_c": r.max_temp_c,
                 "thermal_shutdowns": r.thermal_shutdowns,
+                "heater_night_wh_max": r.heater_night_wh,
+                "heater_budget_wh": "" if r.heater_budget_wh is None else r.heater_budget_wh,
                 "pass": ok,
             }
         )
 
-    report_dir = Path("verification/reports")
-    report_dir.mkdir(parents=True, exist_ok=True)
-    csv_path = report_dir / "thermal_vac_cycle.csv"
-    md_path = report_dir / "thermal_vac_cycle.md"
-
-    with csv_path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=list(out_rows[0].keys()))
-        w.writeheader()
-        w.writerows(out_rows)
-
     summary = "pass" if passes == len(runs) else "fail"
+    lo, hi = CORE_OPERATING_C
     md_lines = [
-        "# Thermal-Vac Cycle Test (v0.1)",
+        "# Thermal-Vac Cycle Test (v0.2)",
         "",
-        "Model-based placeholder pending chamber campaign.",
+        f"Lumped-node thermal network, {ENSEMBLE_MEMBERS}-member parameter ensemble "
+        f"(`models/thermal_network.py`); core envelope per cycle, operating band {lo:.0f}..{hi:.0f} C.",
         "",
         f"- total: {len(runs)}",
         f"- passed: {passes}",
         f"- status: **{summary.upper()}**",
+        "",
+        "| profile | cycle | core min C | core max C | shutdowns | night heater Wh (max) | pass |",
+        "|---|---:|---:|---:|---:|---:|---:|",
     ]
-    md_path.write_text("\n".join(md_lines) + "\n", encoding="utf-8")
+    for r in runs:
+        heater = f"{r.heater_night_wh:.1f} / {r.heater_budget_wh:.0f}" if r.heater_budget_wh is not None else "-"
+        md_lines.append(
+            f"| {r.profile} | {r.cycle_id} | {r.min_temp_c:.1f} | {r.max_temp_c:.1f} | {r.thermal_shutdowns} "
+            f"| {heater} | {int(evaluate(r))} |"
+        )
+    return HarnessReport("thermal_vac_cycle", out_rows, md_lines, fieldnames=FIELDNAMES, log_lines=[f"STATUS={summary}"])
 
-    print(f"Wrote {csv_path}")
-    print(f"Wrote {md_path}")
-    print(f"STATUS={summary}")
+
+def main() -> None:
+    main_for(report())
 
 
 if __name__ == "__main__":
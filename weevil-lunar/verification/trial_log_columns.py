@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Column rules of the bench trial-log CSV, compiled from its YAML schema.
+
+Stdlib-only (no numpy), so CI helpers such as
+`scripts/generate_test_csv_template.py` can list the template columns without
+the validator's dependencies. `trial_log_schema.py` checks logs against these
+rules.
+"""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "cad" / "scripts"))
+
+from simple_yaml import load_yaml_text  # type: ignore
+
+SCHEMA = ROOT / "verification" / "data_schema" / "bench_test_data_v0.yaml"
+TYPES = {"string", "float", "integer", "bool", "timestamp"}
+
+
+@dataclass(frozen=True)
+class ColumnRule:
+    name: str
+    type: str
+    required: bool
+    min: float | None = None
+    max: float | None = None
+    enum: tuple[str, ...] | None = None
+
+
+def _rule(name: str, spec: Any) -> ColumnRule:
+    if isinstance(spec, dict):
+        kind = spec.get("type")
+        enum = spec.get("enum")
+        rule = ColumnRule(
+            name,
+            kind,
+            bool(spec.get("required", True)),
+            spec.get("min"),
+            spec.get("max"),
+            tuple(str(v) for v in enum) if enum is not None else None,
+        )
+    else:
+        rule = ColumnRule(name, str(spec), required=False)
+    if rule.type not in TYPES:
+        raise ValueError(f"schema column {name}: unknown type {rule.type!r}")
+    return rule
+
+
+def _leaves(section: dict[str, Any]) -> list[tuple[str, Any]]:
+    out: list[tuple[str, Any]] = []
+    for key, spec in section.items():
+        if isinstance(spec, dict) and "type" not in spec:
+            out.extend(_leaves(spec))
+        else:
+            out.append((key, spec))
+    return out
+
+
+def compile_schema(path: Path = SCHEMA) -> list[ColumnRule]:
+    """Ordered column rules of the trial-log CSV described by ``path``."""
+    schema = load_yaml_text(path.read_text(encoding="utf-8"))
+    specs: list[tuple[str, Any]] = []
+    for section in ("run_meta", "trial_params", "per_phase_metrics"):
+        specs.extend(_leaves(schema.get(section, {})))
+    if "notes" in schema:
+        specs.append(("notes", schema["notes"]))
+    rules = [_rule(name, spec) for name, spec in specs]
+    names = [r.name for r in rules]
+    if len(set(names)) != len(names):
+        raise ValueError(f"{path}: duplicate column names in schema")
+    return rules
+
+
+def template_columns(path: Path = SCHEMA) -> list[str]:
+    return [r.name for r in compile_schema(path)]
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""Schema-compiled, column-wise validator for bench trial logs.
+
+`compile_schema()` (`trial_log_columns.py`, stdlib-only) turns
+`verification/data_schema/bench_test_data_v0.yaml` into an ordered list of
+`ColumnRule`s (run_meta, trial_params, per-phase metric leaves, notes).
+`validate_csv()` loads a whole trial log, transposes it and checks each column
+with numpy in one pass: type conversion, min/max, enum membership,
+required/blank. Conversion is attempted on the whole column
+first; only a column that fails falls back to locating the offending cells, so
+clean campaign logs never take a per-row Python path.
+
+Every violation is reported with the 1-based file line its record starts on
+(header = line 1), taken from the csv reader so quoted multi-line notes count.
+
+    python verification/trial_log_schema.py verification/templates/minimal_hardware_trials.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import gc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from trial_log_columns import SCHEMA, ColumnRule, compile_schema, template_columns  # noqa: F401
+
+BOOL_VALUES = ["True", "False", "true", "false", "1", "0"]
+
+
+@dataclass(frozen=True)
+class Violation:
+    line: int  # 1-based file line; 0 = whole file
+    column: str
+    value: str
+    message: str
+
+
+def _bad_cells(values: np.ndarray, convert: Any) -> np.ndarray:
+    """Indices in ``values`` that ``convert`` rejects (slow path, failing columns only)."""
+    bad = []
+    for i, v in enumerate(values):
+        try:
+            convert(v)
+        except ValueError:
+            bad.append(i)
+    return np.asarray(bad, dtype=np.int64)
+
+
+def _to_float(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """(parsed floats with NaN at unparseable cells, unparseable indices)."""
+    try:
+        return values.astype(np.float64), np.empty(0, dtype=np.int64)
+    except ValueError:
+        bad = _bad_cells(values, float)
+        cleaned = values.copy()
+        cleaned[bad] = "nan"
+        return cleaned.astype(np.float64), bad
+
+
+def check_column(rule: ColumnRule, values: np.ndarray) -> list[tuple[int, str]]:
+    """(row index, message) pairs for every violation of ``rule`` in ``values`` (str array)."""
+    out: list[tuple[int, str]] = []
+    blank = np.char.str_len(np.char.strip(values)) == 0
+    if rule.required:
+        out += [(int(i), "required value is blank") for i in np.flatnonzero(blank)]
+    idx = np.flatnonzero(~blank)
+    vals = values[idx]
+    if not vals.size or rule.type == "string" and rule.enum is None:
+        return out
+
+    if rule.type in ("float", "integer"):
+        num, bad = _to_float(vals)
+        out += [(int(idx[i]), f"not a number (expected {rule.type})") for i in bad]
+        finite = np.isfinite(num)
+        nonfinite = np.setdiff1d(np.flatnonzero(~finite), bad)
+        out += [(int(idx[i]), "not finite") for i in nonfinite]
+        if rule.type == "integer":
+            out += [(int(idx[i]), "not an integer") for i in np.flatnonzero(finite & (num != np.round(num)))]
+        if rule.min is not None:
+            out += [(int(idx[i]), f"below min {rule.min}") for i in np.flatnonzero(finite & (num < rule.min))]
+        if rule.max is not None:
+            out += [(int(idx[i]), f"above max {rule.max}") for i in np.flatnonzero(finite & (num > rule.max))]
+    elif rule.type == "bool":
+        out += [(int(idx[i]), "not a bool") for i in np.flatnonzero(~np.isin(vals, BOOL_VALUES))]
+    elif rule.type == "timestamp":
+        utc = np.char.endswith(vals, "Z")
+        out += [(int(idx[i]), "timestamp must be ISO-8601 UTC ending in 'Z'") for i in np.flatnonzero(~utc)]
+        stamps = np.array([v[:-1] for v in vals[utc]]) if utc.any() else np.empty(0, dtype=str)
+        try:
+            stamps.astype("datetime64[s]")
+        except ValueError:
+            for i in _bad_cells(stamps, lambda v: np.datetime64(v, "s")):
+                out.append((int(idx[np.flatnonzero(utc)[i]]), "not an ISO-8601 timestamp"))
+
+    if rule.enum is not None:
+        out += [(int(idx[i]), f"not in {list(rule.enum)}") for i in np.flatnonzero(~np.isin(vals, rule.enum))]
+    return out
+
+
+def validate_rows(
+    header: list[str], rows: list[list[str]], rules: list[ColumnRule], lines: list[int] | None = None
+) -> list[Violation]:
+    """Violations of ``rules``; ``lines`` holds each row's first file line (default: one line per row)."""
+    if lines is None:
+        lines = list(range(2, len(rows) + 2))
+    violations: list[Violation] = []
+    expected = [r.name for r in rules]
+    missing = [c for c in expected if c not in header]
+    extra = [c for c in header if c not in expected]
+    for c in missing:
+        violations.append(Violation(1, c, "", "missing column"))
+    for c in extra:
+        violations.append(Violation(1, c, "", "unknown column"))
+    if not missing and not extra and header != expected:
+        violations.append(Violation(1, "", ",".join(header), "column order differs from the schema"))
+
+    width = len(header)
+    ragged = [i for i, r in enumerate(rows) if len(r) != width]
+    for i in ragged:
+        violations.append(Violation(lines[i], "", str(len(rows[i])), f"row has {len(rows[i])} fields, header has {width}"))
+    if ragged:
+        ragged_set = set(ragged)
+        kept = [i for i in range(len(rows)) if i not in ragged_set]
+        rows = [rows[i] for i in kept]
+    else:
+        kept = list(range(len(rows)))
+    if not rows:
+        return violations
+
+    columns = list(zip(*rows))
+    line_of = np.asarray(lines, dtype=np.int64)[np.asarray(kept, dtype=np.int64)]
+    by_name = {r.name: r for r in rules}
+    for col, name in enumerate(header):
+        rule = by_name.get(name)
+        if rule is None:
+            continue
+        values = np.array(columns[col], dtype=str)
+        for i, msg in check_column(rule, values):
+            violations.append(Violation(int(line_of[i]), name, str(values[i]), msg))
+    violations.sort(key=lambda v: (v.line, header.index(v.column) if v.column in header else -1))
+    return violations
+
+
+def validate_csv(path: Path, rules: list[ColumnRule] | None = None) -> tuple[int, list[Violation]]:
+    """(data rows, violations) for the trial log at ``path``."""
+    rules = rules if rules is not None else compile_schema()
+    # Millions of short-lived cell strings; cyclic GC passes over them dominate otherwise.
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        with path.open("r", encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return 0, [Violation(0, "", "", "empty file")]
+            rows: list[list[str]] = []
+            lines: list[int] = []
+            start = reader.line_num + 1
+            for row in reader:
+                rows.append(row)
+                lines.append(start)
+                start = reader.line_num + 1
+        return len(rows), validate_rows(header, rows, rules, lines)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("paths", nargs="+", help="trial-log CSVs")
+    ap.add_argument("--schema", default=str(SCHEMA))
+    ap.add_argument("--max-print", type=int, default=50, help="violations printed per file (all are counted)")
+    args = ap.parse_args()
+
+    rules = compile_schema(Path(args.schema))
+    failed = 0
+    for p in args.paths:
+        n_rows, violations = validate_csv(Path(p), rules)
+        for v in violations[: args.max_print]:
+            print(f"{p}:{v.line}: {v.column or '-'}: {v.message}" + (f" ({v.value!r})" if v.value else ""))
+        if len(violations) > args.max_print:
+            print(f"{p}: ... {len(violations) - args.max_print} more")
+        print(f"{p}: {n_rows} rows, {len(violations)} violations")
+        failed += bool(violations)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Content-hash cache for verification harness reports.
+
+A harness's inputs are its own source, `cad/weevil_leg_params.yaml`, every
+repo-local module it imports (followed transitively) and any extra paths it
+lists in a module-level `CACHE_INPUTS`. Their sha256 digests are folded into
+one input hash; a cached `HarnessReport` is reused only when that hash matches.
+Harnesses whose result depends on wall-clock time set `CACHEABLE = False`.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+from dataclasses import asdict
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from report_io import ROOT, HarnessReport
+
+VERIFICATION_DIR = ROOT / "verification"
+PARAMS_PATH = ROOT / "cad" / "weevil_leg_params.yaml"
+CACHE_PATH = VERIFICATION_DIR / ".cache" / "harness_cache.json"
+CACHE_VERSION = "1"
+
+# Roots searched (in order) when resolving `import x` / `from x.y import z`,
+# mirroring the sys.path entries the harnesses and models append.
+IMPORT_ROOTS = [
+    VERIFICATION_DIR,
+    ROOT,
+    ROOT / "cad" / "scripts",
+    ROOT.parent / "results" / "GPT" / "Robotics",
+]
+
+
+def file_sha256(path: Path) -> str:
+    if not path.exists():
+        return "missing"
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def rel(path: Path) -> str:
+    try:
+        return path.resolve().relative_to(ROOT.parent).as_posix()
+    except ValueError:
+        return path.resolve().as_posix()
+
+
+def resolve_module(dotted: str) -> list[Path]:
+    """Repo-local files backing ``dotted`` (package __init__ files included)."""
+    parts = dotted.split(".")
+    for base in IMPORT_ROOTS:
+        found: list[Path] = []
+        cur = base
+        for i, part in enumerate(parts):
+            pkg_init = cur / part / "__init__.py"
+            mod_file = cur / f"{part}.py"
+            if i == len(parts) - 1 and mod_file.is_file():
+                found.append(mod_file)
+                return found
+            if pkg_init.is_file():
+                found.append(pkg_init)
+                cur = cur / part
+                continue
+            break
+        else:
+            return found
+    return []
+
+
+def imported_names(path: Path) -> set[str]:
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    names: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(a.name for a in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            names.add(node.module)
+            # `from models import axis_sensitivity` imports a submodule.
+            names.update(f"{node.module}.{a.name}" for a in node.names)
+    return names
+
+
+def local_closure(entry: Path) -> list[Path]:
+    """Entry file plus every repo-local module it (transitively) imports."""
+    seen: dict[Path, None] = {}
+    stack = [entry.resolve()]
+    while stack:
+        path = stack.pop()
+        if path in seen:
+            continue
+        seen[path] = None
+        for name in sorted(imported_names(path)):
+            for dep in resolve_module(name):
+                if dep.resolve() not in seen:
+                    stack.append(dep.resolve())
+    return sorted(seen)
+
+
+def harness_inputs(module: ModuleType) -> list[Path]:
+    source = Path(module.__file__).resolve()
+    extra = [ROOT / p for p in getattr(module, "CACHE_INPUTS", [])]
+    return sorted(set(local_closure(source)) | {PARAMS_PATH.resolve()} | {p.resolve() for p in extra})
+
+
+def input_digests(module: ModuleType) -> dict[str, str]:
+    return {rel(p): file_sha256(p) for p in harness_inputs(module)}
+
+
+def input_hash(digests: dict[str, str]) -> str:
+    h = hashlib.sha256(f"cache-v{CACHE_VERSION}\n".encode())
+    for path, digest in sorted(digests.items()):
+        h.update(f"{path}\0{digest}\n".encode())
+    return h.hexdigest()
+
+
+def is_cacheable(module: ModuleType) -> bool:
+    return bool(getattr(module, "CACHEABLE", True))
+
+
+class ReportCache:
+    def __init__(self, path: Path = CACHE_PATH):
+        self.path = path
+        self.entries: dict[str, dict[str, Any]] = {}
+        if path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except json.JSONDecodeError:
+                data = {}
+            if data.get("version") == CACHE_VERSION:
+                self.entries = data.get("entries", {})
+
+    def get(self, module_name: str, digest: str) -> HarnessReport | None:
+        entry = self.entries.get(module_name)
+        if entry is None or entry.get("input_hash") != digest:
+            return None
+        return HarnessReport(**entry["report"])
+
+    def put(self, module_name: str, digest: str, inputs: dict[str, str], report: HarnessReport) -> None:
+        self.entries[module_name] = {"input_hash": digest, "inputs": inputs, "report": asdict(report)}
+
+    def prune(self, keep: set[str]) -> None:
+        for name in set(self.entries) - keep:
+            del self.entries[name]
+
+    @staticmethod
+    def _json_default(value: Any) -> Any:
+        """numpy scalars (np.float64, np.bool_, ...) in report rows become Python scalars."""
+        if hasattr(value, "item"):
+            return value.item()
+        raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"version": CACHE_VERSION, "entries": self.entries}
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload, sort_keys=True, default=self._json_default) + "\n", encoding="utf-8")
+        tmp.replace(self.path)
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""Memory-mapped binary store for raw bench trial waveforms.
+
+Layout of a store directory:
+- `waveforms.f32`: all trials back to back as little-endian float32 rows of
+  CHANNELS (t_s, z_mm, f_z_N, twist_deg, x_mm, f_t_N)
+- `index.npy`: structured array, one record per trial (INDEX_DTYPE, string
+  fields widened to the longest value): the template key columns plus the row
+  offset/length into `waveforms.f32`
+- `manifest.csv`: the full manifest rows (timestamps, pull rate, notes), same order
+- `meta.json`: format version and channel names
+
+The writer fills `*.partial` files and publishes them (`meta.json` last) only
+when closed without an error, so a failed build leaves no valid-looking store.
+
+Readers memory-map both files: `trial()` returns a zero-copy (n, 6) view and
+`select()` filters the index with vectorized comparisons, so a query over a
+full campaign touches only the index and the selected trials' pages.
+
+Build a store from a raw CSV log + manifest (streamed, constant memory):
+    python verification/waveform_store.py build --manifest m.csv --raw raw.csv
+    python verification/waveform_store.py query --strategy S1 --preload 0.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+
+from bench_ingest import BLOCK_BYTES, iter_raw_blocks, read_manifest
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_STORE = ROOT / "verification" / "bench_data" / "waveforms"
+
+FORMAT_VERSION = 1
+CHANNELS = ("t_s", "z_mm", "f_z_N", "twist_deg", "x_mm", "f_t_N")
+SAMPLE_DTYPE = np.dtype("<f4")
+INDEX_DTYPE = np.dtype(
+    [
+        ("run_id", "U48"),
+        ("soil_type", "U24"),
+        ("strategy", "U8"),
+        ("cleat_variant", "U24"),
+        ("preload_N", "<f8"),
+        ("cycle_num", "<i4"),
+        ("sample_rate_hz", "<f8"),
+        ("offset", "<i8"),
+        ("n_samples", "<i8"),
+    ]
+)
+KEY_FIELDS = ("run_id", "soil_type", "strategy", "cleat_variant", "preload_N", "cycle_num")
+PARTIAL = ".partial"
+
+
+def index_dtype(records: list[tuple]) -> np.dtype:
+    """INDEX_DTYPE with each string field widened to its longest value (never truncated)."""
+    spec = []
+    for k, name in enumerate(INDEX_DTYPE.names):
+        dt = INDEX_DTYPE.fields[name][0]
+        if dt.kind == "U":
+            width = max((len(r[k]) for r in records), default=0)
+            dt = np.dtype(f"U{max(dt.itemsize // 4, width)}")
+        spec.append((name, dt))
+    return np.dtype(spec)
+
+
+class WaveformStoreWriter:
+    """Append trials to a new store; the store is published on `close()`, dropped on `abort()`."""
+
+    def __init__(self, path: Path = DEFAULT_STORE) -> None:
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._data = (self.path / f"waveforms.f32{PARTIAL}").open("wb")
+        self._records: list[tuple] = []
+        self._manifest: list[dict[str, str]] = []
+        self._rows = 0
+        self._open: dict[str, str] | None = None
+        self._open_offset = 0
+
+    def begin_trial(self, meta: dict[str, str]) -> None:
+        self._end_trial()
+        self._open, self._open_offset = meta, self._rows
+
+    def append(self, samples: np.ndarray) -> None:
+        """Append (n, 6) samples to the open trial."""
+        if self._open is None:
+            raise ValueError("append() before begin_trial()")
+        if samples.ndim != 2 or samples.shape[1] != len(CHANNELS):
+            raise ValueError(f"samples must be (n, {len(CHANNELS)}), got {samples.shape}")
+        self._data.write(np.ascontiguousarray(samples, dtype=SAMPLE_DTYPE).tobytes())
+        self._rows += samples.shape[0]
+
+    def add_trial(self, meta: dict[str, str], samples: np.ndarray) -> None:
+        self.begin_trial(meta)
+        self.append(samples)
+
+    def _end_trial(self) -> None:
+        if self._open is None:
+            return
+        m = self._open
+        self._manifest.append(m)
+        self._records.append(
+            (
+                m["run_id"],
+                m["soil_type"],
+                m["strategy"],
+                m.get("cleat_variant", ""),
+                float(m["preload_N"]),
+                int(m["cycle_num"]),
+                float(m.get("sample_rate_hz") or "nan"),
+                self._open_offset,
+                self._rows - self._open_offset,
+            )
+        )
+        self._open = None
+
+    def close(self) -> Path:
+        self._end_trial()
+        self._data.close()
+        records = np.array(self._records, dtype=index_dtype(self._records))
+        with (self.path / f"index.npy{PARTIAL}").open("wb") as f:
+            np.save(f, records, allow_pickle=False)
+        fields = list(dict.fromkeys(k for m in self._manifest for k in m))
+        with (self.path / f"manifest.csv{PARTIAL}").open("w", encoding="utf-8", newline="") as f:
+            w = csv.DictWriter(f, fieldnames=fields, lineterminator="\n")
+            w.writeheader()
+            w.writerows(self._manifest)
+        meta = {"format_version": FORMAT_VERSION, "channels": list(CHANNELS), "dtype": SAMPLE_DTYPE.str,
+                "trials": len(self._records), "samples": self._rows}
+        (self.path / f"meta.json{PARTIAL}").write_text(json.dumps(meta, indent=2) + "\n", encoding="utf-8")
+        # Readers open meta.json first: drop it while the data files are swapped.
+        (self.path / "meta.json").unlink(missing_ok=True)
+        for name in ("waveforms.f32", "index.npy", "manifest.csv", "meta.json"):
+            os.replace(self.path / f"{name}{PARTIAL}", self.path / name)
+        return self.path
+
+    def abort(self) -> None:
+        """Discard everything written so far; an existing store in the directory is left as it was."""
+        self._data.close()
+        for p in self.path.glob(f"*{PARTIAL}"):
+            p.unlink()
+
+    def __enter__(self) -> "WaveformStoreWriter":
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *exc: object) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class WaveformStore:
+    """Read-only, memory-mapped view of a store directory."""
+
+    def __init__(self, path: Path = DEFAULT_STORE) -> None:
+        self.path = Path(path)
+        meta = json.loads((self.path / "meta.json").read_text(encoding="utf-8"))
+        if meta.get("format_version") != FORMAT_VERSION or tuple(meta.get("channels", ())) != CHANNELS:
+            raise ValueError(f"{self.path}: unsupported waveform store format {meta}")
+        self.index = np.load(self.path / "index.npy", mmap_mode="r", allow_pickle=False)
+        data_path = self.path / "waveforms.f32"
+        if meta["samples"]:
+            self.data = np.memmap(data_path, dtype=SAMPLE_DTYPE, mode="r", shape=(meta["samples"], len(CHANNELS)))
+        else:
+            self.data = np.empty((0, len(CHANNELS)), dtype=SAMPLE_DTYPE)
+
+    def __len__(self) -> int:
+        return int(self.index.shape[0])
+
+    def trial(self, i: int) -> np.ndarray:
+        """Zero-copy (n, 6) float32 view of trial ``i``."""
+        rec = self.index[i]
+        start = int(rec["offset"])
+        return self.data[start: start + int(rec["n_samples"])]
+
+    def channel(self, i: int, name: str) -> np.ndarray:
+        return self.trial(i)[:, CHANNELS.index(name)]
+
+    def find(self, run_id: str) -> int:
+        hits = np.flatnonzero(self.index["run_id"] == run_id)
+        if hits.size != 1:
+            raise KeyError(f"run_id {run_id!r}: {hits.size} matches")
+        return int(hits[0])
+
+    def select(self, **filters: object) -> np.ndarray:
+        """Trial indices matching every filter; a filter value may be a scalar or a collection.
+
+        Filters are KEY_FIELDS names (e.g. ``strategy="S1", preload_N=(0.1, 0.5)``).
+        """
+        mask = np.ones(len(self), dtype=bool)
+        for key, value in filters.items():
+            if key not in KEY_FIELDS:
+                raise KeyError(f"unknown filter {key!r}; expected one of {KEY_FIELDS}")
+            if value is None:
+                continue
+            col = self.index[key]
+            if isinstance(value, (list, tuple, set, np.ndarray)):
+                mask &= np.isin(col, list(value))  # no cast to col.dtype: it would truncate long values
+            else:
+                mask &= col == value
+        return np.flatnonzero(mask)
+
+    def iter_trials(self, indices: np.ndarray | None = None) -> Iterator[tuple[np.void, np.ndarray]]:
+        for i in range(len(self)) if indices is None else indices:
+            yield self.index[i], self.trial(int(i))
+
+
+def build_from_csv(manifest_path: Path, raw_path: Path, out: Path = DEFAULT_STORE,
+                   block_bytes: int = BLOCK_BYTES) -> Path:
+    """Convert a raw CSV log (bench_ingest format) into a store, streaming block by block."""
+    manifest = read_manifest(manifest_path)
+    current: int | None = None
+    seen: set[int] = set()
+    with WaveformStoreWriter(out) as w:
+        for block in iter_raw_blocks(raw_path, block_bytes):
+            trial_col = block[:, 0].astype(np.int64)
+            bounds = np.flatnonzero(np.diff(trial_col)) + 1
+            for seg in np.split(np.arange(block.shape[0]), bounds):
+                trial = int(trial_col[seg[0]])
+                if trial != current:
+                    if trial in seen:
+                        raise ValueError(f"{raw_path}: trial {trial} is not contiguous")
+                    if not 0 <= trial < len(manifest):
+                        raise ValueError(f"{raw_path}: trial {trial} has no manifest row")
+                    seen.add(trial)
+                    current = trial
+                    w.begin_trial(manifest[trial])
+                w.append(block[seg[0]: seg[-1] + 1, 1:])
+    return out
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    b = sub.add_parser("build", help="convert a raw CSV log + manifest into a store")
+    b.add_argument("--manifest", required=True)
+    b.add_argument("--raw", required=True)
+    b.add_argument("--store", default=str(DEFAULT_STORE))
+    q = sub.add_parser("query", help="list trials matching the filters")
+    q.add_argument("--store", default=str(DEFAULT_STORE))
+    q.add_argument("--soil", dest="soil_type", action="append")
+    q.add_argument("--strategy", action="append")
+    q.add_argument("--cleat", dest="cleat_variant", action="append")
+    q.add_argument("--preload", dest="preload_N", type=float, action="append")
+    q.add_argument("--cycle", dest="cycle_num", type=int, action="append")
+    args = ap.parse_args()
+
+    if args.cmd == "build":
+        path = build_from_csv(Path(args.manifest), Path(args.raw), Path(args.store))
+        store = WaveformStore(path)
+        size = (path / "waveforms.f32").stat().st_size
+        print(f"Wrote {path} ({len(store)} trials, {store.data.shape[0]} samples, {size / 1e6:.1f} MB)")
+        return 0
+
+    store = WaveformStore(Path(args.store))
+    hits = store.select(**{k: getattr(args, k) for k in ("soil_type", "strategy", "cleat_variant", "preload_N", "cycle_num")})
+    for i in hits:
+        rec = store.index[i]
+        print(f"{rec['run_id']:<32} {rec['soil_type']:<12} {rec['strategy']:<4} {rec['preload_N']:>6g} N "
+              f"cycle {rec['cycle_num']:>2}  {rec['n_samples']} samples")
+    print(f"{hits.size}/{len(store)} trials")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())